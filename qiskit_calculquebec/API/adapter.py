@@ -5,13 +5,29 @@ Provides the ``ApiAdapter`` singleton, which wraps every HTTP call required
 to communicate with the Thunderhead job scheduler.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 from qiskit_calculquebec.API.api_utility import ApiUtility, routes, keys, queries
-import requests
 import json
 from qiskit_calculquebec.API.client import ApiClient
 from datetime import datetime, timedelta
 from qiskit_calculquebec.API.retry_decorator import retry
 
+if TYPE_CHECKING:
+    import requests
+
+
+def _requests():
+    """Return the ``requests`` module, imported on first HTTP call.
+
+    ``requests`` (with urllib3 and charset_normalizer) is the largest import
+    of the package besides Qiskit; offline uses never need it.
+    """
+    import requests
+
+    return requests
+
 
 class ApiException(Exception):
     """Raised when an API call returns a non-200 HTTP status code.
@@ -88,6 +104,7 @@ class ApiAdapter(object):
     _machine = None
     _benchmark = None
     _last_update = None
+    _connectivity = None
 
     client: ApiClient
     headers: dict[str, str]
@@ -100,11 +117,12 @@ class ApiAdapter(object):
 
     @staticmethod
     def clean_cache():
-        """Clear all cached API responses (machine, benchmark, qubits/couplers)."""
+        """Clear all cached API responses (machine, benchmark, qubits/couplers, connectivity)."""
         ApiAdapter._qubits_and_couplers = None
         ApiAdapter._machine = None
         ApiAdapter._benchmark = None
         ApiAdapter._last_update = None
+        ApiAdapter._connectivity = None
 
     @classmethod
     def instance(cls) -> "ApiAdapter":
@@ -140,6 +158,7 @@ class ApiAdapter(object):
         cls._machine: dict = None
         cls._benchmark: dict = None
         cls._last_update: datetime = None
+        cls._connectivity: dict = None
 
     @staticmethod
     def is_last_update_expired() -> bool:
@@ -166,7 +185,7 @@ class ApiAdapter(object):
             NoProjectFoundException: If no project matches the given name.
             ApiException: If the HTTP request fails.
         """
-        res = requests.get(
+        res = _requests().get(
             ApiAdapter.instance().client.host
             + routes.PROJECTS
             + queries.NAME
@@ -180,9 +199,7 @@ class ApiAdapter(object):
 
         converted = json.loads(res.text)
         projects = converted.get(keys.ITEMS, [])
-        matching_projects = [
-            p for p in projects if p.get(keys.NAME) == project_name
-        ]
+        matching_projects = [p for p in projects if p.get(keys.NAME) == project_name]
 
         if len(matching_projects) > 1:
             raise MultipleProjectsException(matching_projects)
@@ -213,7 +230,7 @@ class ApiAdapter(object):
                 + "="
                 + machine_name
             )
-            res = requests.get(route, headers=ApiAdapter.instance().headers)
+            res = _requests().get(route, headers=ApiAdapter.instance().headers)
             if res.status_code != 200:
                 ApiAdapter.raise_exception(res)
             ApiAdapter._machine = json.loads(res.text)
@@ -238,11 +255,13 @@ class ApiAdapter(object):
 
     @staticmethod
     @retry(3)
-    def get_benchmark(machine_name: str) -> dict:
+    def get_benchmark(machine_name: str, force_refresh: bool = False) -> dict:
         """Fetch the latest benchmark for a machine, caching the result for 24 hours.
 
         Args:
             machine_name (str): Name of the machine.
+            force_refresh (bool): Fetch the benchmark even if the cached one
+                has not expired. Default: ``False``.
 
         Returns:
             dict: Full benchmark response from the API.
@@ -250,7 +269,11 @@ class ApiAdapter(object):
         Raises:
             ApiException: If the HTTP request fails.
         """
-        if ApiAdapter._benchmark is None or ApiAdapter.is_last_update_expired():
+        if (
+            force_refresh
+            or ApiAdapter._benchmark is None
+            or ApiAdapter.is_last_update_expired()
+        ):
             machine = ApiAdapter.get_machine_by_name(machine_name)
             machine_id = machine[keys.ITEMS][0][keys.ID]
 
@@ -261,7 +284,7 @@ class ApiAdapter(object):
                 + machine_id
                 + routes.BENCHMARKING
             )
-            res = requests.get(route, headers=ApiAdapter.instance().headers)
+            res = _requests().get(route, headers=ApiAdapter.instance().headers)
             if res.status_code != 200:
                 ApiAdapter.raise_exception(res)
             ApiAdapter._benchmark = json.loads(res.text)
@@ -290,7 +313,7 @@ class ApiAdapter(object):
         body = ApiUtility.job_body(
             circuit, circuit_name, project_id, machine_name, shot_count
         )
-        res = requests.post(
+        res = _requests().post(
             ApiAdapter.instance().client.host + routes.JOBS,
             data=json.dumps(body),
             headers=ApiAdapter.instance().headers,
@@ -299,6 +322,48 @@ class ApiAdapter(object):
             ApiAdapter.raise_exception(res)
         return res
 
+    @staticmethod
+    # Only HTTP errors: requests.RequestException is an OSError
+    @retry(3, retry_on=(ApiException, OSError))
+    def post_job_stream(circuit, shot_count: int = 1) -> requests.Response:
+        """Submit a new job, streaming the circuit conversion into the request.
+
+        The request body is produced by ``ApiUtility.iter_job_body`` and sent
+        with chunked transfer encoding, so conversion and upload overlap and
+        neither the operation list nor the JSON string is held in memory.
+        Intended for very deep circuits; see :meth:`post_job` otherwise.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to submit.
+            shot_count (int): Number of shots to execute. Default: 1.
+
+        Returns:
+            requests.Response: HTTP response from the ``POST /jobs`` endpoint.
+
+        Raises:
+            ApiException: If the HTTP request fails.
+            ValueError: If the circuit cannot be converted. Raised before
+                the request is opened, and not retried.
+        """
+        # The body is converted during the upload: check it can be first
+        ApiUtility.check_circuit(circuit)
+        client = ApiAdapter.instance().client
+        body = ApiUtility.iter_job_body(
+            circuit,
+            client.circuit_name,
+            client.project_id,
+            client.machine_name,
+            shot_count,
+        )
+        res = _requests().post(
+            client.host + routes.JOBS,
+            data=body,
+            headers=ApiAdapter.instance().headers,
+        )
+        if res.status_code != 200:
+            ApiAdapter.raise_exception(res)
+        return res
+
     @staticmethod
     @retry(3)
     def list_jobs() -> requests.Response:
@@ -310,7 +375,7 @@ class ApiAdapter(object):
         Raises:
             ApiException: If the HTTP request fails.
         """
-        res = requests.get(
+        res = _requests().get(
             ApiAdapter.instance().client.host + routes.JOBS,
             headers=ApiAdapter.instance().headers,
         )
@@ -332,7 +397,7 @@ class ApiAdapter(object):
         Raises:
             ApiException: If the HTTP request fails.
         """
-        res = requests.get(
+        res = _requests().get(
             ApiAdapter.instance().client.host + routes.JOBS + f"/{id}",
             headers=ApiAdapter.instance().headers,
         )
@@ -340,6 +405,31 @@ class ApiAdapter(object):
             ApiAdapter.raise_exception(res)
         return res
 
+    @staticmethod
+    def cancel_job(id: str) -> requests.Response:
+        """Ask the scheduler to cancel a job.
+
+        Not retried: a refusal (job already finished, or cancellation not
+        supported by the server) is reported immediately.
+
+        Args:
+            id (str): Job ID to cancel.
+
+        Returns:
+            requests.Response: HTTP response from the
+                ``POST /jobs/{id}/cancel`` endpoint.
+
+        Raises:
+            ApiException: If the HTTP request fails.
+        """
+        res = _requests().post(
+            ApiAdapter.instance().client.host + routes.JOBS + f"/{id}" + routes.CANCEL,
+            headers=ApiAdapter.instance().headers,
+        )
+        if res.status_code != 200:
+            ApiAdapter.raise_exception(res)
+        return res
+
     @staticmethod
     @retry(3)
     def list_machines(online_only: bool = False) -> list[dict]:
@@ -355,7 +445,7 @@ class ApiAdapter(object):
         Raises:
             ApiException: If the HTTP request fails.
         """
-        res = requests.get(
+        res = _requests().get(
             ApiAdapter.instance().client.host + routes.MACHINES,
             headers=ApiAdapter.instance().headers,
         )
@@ -367,11 +457,20 @@ class ApiAdapter(object):
             if not online_only or m[keys.STATUS] == keys.ONLINE
         ]
 
-    def get_connectivity_for_machine(machine_name: str) -> dict:
+    @staticmethod
+    def get_connectivity_for_machine(
+        machine_name: str, force_refresh: bool = False
+    ) -> dict:
         """Return the coupler-to-qubit connectivity map for a machine.
 
+        The maps of every machine are cached from a single
+        :meth:`list_machines` call. The list is downloaded again only for
+        a machine missing from the cache, or when ``force_refresh`` is set.
+
         Args:
             machine_name (str): Name of the machine.
+            force_refresh (bool): Download the machine list even if the
+                machine is cached. Default: ``False``.
 
         Returns:
             dict: Coupler-to-qubit mapping describing hardware connectivity.
@@ -379,12 +478,21 @@ class ApiAdapter(object):
         Raises:
             ApiException: If no machine with the given name is found.
         """
-        machines = ApiAdapter.list_machines()
-        target = [m for m in machines if m[keys.NAME] == machine_name]
-        if len(target) < 1:
+        if (
+            force_refresh
+            or ApiAdapter._connectivity is None
+            or machine_name not in ApiAdapter._connectivity
+        ):
+            ApiAdapter._connectivity = {
+                m[keys.NAME]: m[keys.COUPLER_TO_QUBIT_MAP]
+                for m in ApiAdapter.list_machines()
+                if keys.COUPLER_TO_QUBIT_MAP in m
+            }
+
+        if machine_name not in ApiAdapter._connectivity:
             raise ApiException(404, f"No machine available with name {machine_name}")
 
-        return target[0][keys.COUPLER_TO_QUBIT_MAP]
+        return ApiAdapter._connectivity[machine_name]
 
     @staticmethod
     def raise_exception(res):
@@ -5,11 +5,20 @@ Provides circuit/instruction conversion, request header construction,
 and string constants used across the API layer.
 """
 
+from collections.abc import Iterator
+from itertools import repeat
 from qiskit import QuantumCircuit
 from qiskit.circuit import Gate
+import json
 import numpy as np
 from base64 import b64encode
 
+# Canonical JSON encoding: stable across runs, used for streaming and hashing
+_CANONICAL = {"sort_keys": True, "separators": (",", ":")}
+
+#: ``bitCount`` of every circuit payload: the size of the readout register.
+PAYLOAD_BIT_COUNT = 24
+
 
 class ApiUtility:
     """Static helper methods for building Thunderhead API payloads."""
@@ -79,17 +88,250 @@ class ApiUtility:
 
         Returns:
             dict: Thunderhead circuit dict with ``type``, ``bitCount``,
-                ``qubitCount``, and ``operations`` fields.
+                ``qubitCount``, and ``operations`` fields. The idle
+                operations expanded from one ``Delay`` are the same dict
+                object repeated.
         """
+        operations = []
+        for operation, count in ApiUtility.iter_runs(circuit):
+            if count == 1:
+                operations.append(operation)
+            else:
+                operations.extend([operation] * count)
         return {
             keys.TYPE: keys.CIRCUIT,
-            keys.BIT_COUNT: 24,
-            keys.OPERATIONS: [
-                ApiUtility.convert_instruction(op) for op in circuit.data
-            ],
+            keys.BIT_COUNT: PAYLOAD_BIT_COUNT,
+            keys.OPERATIONS: operations,
             keys.QUBIT_COUNT: len(circuit.qubits),
         }
 
+    @staticmethod
+    def bit_indices(circuit: QuantumCircuit, bits) -> dict:
+        """Map each bit of a circuit to its index on the wire.
+
+        The wire index is the bit's position in its register, as returned by
+        the private ``Bit._index`` used by :meth:`convert_instruction`; bits
+        that belong to no register use their position in the circuit.
+
+        Args:
+            circuit (QuantumCircuit): Circuit owning the bits.
+            bits (Iterable[Bit]): Bits to map (e.g. ``circuit.qubits``).
+
+        Returns:
+            dict: Bit → wire index.
+        """
+        table = {}
+        for bit in bits:
+            location = circuit.find_bit(bit)
+            table[bit] = (
+                location.registers[0][1] if location.registers else location.index
+            )
+        return table
+
+    @staticmethod
+    def iter_operations(circuit: QuantumCircuit) -> Iterator[dict]:
+        """Convert the instructions of a circuit to Thunderhead operations.
+
+        Fast path of :meth:`convert_instruction` for whole circuits: wire
+        indices are computed once per circuit, and each instruction is
+        dispatched through a precomputed opcode table that also validates
+        gate support. A ``Delay`` of *n* dt yields *n* identity operations.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to convert.
+
+        Yields:
+            dict: Thunderhead operation dict, identical to what
+                :meth:`convert_instruction` returns for the same instruction.
+
+        Raises:
+            ValueError: If an instruction is not in the supported gate set.
+        """
+        for operation, count in ApiUtility.iter_runs(circuit):
+            yield from repeat(operation, count)
+
+    @staticmethod
+    def iter_runs(circuit: QuantumCircuit) -> Iterator[tuple[dict, int]]:
+        """Convert a circuit to run-length encoded Thunderhead operations.
+
+        Same conversion as :meth:`iter_operations`, except that a ``Delay``
+        of *n* dt is yielded once with a count of *n* instead of as *n*
+        identity operations. Thunderhead has no repeat field, so callers
+        expand each run when serializing.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to convert.
+
+        Yields:
+            tuple[dict, int]: Operation dict and its number of consecutive
+                repetitions.
+
+        Raises:
+            ValueError: If an instruction is not in the supported gate set,
+                or a ``Delay`` is not expressed in ``dt``.
+        """
+        qubit_index = ApiUtility.bit_indices(circuit, circuit.qubits)
+        clbit_index = ApiUtility.bit_indices(circuit, circuit.clbits)
+        TYPE, QUBITS, BITS, PARAMETERS = (
+            keys.TYPE,
+            keys.QUBITS,
+            keys.BITS,
+            keys.PARAMETERS,
+        )
+
+        for instruction in circuit.data:
+            name = instruction.name
+            opcode = _OPCODES.get(name)
+            if opcode is None:
+                raise ValueError(f"Unsupported instruction: {name!r}")
+            kind, wire_type = opcode
+            qubits = instruction.qubits
+
+            if kind is _GATE:
+                if len(qubits) == 1:
+                    yield {QUBITS: [qubit_index[qubits[0]]], TYPE: wire_type}, 1
+                else:
+                    yield {
+                        TYPE: wire_type,
+                        QUBITS: [qubit_index[qubits[0]], qubit_index[qubits[1]]],
+                    }, 1
+            elif kind is _PARAMETRIC:
+                yield {
+                    TYPE: wire_type,
+                    QUBITS: [qubit_index[qubits[0]]],
+                    PARAMETERS: {"lambda": instruction.params[0]},
+                }, 1
+            elif kind is _READOUT:
+                yield {
+                    TYPE: wire_type,
+                    QUBITS: [qubit_index[qubits[0]]],
+                    BITS: [clbit_index[instruction.clbits[0]]],
+                }, 1
+            else:
+                count = _delay_cycles(instruction.operation)
+                if count > 0:
+                    yield {QUBITS: [qubit_index[qubits[0]]], TYPE: wire_type}, count
+
+    @staticmethod
+    def check_circuit(circuit: QuantumCircuit):
+        """Check that a circuit can be converted, without converting it.
+
+        Applies the checks of :meth:`iter_runs` up front, e.g. before a
+        streamed upload that would otherwise fail mid-request.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to check.
+
+        Raises:
+            ValueError: If an instruction is not in the supported gate set,
+                or a ``Delay`` is not expressed in ``dt``.
+        """
+        for instruction in circuit.data:
+            opcode = _OPCODES.get(instruction.name)
+            if opcode is None:
+                raise ValueError(f"Unsupported instruction: {instruction.name!r}")
+            if opcode[0] is _IDLE:
+                _delay_cycles(instruction.operation)
+
+    @staticmethod
+    def encode_circuit(circuit_dict: dict) -> str:
+        """Return the canonical JSON encoding of a Thunderhead circuit dictionary.
+
+        Keys are sorted and separators are compact, so the encoding of a
+        circuit is always the same string. :meth:`iter_circuit_json` yields
+        exactly this string in pieces.
+
+        Args:
+            circuit_dict (dict): Circuit as produced by :meth:`convert_circuit`.
+
+        Returns:
+            str: Canonical JSON encoding.
+        """
+        return json.dumps(circuit_dict, **_CANONICAL)
+
+    @staticmethod
+    def iter_circuit_json(circuit: QuantumCircuit) -> Iterator[str]:
+        """Convert a circuit to canonical JSON one operation at a time.
+
+        Equivalent to ``encode_circuit(convert_circuit(circuit))`` joined,
+        without ever holding the operation list or the full string in memory.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to convert. All instructions must
+                be in the supported gate set.
+
+        Yields:
+            str: Consecutive pieces of the canonical JSON encoding.
+
+        Raises:
+            ValueError: If an instruction is not in the supported gate set.
+        """
+        envelope = ApiUtility.encode_circuit(
+            {
+                keys.TYPE: keys.CIRCUIT,
+                keys.BIT_COUNT: PAYLOAD_BIT_COUNT,
+                keys.OPERATIONS: [],
+                keys.QUBIT_COUNT: len(circuit.qubits),
+            }
+        )
+        head, tail = envelope.split(f'"{keys.OPERATIONS}":[]')
+        yield head + f'"{keys.OPERATIONS}":['
+        separator = ""
+        for operation, count in ApiUtility.iter_runs(circuit):
+            encoded = json.dumps(operation, **_CANONICAL)
+            # Long idles are expanded in bounded blocks to keep memory flat
+            while count > 0:
+                block = min(count, _IDLE_BLOCK)
+                yield separator + ",".join([encoded] * block)
+                separator = ","
+                count -= block
+        yield "]" + tail
+
+    @staticmethod
+    def iter_job_body(
+        circuit: QuantumCircuit,
+        circuit_name: str,
+        project_id: str,
+        machine_name: str,
+        shots: int,
+        chunk_size: int = 1 << 16,
+    ) -> Iterator[bytes]:
+        """Stream the ``POST /jobs`` request body for a circuit.
+
+        Produces the canonical JSON encoding of :meth:`job_body`, converting
+        the circuit lazily with :meth:`iter_circuit_json`. Pieces are grouped
+        into chunks of about ``chunk_size`` bytes, suitable for a chunked
+        HTTP request body.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to submit.
+            circuit_name (str): Human-readable label for the circuit.
+            project_id (str): ID of the project under which the job will be billed.
+            machine_name (str): Target machine name (e.g. ``"yukon"``).
+            shots (int): Number of shots to execute.
+            chunk_size (int): Approximate size of each chunk in bytes.
+                Default: 64 KiB.
+
+        Yields:
+            bytes: Consecutive UTF-8 chunks of the request body.
+        """
+        envelope = json.dumps(
+            ApiUtility.job_body({}, circuit_name, project_id, machine_name, shots),
+            **_CANONICAL,
+        )
+        # "circuit" sorts first, so the first match is the key, not a user string
+        head, tail = envelope.split(f'"{keys.CIRCUIT}":{{}}', 1)
+
+        pending, size = [head, f'"{keys.CIRCUIT}":'], 0
+        for piece in ApiUtility.iter_circuit_json(circuit):
+            pending.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(pending).encode("utf-8")
+                pending, size = [], 0
+        pending.append(tail)
+        yield "".join(pending).encode("utf-8")
+
     @staticmethod
     def basic_auth(username: str, password: str) -> str:
         """Build a Basic Authentication header value.
@@ -159,6 +401,7 @@ class routes:
     PROJECTS = "/projects"
     MACHINES = "/machines"
     BENCHMARKING = "/benchmarking"
+    CANCEL = "/cancel"
 
 
 class queries:
@@ -216,3 +459,25 @@ instructions: dict[str, str] = {
 
 # Gate names that require a rotation angle parameter
 instructions_with_params: dict[str, str] = {"rz": "rz", "p": "p"}
+
+# Opcode table of ApiUtility.iter_operations: gate name -> (kind, wire type)
+_GATE, _PARAMETRIC, _READOUT, _IDLE = "gate", "parametric", "readout", "idle"
+_OPCODES: dict[str, tuple[str, str]] = {
+    **{name: (_GATE, wire) for name, wire in instructions.items()},
+    **{name: (_PARAMETRIC, wire) for name, wire in instructions_with_params.items()},
+    "measure": (_READOUT, "readout"),
+    "delay": (_IDLE, instructions["id"]),
+}
+
+# Maximum number of idle operations encoded in one streamed piece
+_IDLE_BLOCK = 4096
+
+
+def _delay_cycles(delay) -> int:
+    """Return the number of idle operations of a ``Delay`` expressed in dt."""
+    if delay.unit != "dt":
+        raise ValueError(
+            f"Delay must be expressed in dt, got {delay.unit!r}. "
+            "Transpile the circuit with the backend's pass manager."
+        )
+    return int(delay.duration)
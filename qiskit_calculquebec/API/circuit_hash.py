@@ -0,0 +1,334 @@
+"""
+Canonical structural fingerprints of circuits and Thunderhead payloads.
+
+A fingerprint only depends on what the hardware would execute: bits are
+identified by their position, register names are ignored (register sizes
+are kept, as they shape the result bitstrings), and angles are rounded to
+a tolerance so that values differing by floating-point noise hash the
+same. Operations that are not Qiskit standard instructions also hash their
+class, control state and (for custom gates) their definition, so that two
+custom gates sharing a name do not collide. Instructions are fed to a
+BLAKE2b digest one at a time, so hashing a deep circuit never builds an
+intermediate encoding of the whole circuit.
+
+``hash_circuit`` and ``hash_payload`` are separate namespaces: a circuit
+and its ``ApiUtility.convert_circuit`` payload do not hash the same.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.circuit import (
+    Barrier,
+    Clbit,
+    ClassicalRegister,
+    Delay,
+    Gate,
+    Instruction,
+    Measure,
+    Reset,
+)
+from qiskit_calculquebec.API.api_utility import keys
+
+#: Default angle tolerance, in radians.
+DEFAULT_TOLERANCE = 1e-9
+
+# Bytes fed to the digest at once when hashing runs of identical operations
+_RUN_BLOCK = 1 << 16
+
+# Instructions encoded before their text is fed to the digest
+_LINE_BLOCK = 4096
+
+
+# Non-gate standard instructions, identified by name alone
+_STANDARD_INSTRUCTIONS = (Measure, Reset, Barrier, Delay)
+
+
+def _normalize(value, tolerance: float) -> str:
+    """Return the canonical text of an instruction parameter."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if tolerance:
+            return str(round(value / tolerance))
+        return float(value).hex()
+    if isinstance(value, np.ndarray):
+        # Whole contents, unlike str(), which elides large arrays
+        if tolerance and value.dtype.kind in "fc":
+            # + 0.0 turns -0.0 into 0.0
+            value = np.round(value / tolerance) + 0.0
+        digest = hashlib.blake2b(
+            np.ascontiguousarray(value).tobytes(), digest_size=16
+        ).hexdigest()
+        return f"A{value.dtype.str}{value.shape}{digest}"
+    # ParameterExpression and anything else: symbolic text
+    return str(value)
+
+
+class CircuitHasher:
+    """Incremental structural hasher.
+
+    Args:
+        tolerance (float): Angles are rounded to multiples of this value
+            before hashing. ``0`` hashes exact values. Default: ``1e-9``.
+
+    Example:
+        .. code-block:: python
+
+            hasher = CircuitHasher(tolerance=1e-6)
+            hasher.update_circuit(qc)
+            key = hasher.hexdigest()
+    """
+
+    def __init__(self, tolerance: float = DEFAULT_TOLERANCE):
+        self.tolerance = tolerance
+        self._digest = hashlib.blake2b(digest_size=32)
+
+    def hexdigest(self) -> str:
+        """Return the hex digest of everything fed so far."""
+        return self._digest.hexdigest()
+
+    def update_circuit(self, circuit: QuantumCircuit):
+        """Feed a ``QuantumCircuit``.
+
+        Control-flow blocks are hashed recursively in place of their
+        parameters.
+
+        Args:
+            circuit (QuantumCircuit): Circuit to hash.
+        """
+        update = self._digest.update
+        tolerance = self.tolerance
+        qubit_index = {q: i for i, q in enumerate(circuit.qubits)}
+        clbit_index = {c: i for i, c in enumerate(circuit.clbits)}
+
+        update(
+            (
+                f"C{circuit.num_qubits},{circuit.num_clbits}"
+                f"|{','.join(str(r.size) for r in circuit.qregs)}"
+                f"|{','.join(str(r.size) for r in circuit.cregs)}"
+                f"|{_normalize(circuit.global_phase, tolerance)}\n"
+            ).encode()
+        )
+
+        # Lines are fed in blocks; lines of parameterless instructions and
+        # operation names are memoised by operation id, as deep circuits
+        # repeat the same few operations. ``names`` keeps the operations
+        # alive so that their ids are not reused.
+        lines = []
+        memo = {}
+        names = {}
+        for inst in circuit.data:
+            op = inst.operation
+            if not op.params and op.name != "delay":
+                key = (id(op), inst.qubits, inst.clbits)
+                line = memo.get(key)
+                if line is None:
+                    line = memo[key] = self._line(
+                        self._memo_name(op, names),
+                        inst,
+                        qubit_index,
+                        clbit_index,
+                        (),
+                    )
+                lines.append(line)
+            else:
+                params = []
+                for p in op.params:
+                    if isinstance(p, QuantumCircuit):
+                        if lines:
+                            update(("\n".join(lines) + "\n").encode())
+                            lines.clear()
+                        self.update_circuit(p)
+                        params.append("B")
+                    else:
+                        params.append(_normalize(p, tolerance))
+                if op.name == "delay":
+                    params.append(op.unit)
+                condition = getattr(op, "condition", None)
+                if condition is not None:
+                    params.append(self._condition(condition, clbit_index))
+                lines.append(
+                    self._line(
+                        self._memo_name(op, names),
+                        inst,
+                        qubit_index,
+                        clbit_index,
+                        params,
+                    )
+                )
+            if len(lines) >= _LINE_BLOCK:
+                update(("\n".join(lines) + "\n").encode())
+                lines.clear()
+        if lines:
+            update(("\n".join(lines) + "\n").encode())
+        update(b"E\n")
+
+    def _memo_name(self, op, names: dict) -> str:
+        """Return :meth:`_name` of ``op``, memoised in ``names`` by id."""
+        entry = names.get(id(op))
+        if entry is None:
+            entry = names[id(op)] = (op, self._name(op))
+        return entry[1]
+
+    def _name(self, op) -> str:
+        """Return the canonical name of an operation.
+
+        Qiskit standard gates with their default control state, and
+        measurements, resets, barriers and delays, are identified by their
+        name. Any other operation also hashes its class and control state;
+        annotated operations their modifiers and base operation; and gates
+        that are not Qiskit library classes (``to_gate()`` blocks, custom
+        subclasses) their definition, recursively. Opaque gates of the
+        same name and class still hash the same.
+        """
+        ctrl_state = getattr(op, "ctrl_state", None)
+        default_ctrl = (
+            ctrl_state is None
+            or ctrl_state == (1 << getattr(op, "num_ctrl_qubits", 0)) - 1
+        )
+        if default_ctrl and (
+            getattr(op, "_standard_gate", None) is not None
+            or isinstance(op, _STANDARD_INSTRUCTIONS)
+        ):
+            return op.name
+
+        base = getattr(op, "base_class", type(op))
+        parts = [op.name, f"{base.__module__}.{base.__qualname__}"]
+        if ctrl_state is not None:
+            parts.append(f"c{ctrl_state}")
+        if hasattr(op, "modifiers") and hasattr(op, "base_op"):
+            # AnnotatedOperation
+            parts.append(",".join(map(repr, op.modifiers)))
+            parts.append(self._name(op.base_op))
+        elif base in (Gate, Instruction) or not base.__module__.startswith("qiskit."):
+            # Library classes are fully described by class and parameters;
+            # anything else by its definition
+            definition = op.definition
+            if definition is None:
+                parts.append("opaque")
+            else:
+                sub = CircuitHasher(self.tolerance)
+                sub.update_circuit(definition)
+                parts.append(sub.hexdigest())
+        return "#".join(parts)
+
+    @staticmethod
+    def _line(name, inst, qubit_index, clbit_index, params) -> str:
+        """Return the canonical text of one instruction."""
+        return (
+            f"{name}"
+            f"|{','.join(str(qubit_index[q]) for q in inst.qubits)}"
+            f"|{','.join(str(clbit_index[c]) for c in inst.clbits)}"
+            f"|{','.join(params)}"
+        )
+
+    @staticmethod
+    def _condition(condition, clbit_index: dict) -> str:
+        """Return the canonical text of a classical condition."""
+        if isinstance(condition, tuple):
+            target, value = condition
+            if isinstance(target, Clbit):
+                bits = [clbit_index[target]]
+            elif isinstance(target, ClassicalRegister):
+                bits = [clbit_index[c] for c in target]
+            else:
+                return f"{target}={value}"
+            return f"{','.join(map(str, bits))}={value}"
+        return str(condition)
+
+    def update_payload_header(self, qubit_count: int, bit_count: int):
+        """Feed the header of a Thunderhead circuit payload.
+
+        Must be called once, before the payload's operations.
+
+        Args:
+            qubit_count (int): ``qubitCount`` of the payload.
+            bit_count (int): ``bitCount`` of the payload.
+        """
+        self._digest.update(f"P{qubit_count},{bit_count}\n".encode())
+
+    def _operation_line(self, operation: dict) -> str:
+        """Return the canonical text of one Thunderhead operation."""
+        parameters = operation.get(keys.PARAMETERS)
+        params = (
+            [
+                f"{name}={_normalize(parameters[name], self.tolerance)}"
+                for name in sorted(parameters)
+            ]
+            if parameters
+            else ()
+        )
+        return (
+            f"{operation[keys.TYPE]}"
+            f"|{','.join(map(str, operation[keys.QUBITS]))}"
+            f"|{','.join(map(str, operation.get(keys.BITS, ())))}"
+            f"|{','.join(params)}\n"
+        )
+
+    def update_operation(self, operation: dict, count: int = 1):
+        """Feed one Thunderhead operation dict, ``count`` times in a row.
+
+        Args:
+            operation (dict): Operation as produced by
+                ``ApiUtility.convert_instruction``.
+            count (int): Number of consecutive repetitions. Default: 1.
+        """
+        encoded = self._operation_line(operation).encode()
+        if count == 1:
+            self._digest.update(encoded)
+            return
+        per_block = max(1, _RUN_BLOCK // len(encoded))
+        full, rest = divmod(count, per_block)
+        if full:
+            block = encoded * per_block
+            for _ in range(full):
+                self._digest.update(block)
+        self._digest.update(encoded * rest)
+
+    def update_payload(self, circuit_dict: dict):
+        """Feed a whole Thunderhead circuit payload.
+
+        Args:
+            circuit_dict (dict): Circuit as produced by
+                ``ApiUtility.convert_circuit``.
+        """
+        self.update_payload_header(
+            circuit_dict[keys.QUBIT_COUNT], circuit_dict[keys.BIT_COUNT]
+        )
+        operations = circuit_dict[keys.OPERATIONS]
+        line = self._operation_line
+        for start in range(0, len(operations), _LINE_BLOCK):
+            block = operations[start : start + _LINE_BLOCK]
+            self._digest.update("".join(map(line, block)).encode())
+
+
+def hash_circuit(circuit: QuantumCircuit, tolerance: float = DEFAULT_TOLERANCE) -> str:
+    """Return the structural fingerprint of a ``QuantumCircuit``.
+
+    Args:
+        circuit (QuantumCircuit): Circuit to hash.
+        tolerance (float): Angle tolerance in radians. Default: ``1e-9``.
+
+    Returns:
+        str: Hex BLAKE2b-256 digest.
+    """
+    hasher = CircuitHasher(tolerance)
+    hasher.update_circuit(circuit)
+    return hasher.hexdigest()
+
+
+def hash_payload(circuit_dict: dict, tolerance: float = DEFAULT_TOLERANCE) -> str:
+    """Return the structural fingerprint of a Thunderhead circuit payload.
+
+    Args:
+        circuit_dict (dict): Circuit as produced by
+            ``ApiUtility.convert_circuit``.
+        tolerance (float): Angle tolerance in radians. Default: ``1e-9``.
+
+    Returns:
+        str: Hex BLAKE2b-256 digest.
+    """
+    hasher = CircuitHasher(tolerance)
+    hasher.update_payload(circuit_dict)
+    return hasher.hexdigest()
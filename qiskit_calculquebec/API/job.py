@@ -9,7 +9,11 @@ from qiskit import QuantumCircuit
 import json
 import time
 from qiskit_calculquebec.API.adapter import ApiAdapter
-from qiskit_calculquebec.API.api_utility import ApiUtility
+from qiskit_calculquebec.API.api_utility import PAYLOAD_BIT_COUNT, ApiUtility
+from qiskit_calculquebec.API.circuit_hash import CircuitHasher, hash_payload
+
+#: Circuits with at least this many instructions are streamed to the API.
+STREAM_THRESHOLD = 100_000
 
 
 class JobException(Exception):
@@ -35,14 +39,52 @@ class Job:
     Converts the circuit to dictionary format, posts the job, polls for
     completion, and returns the result histogram.
 
+    Very deep circuits are not converted up front: they are converted while
+    being uploaded by ``ApiAdapter.post_job_stream``, and ``circuit_dict``
+    is ``None``.
+
     Args:
-        circuit (QuantumCircuit): The circuit to execute.
+        circuit (QuantumCircuit | dict): The circuit to execute, or its
+            Thunderhead circuit dict (e.g. from ``PayloadTemplate.bind``),
+            submitted as-is.
         shots (int): Number of shots. Default: 1.
+        stream (bool | None): Stream the circuit to the API instead of
+            converting it up front. ``None`` streams circuits with at least
+            :data:`STREAM_THRESHOLD` instructions.
     """
 
-    def __init__(self, circuit: QuantumCircuit, shots: int = 1):
-        self.circuit_dict = ApiUtility.convert_circuit(circuit)
+    def __init__(self, circuit: QuantumCircuit, shots: int = 1, stream: bool = None):
         self.shots = shots
+        if isinstance(circuit, dict):
+            self.circuit = None
+            self.circuit_dict = circuit
+            return
+        if stream is None:
+            stream = len(circuit.data) >= STREAM_THRESHOLD
+        self.circuit = circuit
+        self.circuit_dict = None if stream else ApiUtility.convert_circuit(circuit)
+
+    def _post(self):
+        """Post the job, streaming the circuit if it was not converted."""
+        if self.circuit_dict is None:
+            return ApiAdapter.post_job_stream(self.circuit, self.shots)
+        return ApiAdapter.post_job(self.circuit_dict, self.shots)
+
+    def fingerprint(self) -> str:
+        """Return the structural fingerprint of the circuit payload.
+
+        Streamed circuits are hashed one operation at a time.
+
+        Returns:
+            str: Hex digest, equal to ``JobJournal.fingerprint(circuit_dict)``.
+        """
+        if self.circuit_dict is not None:
+            return hash_payload(self.circuit_dict)
+        hasher = CircuitHasher()
+        hasher.update_payload_header(len(self.circuit.qubits), PAYLOAD_BIT_COUNT)
+        for operation, count in ApiUtility.iter_runs(self.circuit):
+            hasher.update_operation(operation, count)
+        return hasher.hexdigest()
 
     def run_getID(self) -> str:
         """Submit the job and return its ID without waiting for completion.
@@ -53,7 +95,7 @@ class Job:
         Raises:
             JobException: If submission fails or the response is not 200.
         """
-        response = ApiAdapter.post_job(self.circuit_dict, self.shots)
+        response = self._post()
         if response.status_code != 200:
             self.raise_api_error(response)
         return json.loads(response.text)["job"]["id"]
@@ -78,7 +120,7 @@ class Job:
         if max_tries == -1:
             max_tries = 2**15
 
-        response = ApiAdapter.post_job(self.circuit_dict, self.shots)
+        response = self._post()
         if response.status_code != 200:
             self.raise_api_error(response)
 
@@ -100,9 +142,7 @@ class Job:
             if status == "SUCCEEDED":
                 return content["result"]["histogram"]
 
-        raise JobException(
-            f"Job did not complete. Last status: {current_status}"
-        )
+        raise JobException(f"Job did not complete. Last status: {current_status}")
 
     def raise_api_error(self, response):
         """Parse an API error response and raise a ``JobException``.
@@ -0,0 +1,111 @@
+"""
+Reusable Thunderhead payloads for parameterized circuits.
+
+A ``PayloadTemplate`` converts a parameterized, already-transpiled circuit
+once and records which operations carry a ``Parameter``. Binding new
+values then only rebuilds those operations and copies the list of
+references to the others, instead of converting the whole circuit again
+for every point of a variational sweep.
+"""
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterExpression
+from qiskit_calculquebec.API.api_utility import ApiUtility, keys
+
+
+class PayloadTemplate:
+    """Thunderhead circuit payload with parameterized angle slots.
+
+    Args:
+        circuit (QuantumCircuit): Parameterized circuit, already transpiled
+            to the native gate set. Parameters may only appear in ``rz`` and
+            ``p`` angles. A copy of it goes through the MonarQ lowering of
+            ``MonarQBackend.run`` (barrier removal included) before being
+            converted.
+
+    Raises:
+        ValueError: If the circuit contains an unsupported instruction, or
+            breaks the MonarQ measurement rules (no measurement, a
+            multi-qubit measurement, or a gate after a measurement).
+
+    Example:
+        .. code-block:: python
+
+            template = PayloadTemplate(backend.transpile(ansatz))
+            payloads = [template.bind(values) for values in sweep]
+            job = backend.run(payloads, shots=1000)
+    """
+
+    def __init__(self, circuit: QuantumCircuit):
+        # Bound payloads skip the lowering of MonarQBackend.run: apply it
+        # here, which also checks the measurement rules
+        from qiskit.converters import circuit_to_dag, dag_to_circuit
+        from qiskit_calculquebec.backends.monarq_backend import MonarQBackend
+
+        lowering = MonarQBackend.MonarQLoweringPass(validate=True, remove_barriers=True)
+        circuit = dag_to_circuit(lowering.run(circuit_to_dag(circuit)))
+        self.parameters = list(circuit.parameters)
+        self._payload = ApiUtility.convert_circuit(circuit)
+        self._operations = self._payload[keys.OPERATIONS]
+
+        # (operation index, angle expression, whether it is a bare Parameter)
+        self._slots = []
+        for index, operation in enumerate(self._operations):
+            angle = operation.get(keys.PARAMETERS, {}).get("lambda")
+            if isinstance(angle, ParameterExpression):
+                self._slots.append((index, angle, isinstance(angle, Parameter)))
+
+    @property
+    def num_parameters(self) -> int:
+        """Number of free parameters of the template."""
+        return len(self.parameters)
+
+    def bind(self, values) -> dict:
+        """Return the circuit payload for one binding of the parameters.
+
+        Only the operations holding a parameter are rebuilt, so no gate is
+        converted again; every other operation dict is shared with the
+        template and must not be mutated. The payload still needs its own
+        operations list: building it copies one reference per operation,
+        so a call costs O(#operations) pointer copies plus
+        O(#parameterized operations) new dicts.
+
+        Args:
+            values (dict | Sequence[float]): Mapping of ``Parameter`` to value,
+                or values in the order of :attr:`parameters`.
+
+        Returns:
+            dict: Thunderhead circuit dict, as returned by
+                ``ApiUtility.convert_circuit`` for the bound circuit.
+
+        Raises:
+            ValueError: If a parameter has no value, or the number of values
+                does not match :attr:`num_parameters`.
+        """
+        if isinstance(values, dict):
+            missing = [p.name for p in self.parameters if p not in values]
+            if missing:
+                raise ValueError(f"Missing values for parameters: {missing}")
+            binding = values
+        else:
+            values = list(values)
+            if len(values) != len(self.parameters):
+                raise ValueError(
+                    f"Expected {len(self.parameters)} values, got {len(values)}."
+                )
+            binding = dict(zip(self.parameters, values))
+
+        operations = list(self._operations)
+        for index, angle, bare in self._slots:
+            if bare:
+                value = float(binding[angle])
+            else:
+                value = float(angle.bind({p: binding[p] for p in angle.parameters}))
+            operations[index] = {
+                **operations[index],
+                keys.PARAMETERS: {"lambda": value},
+            }
+
+        payload = dict(self._payload)
+        payload[keys.OPERATIONS] = operations
+        return payload
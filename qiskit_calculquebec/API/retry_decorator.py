@@ -6,6 +6,7 @@ def retry(
     retries: int = 10,
     initial_delay: float = 0.1,
     backoff_factor: float = 2.0,
+    retry_on: tuple = (Exception,),
 ):
     """A decorator to retry a function call with exponential backoff.
 
@@ -16,6 +17,9 @@ def retry(
             retry. Default: 0.1.
         backoff_factor (float): The factor by which the delay increases after
             each retry. Default: 2.0.
+        retry_on (tuple[type[Exception], ...]): Exceptions that trigger a
+            retry; any other exception is raised immediately. Default: every
+            exception.
 
     Returns:
         function: The decorated function that will be retried on failure.
@@ -28,7 +32,7 @@ def retry(
             for attempt in range(1, retries + 1):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except retry_on as e:
                     if attempt < retries:
                         warnings.warn(
                             f"The request failed. \nThis was caused by inner exception: \n{e}\nRetrying in {delay} seconds...",
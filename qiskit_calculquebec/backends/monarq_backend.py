@@ -1,23 +1,171 @@
+from __future__ import annotations
+
+import copy
+import pickle
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
-from qiskit.circuit import Measure, Delay
+from qiskit import QuantumCircuit
+from qiskit.circuit import Delay, ParameterExpression
 from qiskit.circuit.library import IGate
-from qiskit import generate_preset_pass_manager
 from qiskit.providers import BackendV2 as Backend
 from qiskit.providers import Options
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler import PassManager, StagedPassManager
-from qiskit.transpiler.passes import RemoveBarriers
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.dagcircuit import DAGCircuit
 
 from qiskit_calculquebec.API.adapter import ApiAdapter
 from qiskit_calculquebec.API.client import ApiClient
 from qiskit_calculquebec.backends.targets.anyon_target import DT
-from qiskit_calculquebec.backends.targets.monarq import MonarQ
-from qiskit_calculquebec.backends.targets.yukon import Yukon
+from qiskit_calculquebec.backends.targets.factory import (
+    device_name,
+    get_target,
+    refresh_target,
+)
 from qiskit_calculquebec.backends.utils.job import MultiMonarQJob
+from qiskit_calculquebec.backends.utils.snapshot import (
+    dump_snapshot,
+    load_snapshot,
+    make_snapshot,
+)
+from qiskit_calculquebec.backends.utils.transpile_cache import (
+    CachedPassManager,
+    TranspileCache,
+)
+from qiskit_calculquebec.custom_gates.equivalences import register_equivalences
 from qiskit_calculquebec.custom_gates.ry_90_gate import RY90Gate
 from qiskit_calculquebec.custom_gates.ry_m90_gate import RYm90Gate
 
+# Shared idle instruction appended by DelayToIdentityPass
+_IDLE_GATE = IGate()
+
+
+def _delay_cycles(delay: Delay, dt: float) -> int:
+    """Return the duration of a ``Delay`` as a whole number of clock cycles.
+
+    Durations in seconds-based units are divided by ``dt`` and rounded to
+    the nearest integer; a warning is emitted when rounding is necessary.
+
+    Args:
+        delay (Delay): Delay instruction.
+        dt (float): Hardware clock period in seconds.
+
+    Returns:
+        int: Number of ``dt`` cycles.
+    """
+    duration = delay.duration
+    unit = delay.unit
+
+    if unit == "dt":
+        return int(duration)
+
+    unit_to_seconds = {"s": 1, "ms": 1e-3, "us": 1e-6, "ns": 1e-9}
+    duration_s = duration * unit_to_seconds.get(unit, 1)
+    n_cycles_exact = duration_s / dt
+    n_cycles = round(n_cycles_exact)
+    if not np.isclose(n_cycles_exact, n_cycles, rtol=1e-6):
+        warnings.warn(
+            f"Delay duration {duration} [{unit}] is not an exact "
+            f"multiple of dt={dt} s. "
+            f"Rounded from {n_cycles_exact:.4f} to {n_cycles} IGate(s).",
+            UserWarning,
+        )
+    return n_cycles
+
+
+def _circuit_operations(circuit):
+    """Yield ``(name, qubit mask, num_qubits, num_clbits)`` per instruction."""
+    bit = {q: 1 << i for i, q in enumerate(circuit.qubits)}
+    for inst in circuit.data:
+        mask = 0
+        for q in inst.qubits:
+            mask |= bit[q]
+        yield inst.operation.name, mask, len(inst.qubits), len(inst.clbits)
+
+
+def _dag_operations(dag):
+    """Yield ``(name, qubit mask, num_qubits, num_clbits)`` per DAG node."""
+    bit = {q: 1 << i for i, q in enumerate(dag.qubits)}
+    for node in dag.topological_op_nodes():
+        mask = 0
+        for q in node.qargs:
+            mask |= bit[q]
+        yield node.name, mask, len(node.qargs), len(node.cargs)
+
+
+def _check_measurements(operations):
+    """Enforce the MonarQ measurement rules on a sequence of operations.
+
+    Measured qubits are tracked as a bitmask of qubit indices.
+
+    Args:
+        operations (Iterable[tuple[str, int, int, int]]): Operation name,
+            bitmask of its qubit indices, number of qubits and number of
+            clbits, in execution order.
+
+    Raises:
+        ValueError: If the circuit has no measurement, a multi-qubit
+            measurement, or a gate after a measurement.
+    """
+    measured = 0
+    for name, mask, num_qubits, num_clbits in operations:
+        if name == "measure":
+            if num_qubits != 1 or num_clbits != 1:
+                raise ValueError("Multi-qubit measurements are not supported.")
+            measured |= mask
+        elif mask & measured:
+            raise ValueError("Gate applied after measurement is not allowed.")
+    if not measured:
+        raise ValueError("All circuits must contain at least one measurement.")
+
+
+def _build_pass_manager(target, optimization_level: int) -> StagedPassManager:
+    """Build the preset pass manager of a target with MonarQ lowering.
+
+    Args:
+        target (AnyonTarget): Hardware target.
+        optimization_level (int): Preset optimisation level (0–3).
+
+    Returns:
+        StagedPassManager: Pass manager with ``MonarQLoweringPass`` as
+            post-translation stage.
+    """
+    from qiskit import generate_preset_pass_manager
+
+    register_equivalences()
+    pm = generate_preset_pass_manager(
+        optimization_level=optimization_level, target=target
+    )
+    pm.post_translation = PassManager(
+        [MonarQBackend.MonarQLoweringPass(dt=DT, validate=False, remove_barriers=False)]
+    )
+    return pm
+
+
+# Pass manager of a transpilation worker process, built by _init_worker
+_worker_pass_manager = None
+
+
+def _init_worker(target_state: bytes, optimization_level: int):
+    """Build the pass manager of a worker from the pickled target.
+
+    Preset pass managers cannot be pickled, so every worker rebuilds one
+    from the target shipped once at pool start-up.
+    """
+    global _worker_pass_manager
+    _worker_pass_manager = _build_pass_manager(
+        pickle.loads(target_state), optimization_level
+    )
+
+
+def _transpile_timed(circuit):
+    """Transpile a circuit in a worker; return it with the elapsed seconds."""
+    start = time.perf_counter()
+    transpiled = _worker_pass_manager.run(circuit)
+    return transpiled, time.perf_counter() - start
+
 
 class MonarQBackend(Backend):
     """Custom backend for the Yukon 6-qubit device.
@@ -27,16 +175,242 @@ class MonarQBackend(Backend):
     - Validates measurement placement
     - Supports multi-circuit jobs with MultiMonarQJob
     - Transpilation includes automatic RY(±π/2) replacement
-    - Delay gates are automatically expanded into IGate sequences
+    - Delay gates are kept as counted idles and expanded into IGate
+      sequences only when the payload is serialized
     """
 
     _client: ApiClient
 
     @property
     def target(self):
-        """Return the backend target object."""
+        """Return the backend target object.
+
+        The target, and the calibration download it needs, are only built
+        on first access. With ``auto_refresh``, the target is refreshed
+        whenever ``ApiAdapter`` has fetched a new benchmark since. A backend
+        created with :meth:`from_snapshot` always uses the snapshot's
+        calibration.
+        """
+        if self._target is None:
+            if self._snapshot is not None:
+                self._benchmark = self._snapshot["benchmark"]
+                connectivity = self._snapshot["connectivity"]
+            else:
+                self._benchmark, connectivity = self._current_calibration()
+            self._target = get_target(
+                self._machine_name,
+                cache_dir=self._target_cache,
+                benchmark=self._benchmark,
+                connectivity=connectivity,
+            )
+        elif self._auto_refresh:
+            benchmark, _ = self._current_calibration()
+            if benchmark is not self._benchmark:
+                self.refresh_calibration(benchmark)
         return self._target
 
+    @classmethod
+    def from_snapshot(
+        cls,
+        path: str,
+        client: ApiClient = None,
+        transpile_cache: TranspileCache | str = None,
+        target_cache: str = None,
+    ) -> "MonarQBackend":
+        """Create a backend pinned to a calibration snapshot.
+
+        The target is built from the snapshot's benchmark, so transpiling
+        is reproducible and never queries the API. Without ``client`` the
+        backend is offline: it transpiles but cannot run circuits.
+
+        Args:
+            path (str): Snapshot written by :meth:`save_snapshot`.
+            client (ApiClient | None): Authenticated API client, to also
+                submit jobs. Default: offline backend.
+            transpile_cache (TranspileCache | str | None): See
+                :meth:`__init__`.
+            target_cache (str | None): See :meth:`__init__`.
+
+        Returns:
+            MonarQBackend: Backend using the snapshot's calibration.
+
+        Raises:
+            ValueError: If ``path`` is not a supported snapshot file.
+
+        Example:
+            .. code-block:: python
+
+                backend.save_snapshot("monarq.json")  # once, online
+                offline = MonarQBackend.from_snapshot("monarq.json")
+                transpiled = offline.transpile(circuits)
+        """
+        snapshot = load_snapshot(path)
+        machine_name = snapshot["machine_name"]
+
+        if client is not None:
+            backend = cls(
+                machine_name,
+                client,
+                transpile_cache=transpile_cache,
+                target_cache=target_cache,
+            )
+        else:
+            backend = cls.__new__(cls)
+            Backend.__init__(backend)
+            backend._client = None
+            backend._init_state(machine_name, transpile_cache, target_cache, False)
+
+        backend._snapshot = snapshot
+        return backend
+
+    def save_snapshot(self, path: str):
+        """Write the machine metadata, benchmark and connectivity to a file.
+
+        The benchmark and connectivity saved are the ones the target was
+        built from (or last refreshed with), so a backend created with
+        :meth:`from_snapshot` transpiles exactly like this one.
+
+        Args:
+            path (str): Destination file, overwritten atomically.
+
+        Raises:
+            ValueError: If the backend has no calibration data to save
+                (no API adapter and no snapshot).
+        """
+        self.target
+        if self._snapshot is not None:
+            dump_snapshot(path, self._snapshot)
+            return
+        if self._benchmark is None or ApiAdapter.instance() is None:
+            raise ValueError(
+                "No calibration data to save: the backend uses default values."
+            )
+
+        dump_snapshot(
+            path,
+            make_snapshot(
+                self._machine_name,
+                ApiAdapter.get_machine_by_name(self.name.lower()),
+                self._benchmark,
+                self.target.calibration.connectivity(),
+            ),
+        )
+
+    def routing_costs(self) -> np.ndarray:
+        """Return the fidelity-weighted all-pairs routing costs of the device.
+
+        Entry ``[a, b]`` is minus the log of the best product of CZ
+        fidelities along a path from qubit ``a`` to ``b`` (see
+        ``CalibrationTable.routing_costs``). The matrix is computed once per
+        calibration and shared by every caller until the calibration is
+        refreshed.
+
+        Returns:
+            np.ndarray: Read-only ``(num_qubits, num_qubits)`` cost matrix.
+
+        Example:
+            .. code-block:: python
+
+                costs = backend.routing_costs()
+                layout_cost = sum(costs[p[a], p[b]] for a, b in interactions)
+        """
+        return self.target.calibration.routing_costs()
+
+    def best_qubits(self, n: int) -> list:
+        """Return the best connected set of ``n`` physical qubits.
+
+        Subsets are ranked by single-qubit, CZ and readout fidelity (see
+        ``SubgraphIndex``). The ranking is built once per calibration, after
+        which this is a lookup; use it as ``initial_layout`` when
+        transpiling.
+
+        Args:
+            n (int): Number of qubits.
+
+        Returns:
+            list[int]: Physical qubits, in ascending order.
+
+        Raises:
+            ValueError: If ``n`` is not between 1 and the number of qubits.
+
+        Example:
+            .. code-block:: python
+
+                layout = backend.best_qubits(qc.num_qubits)
+                transpiled = transpile(qc, backend, initial_layout=layout)
+        """
+        return self.target.calibration.subgraph_index().best(n)
+
+    def _current_calibration(self, force_refresh: bool = False) -> tuple:
+        """Return the benchmark and connectivity ``ApiAdapter`` holds for this device.
+
+        Both are ``None`` when no adapter is initialized.
+        """
+        if ApiAdapter.instance() is None:
+            return None, None
+        name = self.name.lower()
+        return (
+            ApiAdapter.get_benchmark(name, force_refresh=force_refresh),
+            ApiAdapter.get_connectivity_for_machine(name),
+        )
+
+    def refresh_calibration(self, benchmark: dict = None) -> bool:
+        """Switch the backend to the target of a new benchmark.
+
+        The new target is derived from the current one by
+        ``refresh_target``, which leaves the current target untouched:
+        other backends sharing it keep their calibration. The backend and
+        its client are kept. Only the caches depending on the calibration
+        (pass managers) are invalidated, and only when the calibration
+        actually changed.
+
+        A backend created with :meth:`from_snapshot` is pinned to its
+        snapshot: it only changes when given ``benchmark``, which then
+        replaces the snapshot's benchmark.
+
+        Args:
+            benchmark (dict | None): Benchmark response to apply. Default:
+                the latest benchmark, fetched bypassing ``ApiAdapter``'s
+                24-hour cache.
+
+        Returns:
+            bool: Whether the calibration changed.
+
+        Example:
+            .. code-block:: python
+
+                if backend.refresh_calibration():
+                    transpiled = backend.transpile(circuits)
+        """
+        connectivity = None
+        if benchmark is None:
+            if self._snapshot is not None:
+                return False
+            benchmark, connectivity = self._current_calibration(force_refresh=True)
+        if self._target is None:
+            self.target
+        self._benchmark = benchmark
+        if self._snapshot is not None:
+            self._snapshot["benchmark"] = benchmark
+
+        target = refresh_target(
+            self._machine_name,
+            self._target,
+            benchmark,
+            cache_dir=self._target_cache,
+            connectivity=connectivity,
+        )
+        if target.calibration_fingerprint() == self._target.calibration_fingerprint():
+            return False
+
+        self._target = target
+        self._invalidate_calibration_caches()
+        return True
+
+    def _invalidate_calibration_caches(self):
+        """Drop every cache built from the previous calibration."""
+        self._pass_managers = {}
+
     @property
     def dt(self) -> float:
         """Return the system time resolution of input signals in seconds.
@@ -60,13 +434,33 @@ class MonarQBackend(Backend):
         """Provide default backend options."""
         return Options(shots=1024)
 
-    def __init__(self, machine_name: str = "monarq", client: ApiClient = None):
+    def __init__(
+        self,
+        machine_name: str = "monarq",
+        client: ApiClient = None,
+        transpile_cache: TranspileCache | str = None,
+        target_cache: str = None,
+        auto_refresh: bool = False,
+    ):
         """Initialize the MonarQ backend.
 
         Args:
             machine_name (str): Target device: ``"monarq"`` (24 qubits) or
                 ``"yukon"`` (6 qubits). Default: ``"monarq"``.
             client (ApiClient): Authenticated API client. Required.
+            transpile_cache (TranspileCache | str | None): On-disk cache of
+                transpiled circuits, or the path of its directory. When set,
+                :meth:`get_pass_manager` and :meth:`transpile` return cached
+                results for circuits already transpiled against the same
+                calibration. Default: no cache.
+            target_cache (str | None): Directory where built targets are
+                pickled, so that backends in other processes load them
+                instead of rebuilding them. Targets are always shared by
+                the backends of one process. Default: no directory.
+            auto_refresh (bool): Refresh the target's calibration (see
+                :meth:`refresh_calibration`) whenever ``ApiAdapter`` fetches
+                a new benchmark, which it does once its 24-hour cache
+                expires. Default: ``False``.
 
         Raises:
             ValueError: If ``client`` is ``None`` or ``machine_name`` is not
@@ -85,12 +479,34 @@ class MonarQBackend(Backend):
             )
         if machine_name.lower() == "yukon":
             self._client.machine_name = "yukon"
-            self._target = Yukon()
         elif machine_name.lower() == "monarq":
             self._client.machine_name = "yamaska"
-            self._target = MonarQ()
 
-        self.name = self._target.name
+        self._init_state(machine_name, transpile_cache, target_cache, auto_refresh)
+
+    def _init_state(
+        self,
+        machine_name: str,
+        transpile_cache: TranspileCache | str,
+        target_cache: str,
+        auto_refresh: bool,
+    ):
+        """Set up everything but the client (see :meth:`__init__`)."""
+        # Built on first access of the target property
+        self._machine_name = machine_name
+        self._target_cache = target_cache
+        self._target = None
+        self._benchmark = None
+        self._snapshot = None
+        self._auto_refresh = auto_refresh
+
+        self.name = device_name(machine_name)
+
+        # Pass managers keyed by (optimization level, calibration fingerprint)
+        self._pass_managers = {}
+        if isinstance(transpile_cache, str):
+            transpile_cache = TranspileCache(transpile_cache)
+        self._transpile_cache = transpile_cache
 
         # Set backend options validators (only shots supported here)
         self.options.set_validator("shots", (1, 1024))
@@ -103,54 +519,90 @@ class MonarQBackend(Backend):
         - Multi-qubit measurements are not supported.
         - Gates cannot be applied to a qubit after it has been measured.
 
+        A ``DAGCircuit`` (e.g. one built for lowering) is validated
+        directly, without converting it back to a circuit.
+
         Args:
-            circuits (list[QuantumCircuit]): Circuits to validate.
+            circuits (list[QuantumCircuit | DAGCircuit]): Circuits to validate.
 
         Raises:
             ValueError: If any constraint is violated.
         """
         for qc in circuits:
-            measured_qubits = set()
-            for instr in qc.data:
-                op = instr.operation
-                qubits = instr.qubits
-
-                # Mark qubits as measured
-                if isinstance(op, Measure):
-                    if len(instr.qubits) != 1 or len(instr.clbits) != 1:
-                        raise ValueError("Multi-qubit measurements are not supported.")
-                    measured_qubits.update(qubits)
-
-                else:
-                    # Gate after measurement → raise error
-                    if any(q in measured_qubits for q in qubits):
-                        raise ValueError(
-                            "Gate applied after measurement is not allowed."
-                        )
-            if len(measured_qubits) == 0:
-                raise ValueError("All circuits must contain at least one measurement.")
+            if isinstance(qc, DAGCircuit):
+                _check_measurements(_dag_operations(qc))
+            else:
+                _check_measurements(_circuit_operations(qc))
 
     def run(self, circuits, **kwargs):
         """Submit circuits to the backend and return a MultiMonarQJob.
 
-        Automatically applies :class:`DelayToIdentityPass` after any external
-        optimization, so :class:`~qiskit.circuit.Delay` gates are always
-        expanded into ``IGate`` sequences before reaching the hardware.
+        Automatically applies :class:`MonarQLoweringPass` after any external
+        optimization: barriers are removed, measurement rules are validated,
+        and every :class:`~qiskit.circuit.Delay` becomes a whole number of
+        ``dt`` cycles, expanded into ``IGate`` operations when the payload is
+        serialized.
+
+        Thunderhead circuit dicts (e.g. from
+        :meth:`~qiskit_calculquebec.API.payload_template.PayloadTemplate.bind`)
+        are already lowered and validated, and are submitted as-is.
+
+        Circuits are validated and lowered here, but submitted in the
+        background by the process-wide
+        :class:`~qiskit_calculquebec.backends.utils.scheduler.SubmissionScheduler`:
+        ``run`` returns before any ``POST /jobs`` request is sent, so
+        submission errors (e.g. ``ApiException``) are not raised here but by
+        the returned job's ``wait_for_submission()``, ``status()`` and
+        ``result()``. The interpreter waits for queued circuits to be
+        submitted before exiting, unless the job is cancelled.
 
         Args:
             circuits: Circuit or list of circuits to execute.
             **kwargs: Optional keyword arguments. ``shots`` sets the number of
-                shots to execute (capped at 1024).
+                shots to execute (capped at 1024). ``journal`` (path or
+                :class:`~qiskit_calculquebec.backends.utils.journal.JobJournal`)
+                records every submission so the batch can be resumed after a
+                crash; ``job_id`` names the batch inside the journal (default: a
+                new unique ID; pass the same one again to reattach).
+                ``result_store``
+                (:class:`~qiskit_calculquebec.backends.utils.result_store.ResultStore`)
+                keeps terminal job responses locally for instant re-retrieval.
+                ``priority``
+                (:class:`~qiskit_calculquebec.backends.utils.scheduler.Priority`)
+                sets the submission priority class; by default a single
+                circuit is ``INTERACTIVE`` and a list is ``NORMAL``.
+
+        Returns:
+            MultiMonarQJob: Job tracking the circuits, possibly before any of
+                them is submitted.
+
+        Raises:
+            ValueError: If the backend is offline, or a circuit breaks the
+                measurement rules.
         """
+        if self._client is None:
+            raise ValueError(
+                "This backend was created offline from a snapshot; pass a "
+                "client to MonarQBackend.from_snapshot to run circuits."
+            )
+
         if not isinstance(circuits, (list, tuple)):
             circuits = [circuits]
 
-        circuits = RemoveBarriers()(circuits)
-
-        self._validate_circuit(circuits)
-
-        pm_delay = PassManager([self.DelayToIdentityPass(dt=DT)])
-        circuits = [pm_delay.run(qc) for qc in circuits]
+        # Thunderhead dicts are already lowered: decided per circuit, so
+        # prebuilt payloads and circuits can be mixed
+        lowering = self.MonarQLoweringPass(dt=DT)
+        circuits = [
+            (
+                qc
+                if isinstance(qc, dict)
+                else dag_to_circuit(
+                    lowering.run(circuit_to_dag(qc, copy_operations=False)),
+                    copy_operations=False,
+                )
+            )
+            for qc in circuits
+        ]
 
         shots = kwargs.get("shots", getattr(self.options, "shots", 1024))
         if shots > 1024:
@@ -162,7 +614,15 @@ class MonarQBackend(Backend):
             )
 
         # Return a multi-job wrapper to handle sequential execution
-        return MultiMonarQJob(self, circuits, shots=shots)
+        return MultiMonarQJob(
+            self,
+            circuits,
+            job_id=kwargs.get("job_id"),
+            shots=shots,
+            journal=kwargs.get("journal"),
+            result_store=kwargs.get("result_store"),
+            priority=kwargs.get("priority"),
+        )
 
     class ReplaceRYPass(TransformationPass):
         """Transpiler pass that replaces ``RY(±π/2)`` with the native
@@ -219,66 +679,229 @@ class MonarQBackend(Backend):
         def run(self, dag):
             """Expand all ``Delay`` nodes in the DAG into ``IGate`` sequences.
 
+            The DAG is rebuilt in a single topological sweep that appends a
+            shared ``IGate`` instance, instead of substituting a freshly
+            built sub-DAG for every ``Delay``. DAGs without delays are
+            returned unchanged.
+
             Args:
                 dag (DAGCircuit): Input circuit DAG.
 
             Returns:
-                DAGCircuit: Modified DAG with ``Delay`` nodes replaced by
-                    ``IGate`` chains.
+                DAGCircuit: DAG with ``Delay`` nodes replaced by ``IGate``
+                    chains.
             """
-            from qiskit.dagcircuit import DAGCircuit
+            if not dag.op_nodes(Delay):
+                return dag
 
-            for node in dag.op_nodes():
+            expanded = dag.copy_empty_like()
+            for node in dag.topological_op_nodes():
                 if not isinstance(node.op, Delay):
+                    expanded.apply_operation_back(
+                        node.op, node.qargs, node.cargs, check=False
+                    )
                     continue
+                for _ in range(_delay_cycles(node.op, self.dt)):
+                    expanded.apply_operation_back(
+                        _IDLE_GATE, node.qargs, (), check=False
+                    )
+            return expanded
 
-                duration = node.op.duration
-                unit = node.op.unit
-
-                if unit == "dt":
-                    n_cycles = int(duration)
-                else:
-                    unit_to_seconds = {"s": 1, "ms": 1e-3, "us": 1e-6, "ns": 1e-9}
-                    duration_s = duration * unit_to_seconds.get(unit, 1)
-                    n_cycles_exact = duration_s / self.dt
-                    n_cycles = round(n_cycles_exact)
-                    if not np.isclose(n_cycles_exact, n_cycles, rel_tol=1e-6):
-                        warnings.warn(
-                            f"Delay duration {duration} [{unit}] is not an exact "
-                            f"multiple of dt={self.dt} s. "
-                            f"Rounded from {n_cycles_exact:.4f} to {n_cycles} IGate(s).",
-                            UserWarning,
-                        )
+    class DelayNormalizationPass(TransformationPass):
+        """Transpiler pass that keeps each idle period as one counted ``Delay``.
 
+        Every :class:`~qiskit.circuit.Delay` is rewritten as a ``Delay`` of a
+        whole number of ``dt`` cycles (rounding as
+        :class:`DelayToIdentityPass` does), zero-length delays are removed,
+        and consecutive delays on the same qubit are merged. The idle is
+        only expanded into ``IGate`` operations when the circuit is
+        serialized by ``ApiUtility.convert_circuit``, so a 10 µs delay stays
+        a single DAG node instead of ~312.
+
+        Args:
+            dt (float): Hardware clock period in seconds. Defaults to
+                :data:`~qiskit_calculquebec.backends.targets.anyon_target.DT`.
+        """
+
+        def __init__(self, dt: float = DT):
+            super().__init__()
+            self.dt = dt
+
+        def run(self, dag):
+            """Normalize and merge all ``Delay`` nodes in the DAG.
+
+            Args:
+                dag (DAGCircuit): Input circuit DAG.
+
+            Returns:
+                DAGCircuit: Modified DAG where every ``Delay`` is a positive
+                    number of ``dt`` cycles.
+            """
+            for node in dag.op_nodes(Delay):
+                n_cycles = _delay_cycles(node.op, self.dt)
                 if n_cycles <= 0:
                     dag.remove_op_node(node)
+                elif node.op.unit != "dt" or node.op.duration != n_cycles:
+                    dag.substitute_node(node, Delay(n_cycles, unit="dt"))
+
+            for run in dag.collect_runs(["delay"]):
+                if len(run) < 2:
                     continue
+                total = sum(int(node.op.duration) for node in run)
+                dag.substitute_node(run[0], Delay(total, unit="dt"))
+                for node in run[1:]:
+                    dag.remove_op_node(node)
+
+            return dag
+
+    class MonarQLoweringPass(TransformationPass):
+        """Fused MonarQ lowering pass, applied in a single DAG traversal.
+
+        Combines, node by node in topological order:
 
-                mini_dag = DAGCircuit()
-                mini_dag.add_qubits(node.qargs)
-                for _ in range(n_cycles):
-                    mini_dag.apply_operation_back(IGate(), qargs=node.qargs, cargs=[])
-                dag.substitute_node_with_dag(node, mini_dag)
+        * the ``RY(±π/2)`` → ``RY90`` / ``RYm90`` substitution of
+          :class:`ReplaceRYPass`;
+        * the delay normalization and merging of
+          :class:`DelayNormalizationPass`;
+        * barrier removal (optional);
+        * the measurement rules of :meth:`MonarQBackend._validate_circuit`
+          (optional).
 
+        Args:
+            dt (float): Hardware clock period in seconds. Defaults to
+                :data:`~qiskit_calculquebec.backends.targets.anyon_target.DT`.
+            validate (bool): Enforce the measurement rules. Default: ``True``.
+            remove_barriers (bool): Remove barriers. Default: ``True``.
+
+        Raises:
+            ValueError: When ``validate`` is set and the circuit has no
+                measurement, a multi-qubit measurement, or a gate after a
+                measurement.
+        """
+
+        def __init__(
+            self, dt: float = DT, validate: bool = True, remove_barriers: bool = True
+        ):
+            super().__init__()
+            self.dt = dt
+            self.validate = validate
+            self.remove_barriers = remove_barriers
+
+        def run(self, dag):
+            """Lower the DAG for MonarQ in one traversal.
+
+            Args:
+                dag (DAGCircuit): Input circuit DAG.
+
+            Returns:
+                DAGCircuit: Lowered DAG.
+            """
+            if self.validate:
+                # Measurement rules are checked on the operations as the
+                # traversal reaches them, before each one is lowered
+                _check_measurements(self._lower(dag))
+            else:
+                for _ in self._lower(dag):
+                    pass
             return dag
 
-    def get_pass_manager(self, optimization_level: int = 3) -> StagedPassManager:
+        def _lower(self, dag):
+            """Lower ``dag`` in place, node by node.
+
+            Yields:
+                tuple[str, int, int, int]: Operation name, qubit bitmask,
+                    number of qubits and number of clbits of each node
+                    other than barriers, before it is lowered (see
+                    :func:`_check_measurements`).
+            """
+            bit = {q: 1 << i for i, q in enumerate(dag.qubits)}
+            # Last delay node on each qubit, while no other op followed it
+            open_delay = {}
+
+            for node in list(dag.topological_op_nodes()):
+                name = node.name
+                qargs = node.qargs
+
+                if name == "barrier":
+                    if self.remove_barriers:
+                        dag.remove_op_node(node)
+                    else:
+                        for q in qargs:
+                            open_delay.pop(q, None)
+                    continue
+
+                mask = 0
+                for q in qargs:
+                    mask |= bit[q]
+                yield name, mask, len(qargs), len(node.cargs)
+
+                if name == "delay":
+                    qubit = qargs[0]
+                    n_cycles = _delay_cycles(node.op, self.dt)
+                    previous = open_delay.get(qubit)
+                    if n_cycles <= 0:
+                        dag.remove_op_node(node)
+                    elif previous is not None:
+                        total = int(previous.op.duration) + n_cycles
+                        dag.remove_op_node(node)
+                        open_delay[qubit] = dag.substitute_node(
+                            previous, Delay(total, unit="dt")
+                        )
+                    elif node.op.unit != "dt" or node.op.duration != n_cycles:
+                        open_delay[qubit] = dag.substitute_node(
+                            node, Delay(n_cycles, unit="dt")
+                        )
+                    else:
+                        open_delay[qubit] = node
+                    continue
+
+                for q in qargs:
+                    open_delay.pop(q, None)
+
+                if name == "ry":
+                    theta = node.op.params[0]
+                    if isinstance(theta, ParameterExpression):
+                        continue
+                    if np.isclose(theta, np.pi / 2):
+                        dag.substitute_node(node, RY90Gate())
+                    elif np.isclose(theta, -np.pi / 2):
+                        dag.substitute_node(node, RYm90Gate())
+
+    def get_pass_manager(
+        self, optimization_level: int = 3, use_cache: bool = True
+    ) -> StagedPassManager:
         """Return a fully configured pass manager for this backend.
 
         This is the recommended way to transpile circuits intended for
         MonarQ/Yukon. It wraps :func:`~qiskit.transpiler.generate_preset_pass_manager`
-        and injects the two backend-specific transformation passes:
+        and injects :class:`MonarQLoweringPass` as post-translation stage,
+        which in a single traversal:
+
+        * rewrites ``RY(±π/2)`` to native ``RY90`` / ``RYm90`` gates;
+        * rewrites every :class:`~qiskit.circuit.Delay` as a whole number of
+          ``dt`` cycles, expanded into as many ``IGate`` operations (1
+          ``IGate`` = 1 dt = 32 ns) only when the payload is serialized.
+
+        Barriers are kept and measurement rules are not enforced at this
+        stage; :meth:`run` does both.
 
-        * :class:`ReplaceRYPass` — rewrites ``RY(±π/2)`` to native
-          ``RY90`` / ``RYm90`` gates.
-        * :class:`DelayToIdentityPass` — expands every
-          :class:`~qiskit.circuit.Delay` into the equivalent number of
-          ``IGate`` operations (1 ``IGate`` = 1 dt = 32 ns).
+        Pass managers are cached per optimization level and reused until the
+        target's calibration changes. Each call returns a shallow copy of
+        the cached one, so assigning a stage (e.g. ``pm.scheduling = ...``)
+        only affects the returned object; the stage pass managers
+        themselves are shared and must not be modified in place. When the
+        backend has a transpile cache, the pass manager is wrapped in a
+        ``CachedPassManager`` whose ``run`` serves already transpiled
+        circuits from disk.
 
         Args:
             optimization_level (int): Preset optimisation level passed to
                 :func:`~qiskit.transpiler.generate_preset_pass_manager` (0–3).
                 Default: 3.
+            use_cache (bool): Read and fill the backend's transpile cache.
+                Set to ``False`` for throwaway circuits (e.g. the variants
+                generated by error mitigation) so that they are not written
+                to disk. Default: ``True``.
 
         Returns:
             StagedPassManager: A staged pass manager ready to call ``.run(circuit)``.
@@ -292,26 +915,135 @@ class MonarQBackend(Backend):
                 sampler = Sampler(mode=backend)
                 job = sampler.run([transpiled_qc], shots=1000)
         """
-        pm = generate_preset_pass_manager(
-            optimization_level=optimization_level, backend=self
-        )
-        pm.post_translation = PassManager(
-            [self.ReplaceRYPass(), self.DelayToIdentityPass(dt=DT)]
-        )
+        fingerprint = self.target.calibration_fingerprint()
+        key = (optimization_level, fingerprint)
+        pm = self._pass_managers.get(key)
+        if pm is None:
+            pm = self._build_cached_pass_manager(optimization_level, fingerprint)
+        if not use_cache and isinstance(pm, CachedPassManager):
+            pm = pm._pass_manager
+        return copy.copy(pm)
+
+    def _build_cached_pass_manager(self, optimization_level: int, fingerprint: str):
+        """Build and cache the pass manager of a level for a calibration."""
+        key = (optimization_level, fingerprint)
+        pm = _build_pass_manager(self.target, optimization_level)
+        if self._transpile_cache is not None:
+            pm = CachedPassManager(
+                pm, self._transpile_cache, optimization_level, fingerprint
+            )
+        # Pass managers built for a previous calibration are stale
+        self._pass_managers = {
+            k: v for k, v in self._pass_managers.items() if k[1] == fingerprint
+        }
+        self._pass_managers[key] = pm
         return pm
 
-    def transpile(self, circuit):
-        """Transpile a circuit for this backend at optimization level 3.
+    def iter_transpile(
+        self, circuits, optimization_level: int = 3, num_processes: int = None
+    ):
+        """Transpile circuits one by one, yielding each result when ready.
+
+        With ``num_processes`` greater than 1, circuits are spread over a
+        process pool. The target is pickled once and every worker builds
+        its pass manager from it at start-up, so no calibration data is
+        fetched again. Results are yielded in input order. With a
+        transpile cache, only the circuits missing from it are transpiled.
+
+        Args:
+            circuits (list[QuantumCircuit]): Circuits to transpile.
+            optimization_level (int): Preset optimisation level (0–3).
+                Default: 3.
+            num_processes (int | None): Number of worker processes. ``None``
+                or 1 transpiles serially in this process.
+
+        Yields:
+            tuple[QuantumCircuit, float]: Transpiled circuit and the seconds
+                spent transpiling it.
+        """
+        circuits = list(circuits)
+        if num_processes is None or num_processes <= 1 or len(circuits) < 2:
+            pm = self.get_pass_manager(optimization_level=optimization_level)
+            for circuit in circuits:
+                start = time.perf_counter()
+                transpiled = pm.run(circuit)
+                yield transpiled, time.perf_counter() - start
+            return
+
+        # Cache hits are served here; only the misses go to the pool
+        cache = self._transpile_cache
+        keys = [None] * len(circuits)
+        cached = [None] * len(circuits)
+        if cache is not None:
+            fingerprint = self.target.calibration_fingerprint()
+            for i, circuit in enumerate(circuits):
+                start = time.perf_counter()
+                keys[i] = cache.key(circuit, optimization_level, fingerprint)
+                hit = cache.get(keys[i], circuit)
+                if hit is not None:
+                    cached[i] = (hit, time.perf_counter() - start)
+        missing = [c for c, hit in zip(circuits, cached) if hit is None]
+        if not missing:
+            for hit in cached:
+                yield hit
+            return
+
+        num_processes = min(num_processes, len(missing))
+        chunksize = max(1, len(missing) // (4 * num_processes))
+        pool = ProcessPoolExecutor(
+            max_workers=num_processes,
+            initializer=_init_worker,
+            initargs=(pickle.dumps(self.target), optimization_level),
+        )
+        try:
+            transpiled = pool.map(_transpile_timed, missing, chunksize=chunksize)
+            for key, hit in zip(keys, cached):
+                if hit is None:
+                    hit = next(transpiled)
+                    if cache is not None:
+                        cache.put(key, hit[0])
+                yield hit
+        finally:
+            # Stopping the iteration early drops the circuits not yet started
+            pool.shutdown(cancel_futures=True)
+
+    def transpile(self, circuits, num_processes: int = None, callback=None):
+        """Transpile circuits for this backend at optimization level 3.
 
         Applies:
-        - ``ReplaceRYPass``: rewrites ``RY(±π/2)`` to native ``RY90`` / ``RYm90`` gates.
-        - ``DelayToIdentityPass``: expands ``Delay`` gates into ``IGate`` sequences.
+        - ``MonarQLoweringPass``: rewrites ``RY(±π/2)`` to native ``RY90`` /
+          ``RYm90`` gates and keeps ``Delay`` gates as whole ``dt`` counts.
         - Level-3 preset optimization passes.
 
         Args:
-            circuit (QuantumCircuit): Circuit to transpile.
+            circuits (QuantumCircuit | list[QuantumCircuit]): Circuit or
+                circuits to transpile.
+            num_processes (int | None): Number of worker processes used for
+                a list of circuits (see :meth:`iter_transpile`). Default:
+                serial.
+            callback (Callable[[int, QuantumCircuit, float], None] | None):
+                Called with the index, transpiled circuit and elapsed seconds
+                of each circuit, in order, as soon as it is transpiled.
 
         Returns:
-            QuantumCircuit: Transpiled circuit ready for execution.
+            QuantumCircuit | list[QuantumCircuit]: Transpiled circuit, or
+                list of transpiled circuits if a list was given.
+
+        Example:
+            .. code-block:: python
+
+                transpiled = backend.transpile(
+                    sweep,
+                    num_processes=8,
+                    callback=lambda i, qc, s: print(f"{i}: {s:.3f} s"),
+                )
         """
-        return self.get_pass_manager(optimization_level=3).run(circuit)
+        single = isinstance(circuits, QuantumCircuit)
+        results = []
+        for index, (transpiled, elapsed) in enumerate(
+            self.iter_transpile([circuits] if single else circuits, 3, num_processes)
+        ):
+            if callback is not None:
+                callback(index, transpiled, elapsed)
+            results.append(transpiled)
+        return results[0] if single else results
@@ -6,6 +6,10 @@ defines the supported gate set, and registers instruction properties.
 Concrete targets (``MonarQ``, ``Yukon``) supply the topology.
 """
 
+import hashlib
+
+import numpy as np
+
 from qiskit.transpiler.target import Target
 from qiskit.circuit.library import (
     IGate,
@@ -26,6 +30,10 @@ from qiskit.transpiler.target import QubitProperties
 from qiskit.transpiler import InstructionProperties
 
 from qiskit_calculquebec.API.adapter import ApiAdapter
+from qiskit_calculquebec.backends.targets.calibration import (
+    DEFAULT_CZ_ERROR,
+    CalibrationTable,
+)
 from qiskit_calculquebec.custom_gates.ry_90_gate import RY90Gate
 from qiskit_calculquebec.custom_gates.ry_m90_gate import RYm90Gate
 
@@ -110,7 +118,12 @@ class AnyonTarget(Target, ABC):
         """
         pass
 
-    def __init__(self):
+    def __new__(cls, benchmark: dict = None, connectivity: dict = None):
+        # Target.__new__ takes Target's own constructor arguments positionally:
+        # keep the calibration data out of them
+        return super().__new__(cls)
+
+    def __init__(self, benchmark: dict = None, connectivity: dict = None):
         """Initialize the hardware target.
 
         This constructor:
@@ -120,6 +133,15 @@ class AnyonTarget(Target, ABC):
         * Defines the default gate set
         * Registers supported instructions with their associated duration and
           error rates
+
+        Args:
+            benchmark (dict | None): Benchmark response to take calibration
+                data from. ``None`` fetches it through ``ApiAdapter`` when an
+                adapter is initialized, and uses default values otherwise.
+            connectivity (dict | None): ``couplerToQubitMap`` identifying
+                the benchmark's couplers. ``None`` fetches it along with the
+                benchmark, and otherwise numbers the couplers in
+                coupling-map order.
         """
         super().__init__()
         self.dt = DT
@@ -128,7 +150,8 @@ class AnyonTarget(Target, ABC):
         self.coupling_map = self.coupling_map()
         self.name = self.device_name()
 
-        qubit_properties, gate_properties = self.__get_qubit_properties__()
+        self.calibration = self.__load_calibration__(benchmark, connectivity)
+        qubit_properties, gate_properties = self.__properties__(self.calibration)
         self.qubit_properties = qubit_properties
 
         phi = Parameter("φ")
@@ -137,6 +160,94 @@ class AnyonTarget(Target, ABC):
         self.__set_single_qubit_gate_properties__(gate_properties)
         self.__set_two_qubit_gate_properties__(gate_properties)
 
+    def update_calibration(self, benchmark: dict = None, connectivity: dict = None):
+        """Update qubit and instruction properties in place from a benchmark.
+
+        The instruction set is left untouched: only ``QubitProperties`` and
+        the error rates of each instruction (through
+        ``update_instruction_properties``) change.
+
+        Args:
+            benchmark (dict | None): Benchmark response. ``None`` fetches it
+                through ``ApiAdapter`` when an adapter is initialized, and
+                restores default values otherwise.
+            connectivity (dict | None): ``couplerToQubitMap`` of the
+                benchmark's couplers. Default: fetched along with the
+                benchmark, or else the current one.
+        """
+        self.calibration = self.__load_calibration__(benchmark, connectivity)
+        qubit_properties, gate_properties = self.__properties__(self.calibration)
+        self.qubit_properties = qubit_properties
+        self._calibration_fingerprint = None
+
+        for gate in self.default_single_qubit_gates:
+            props = self.__single_qubit_properties__(gate, gate_properties)
+            for qargs, prop in props.items():
+                self.update_instruction_properties(gate.name, qargs, prop)
+        for qargs, prop in self.__cz_properties__(gate_properties).items():
+            self.update_instruction_properties("cz", qargs, prop)
+
+    def update_instruction_properties(self, instruction, qargs, properties):
+        """Update the properties of an instruction and reset the fingerprint.
+
+        See ``Target.update_instruction_properties``.
+        """
+        super().update_instruction_properties(instruction, qargs, properties)
+        self._calibration_fingerprint = None
+
+    def add_instruction(self, instruction, properties=None, name=None, **kwargs):
+        """Add an instruction and reset the fingerprint.
+
+        See ``Target.add_instruction``.
+        """
+        super().add_instruction(instruction, properties, name, **kwargs)
+        self._calibration_fingerprint = None
+
+    def calibration_fingerprint(self) -> str:
+        """Return a digest of the calibration data held by the target.
+
+        Covers qubit T1/T2 and the duration and error of every instruction,
+        so it changes whenever the target's calibration is updated. The
+        digest is computed once and reset by :meth:`update_calibration`,
+        :meth:`update_instruction_properties` and :meth:`add_instruction`;
+        assigning ``qubit_properties`` directly does not reset it.
+
+        Returns:
+            str: Hex SHA-1 digest.
+        """
+        fingerprint = getattr(self, "_calibration_fingerprint", None)
+        if fingerprint is None:
+            fingerprint = self._calibration_fingerprint = self._fingerprint()
+        return fingerprint
+
+    def _fingerprint(self) -> str:
+        """Compute the digest returned by :meth:`calibration_fingerprint`."""
+        digest = hashlib.sha1()
+        for props in self.qubit_properties or ():
+            digest.update(repr((props.t1, props.t2) if props else None).encode())
+        for name in sorted(self.operation_names):
+            for qargs, props in self[name].items():
+                entry = (name, qargs, props.duration, props.error) if props else name
+                digest.update(repr(entry).encode())
+        return digest.hexdigest()
+
+    def __getstate__(self) -> dict:
+        """Return the pickled state, including the device attributes.
+
+        ``Target.__getstate__`` only covers the instruction data; the
+        attributes set in :meth:`__init__` (``qubits``, ``coupling_map``,
+        ``name`` and the default gate lists) are added so that a target can
+        be shipped to worker processes without querying the API again.
+        """
+        state = super().__getstate__()
+        state["anyon"] = dict(self.__dict__)
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore a target pickled with :meth:`__getstate__`."""
+        self.__dict__.update(state.pop("anyon", {}))
+        super().__setstate__(state)
+
     def __set_two_qubit_gate_properties__(self, gate_properties):
         """Register two-qubit gates supported by the device.
 
@@ -146,15 +257,32 @@ class AnyonTarget(Target, ABC):
             gate_properties (dict): Dictionary containing calibrated gate error
                 rates.
         """
-        cz_props = {
-            edge: InstructionProperties(
+        self.add_instruction(CZGate(), self.__cz_properties__(gate_properties))
+
+    def __cz_properties__(self, gate_properties):
+        """Return the ``CZGate`` properties of every coupler.
+
+        Args:
+            gate_properties (dict): Dictionary containing calibrated gate error
+                rates.
+
+        Returns:
+            dict[tuple[int, int], InstructionProperties]: Properties per edge.
+        """
+        # Edges are matched to couplers by their qubits, not list positions
+        index = self.calibration.coupler_index
+        properties = {}
+        for edge in self.coupling_map:
+            coupler = int(index[edge])
+            properties[edge] = InstructionProperties(
                 duration=1e-7,
-                error=gate_properties["double"][q // 2],
+                error=(
+                    gate_properties["double"][coupler]
+                    if coupler >= 0
+                    else DEFAULT_CZ_ERROR
+                ),
             )
-            for q, edge in enumerate(self.coupling_map)
-        }
-
-        self.add_instruction(CZGate(), cz_props)
+        return properties
 
     def __set_single_qubit_gate_properties__(self, gate_properties):
         """Register single-qubit gates for all qubits.
@@ -167,49 +295,59 @@ class AnyonTarget(Target, ABC):
                 measurement errors.
         """
         for gate in self.default_single_qubit_gates:
+            self.add_instruction(
+                gate, self.__single_qubit_properties__(gate, gate_properties)
+            )
 
-            if isinstance(gate, Measure):
-
-                gate_props = {
-                    (q,): InstructionProperties(
-                        duration=4e-7,
-                        error=gate_properties["measure"][q],
-                    )
-                    for q in self.qubits
-                }
-
-            elif isinstance(
-                gate,
-                (
-                    RZGate,
-                    ZGate,
-                    TGate,
-                    TdgGate,
-                    PhaseGate,
-                ),
-            ):
-                gate_props = {
-                    (q,): InstructionProperties(duration=0, error=0)
-                    for q in self.qubits
-                }
-
-            elif isinstance(gate, Delay):
-                gate_props = {
-                    (q,): InstructionProperties(duration=None, error=0)
-                    for q in self.qubits
-                }
-
-            else:
-
-                gate_props = {
-                    (q,): InstructionProperties(
-                        duration=5e-8,
-                        error=gate_properties["single"][q],
-                    )
-                    for q in self.qubits
-                }
-
-            self.add_instruction(gate, gate_props)
+    def __single_qubit_properties__(self, gate, gate_properties):
+        """Return the properties of a single-qubit instruction on every qubit.
+
+        Args:
+            gate (Instruction): One of ``default_single_qubit_gates``.
+            gate_properties (dict): Dictionary containing single-qubit and
+                measurement errors.
+
+        Returns:
+            dict[tuple[int], InstructionProperties]: Properties per qubit.
+        """
+        if isinstance(gate, Measure):
+
+            return {
+                (q,): InstructionProperties(
+                    duration=4e-7,
+                    error=gate_properties["measure"][q],
+                )
+                for q in self.qubits
+            }
+
+        elif isinstance(
+            gate,
+            (
+                RZGate,
+                ZGate,
+                TGate,
+                TdgGate,
+                PhaseGate,
+            ),
+        ):
+            return {
+                (q,): InstructionProperties(duration=0, error=0) for q in self.qubits
+            }
+
+        elif isinstance(gate, Delay):
+            return {
+                (q,): InstructionProperties(duration=None, error=0) for q in self.qubits
+            }
+
+        else:
+
+            return {
+                (q,): InstructionProperties(
+                    duration=5e-8,
+                    error=gate_properties["single"][q],
+                )
+                for q in self.qubits
+            }
 
     def __define_default_gates__(self, phi):
         """Define the default gate set supported by Anyon devices.
@@ -237,80 +375,84 @@ class AnyonTarget(Target, ABC):
 
         self.default_two_qubit_gates = [CZGate()]
 
-    def __get_qubit_properties__(self):
-        """Retrieve device calibration data.
+    def __load_calibration__(
+        self, benchmark: dict = None, connectivity: dict = None
+    ) -> CalibrationTable:
+        """Parse device calibration data.
 
-        Calibration data is retrieved from the Anyon API when available.
-        If the API is unavailable, default error values are used.
+        Calibration data is taken from ``benchmark`` when given, otherwise
+        retrieved from the Anyon API (with the machine's
+        ``couplerToQubitMap``) when available. If the API is unavailable,
+        default error values are used.
 
-        Returns:
-            tuple[list[QubitProperties], dict]: A tuple containing:
+        Args:
+            benchmark (dict | None): Benchmark response, if already fetched.
+            connectivity (dict | None): ``couplerToQubitMap``, if already
+                fetched. Without one, the couplers of the current
+                calibration are kept, or else numbered in coupling-map
+                order (one per pair of directed edges).
 
-                * The list of qubit properties (T1, T2)
-                * A dictionary containing gate error information
+        Returns:
+            CalibrationTable: Calibration of the device's qubits and
+                couplers.
         """
-
-        gate_properties = {
-            "single": {},
-            "measure": {},
-            "double": {},
-        }
-
-        default_single_err = 1e-3
-        default_meas_err = 2e-2
-        default_cz_err = 2e-2
-
-        qubit_properties = [QubitProperties(t1=None, t2=None) for _ in self.qubits]
-
-        adapter = ApiAdapter.instance()
-
-        if adapter is not None:
-
+        if benchmark is None and ApiAdapter.instance() is not None:
             benchmark = ApiAdapter.get_benchmark(self.name.lower())
+            if connectivity is None:
+                connectivity = ApiAdapter.get_connectivity_for_machine(
+                    self.name.lower()
+                )
 
-            for i in self.qubits:
+        if connectivity is None:
+            current = getattr(self, "calibration", None)
+            connectivity = (
+                current.connectivity()
+                if current is not None
+                else self.coupling_map[::2]
+            )
 
-                qb = benchmark["resultsPerDevice"]["qubits"][str(i)]
+        return CalibrationTable.from_benchmark(
+            benchmark, len(self.qubits), connectivity
+        )
 
-                qubit_properties[i] = QubitProperties(
-                    t1=qb.get("t1", None),
-                    t2=qb.get("t2Echo", None),
-                )
+    def __get_qubit_properties__(self, benchmark: dict = None):
+        """Retrieve device calibration data.
 
-                gate_properties["single"][i] = 1 - qb.get(
-                    "parallelSingleQubitGateFidelity",
-                    1 - default_single_err,
-                )
+        Args:
+            benchmark (dict | None): Benchmark response, if already fetched
+                (see :meth:`__load_calibration__`).
 
-                gate_properties["measure"][i] = 1 - (
-                    (
-                        qb.get(
-                            "parallelReadoutState1Fidelity",
-                            1 - default_meas_err,
-                        )
-                        + qb.get(
-                            "parallelReadoutState0Fidelity",
-                            1 - default_meas_err,
-                        )
-                    )
-                    / 2
-                )
+        Returns:
+            tuple[list[QubitProperties], dict]: A tuple containing:
 
-            couplers = benchmark["resultsPerDevice"].get("couplers", {})
-            for idx in range(len(self.coupling_map)):
-                c = couplers.get(str(idx), {})
-                gate_properties["double"][idx] = 1 - c.get(
-                    "czGateFidelity",
-                    1 - default_cz_err,
-                )
+                * The list of qubit properties (T1, T2)
+                * A dictionary containing gate error information
+        """
+        return self.__properties__(self.__load_calibration__(benchmark))
 
-        else:
+    def __properties__(self, calibration: CalibrationTable):
+        """Convert a calibration table into Qiskit properties.
 
-            for i in self.qubits:
-                gate_properties["single"][i] = default_single_err
-                gate_properties["measure"][i] = default_meas_err
+        Args:
+            calibration (CalibrationTable): Device calibration.
 
-            for idx in range(len(self.coupling_map)):
-                gate_properties["double"][idx] = default_cz_err
+        Returns:
+            tuple[list[QubitProperties], dict]: Qubit properties (T1, T2,
+                ``None`` when unknown) and the ``"single"``, ``"measure"``
+                and ``"double"`` error rates keyed by qubit or coupler.
+        """
+        qubit_properties = [
+            QubitProperties(
+                t1=None if np.isnan(t1) else t1,
+                t2=None if np.isnan(t2) else t2,
+            )
+            for t1, t2 in zip(calibration.t1.tolist(), calibration.t2.tolist())
+        ]
+
+        gate_properties = {
+            "single": dict(enumerate((1 - calibration.single_fidelity).tolist())),
+            "measure": dict(enumerate((1 - calibration.readout_fidelity).tolist())),
+            "double": dict(enumerate((1 - calibration.cz_fidelity).tolist())),
+        }
 
         return qubit_properties, gate_properties
@@ -0,0 +1,345 @@
+"""
+Parsed calibration data of Anyon devices.
+
+A benchmark response nests every value under
+``resultsPerDevice -> qubits/couplers -> str(index)``. ``CalibrationTable``
+parses it once into read-only NumPy arrays indexed by physical qubit and
+coupler, which the target, readout mitigation and qubit selection all read
+from instead of walking the dictionaries again. Couplers are identified by
+the API's ``couplerToQubitMap``, and qubit-pair adjacency matrices give the
+coupler and CZ fidelity of any edge in O(1). All-pairs routing costs are
+computed on first use and kept with the table, i.e. once per calibration.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+import rustworkx as rx
+
+from qiskit_calculquebec.backends.targets.subgraphs import (
+    DEFAULT_MAX_SIZE,
+    SubgraphIndex,
+)
+
+#: Default single-qubit gate error when the benchmark has no value.
+DEFAULT_SINGLE_ERROR = 1e-3
+#: Default readout error (per prepared state) when the benchmark has no value.
+DEFAULT_READOUT_ERROR = 2e-2
+#: Default CZ error when the benchmark has no value.
+DEFAULT_CZ_ERROR = 2e-2
+
+# Lowest CZ fidelity used for routing costs, so that -log stays finite
+_MIN_FIDELITY = 1e-12
+
+
+def _read_only(values, dtype=np.float64) -> np.ndarray:
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+class CalibrationTable:
+    """Immutable per-qubit and per-coupler calibration arrays.
+
+    Arrays are indexed by physical qubit (``t1`` to ``readout1``), by
+    coupler (``cz_fidelity``, ``couplers`` and ``coupler_ids``) or by qubit
+    pair (``coupler_index`` and ``cz_fidelity_matrix``), and cannot be
+    written to. Missing coherence times are ``NaN``; missing fidelities take
+    the same defaults as the target.
+
+    Args:
+        t1 (array-like): T1 per qubit, in seconds.
+        t2 (array-like): T2 (echo) per qubit, in seconds.
+        single_fidelity (array-like): Parallel single-qubit gate fidelity
+            per qubit.
+        readout0 (array-like): P(0|0) per qubit.
+        readout1 (array-like): P(1|1) per qubit.
+        cz_fidelity (array-like): CZ fidelity per coupler.
+        couplers (array-like): ``(num_couplers, 2)`` qubit endpoints of each
+            coupler.
+        coupler_ids (array-like | None): API identifier of each coupler.
+            Default: ``0`` to ``num_couplers - 1``.
+
+    Example:
+        .. code-block:: python
+
+            table = backend.target.calibration
+            table.best_qubits(5)       # array of 5 qubit indices
+            table.readout_fidelity[3]  # mean readout fidelity of qubit 3
+            table.cz_fidelity_matrix[4, 8]  # CZ fidelity of edge (4, 8)
+    """
+
+    def __init__(
+        self,
+        t1,
+        t2,
+        single_fidelity,
+        readout0,
+        readout1,
+        cz_fidelity,
+        couplers,
+        coupler_ids=None,
+    ):
+        set_ = super().__setattr__
+        set_("t1", _read_only(t1))
+        set_("t2", _read_only(t2))
+        set_("single_fidelity", _read_only(single_fidelity))
+        set_("readout0", _read_only(readout0))
+        set_("readout1", _read_only(readout1))
+        set_("cz_fidelity", _read_only(cz_fidelity))
+        set_("couplers", _read_only(couplers, np.int64).reshape(-1, 2))
+        if coupler_ids is None:
+            coupler_ids = np.arange(len(self.couplers))
+        set_("coupler_ids", _read_only(coupler_ids, np.int64))
+
+        if not (
+            len(self.t1)
+            == len(self.t2)
+            == len(self.single_fidelity)
+            == len(self.readout0)
+            == len(self.readout1)
+        ):
+            raise ValueError("Per-qubit calibration arrays differ in length.")
+        if not len(self.cz_fidelity) == len(self.couplers) == len(self.coupler_ids):
+            raise ValueError("Per-coupler calibration arrays differ in length.")
+
+        set_("readout_fidelity", _read_only((self.readout0 + self.readout1) / 2))
+
+        # Symmetric qubit-pair lookups: coupler position (-1 if none) and
+        # CZ fidelity (NaN if none)
+        n = len(self.t1)
+        a, b = self.couplers[:, 0], self.couplers[:, 1]
+        if len(a) and (min(a.min(), b.min()) < 0 or max(a.max(), b.max()) >= n):
+            raise ValueError("Coupler endpoints must be qubits of the table.")
+        index = np.full((n, n), -1, dtype=np.int64)
+        index[a, b] = index[b, a] = np.arange(len(a))
+        fidelity = np.full((n, n), np.nan)
+        fidelity[a, b] = fidelity[b, a] = self.cz_fidelity
+        set_("coupler_index", _read_only(index, np.int64))
+        set_("cz_fidelity_matrix", _read_only(fidelity))
+
+        digest = hashlib.blake2b(digest_size=20)
+        for array in (
+            self.t1,
+            self.t2,
+            self.single_fidelity,
+            self.readout0,
+            self.readout1,
+            self.cz_fidelity,
+            self.couplers,
+            self.coupler_ids,
+        ):
+            digest.update(array.tobytes())
+        set_("fingerprint", digest.hexdigest())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CalibrationTable is immutable.")
+
+    def __reduce__(self):
+        # Rebuilt through __init__, so unpickled arrays are read-only too
+        return (
+            CalibrationTable,
+            (
+                self.t1,
+                self.t2,
+                self.single_fidelity,
+                self.readout0,
+                self.readout1,
+                self.cz_fidelity,
+                self.couplers,
+                self.coupler_ids,
+            ),
+        )
+
+    @classmethod
+    def from_benchmark(
+        cls, benchmark: dict | None, num_qubits: int, couplers=()
+    ) -> "CalibrationTable":
+        """Parse a benchmark response.
+
+        Args:
+            benchmark (dict | None): Benchmark response. ``None`` gives the
+                default calibration.
+            num_qubits (int): Number of physical qubits.
+            couplers (dict | list[tuple[int, int]]): Qubit endpoints of each
+                coupler: a ``couplerToQubitMap`` (coupler ID to qubit pair),
+                or a list whose positions are the coupler IDs.
+
+        Returns:
+            CalibrationTable: The parsed calibration.
+        """
+        if isinstance(couplers, dict):
+            coupler_ids = sorted(couplers, key=int)
+            couplers = [tuple(couplers[i]) for i in coupler_ids]
+            coupler_ids = [int(i) for i in coupler_ids]
+        else:
+            couplers = [tuple(c) for c in couplers]
+            coupler_ids = list(range(len(couplers)))
+        devices = (benchmark or {}).get("resultsPerDevice", {})
+        qubits_data = devices.get("qubits", {})
+        couplers_data = devices.get("couplers", {})
+
+        qubits = [qubits_data.get(str(i), {}) for i in range(num_qubits)]
+        nan = float("nan")
+
+        def column(key, default):
+            return [default if (v := qb.get(key)) is None else v for qb in qubits]
+
+        return cls(
+            t1=column("t1", nan),
+            t2=column("t2Echo", nan),
+            single_fidelity=column(
+                "parallelSingleQubitGateFidelity", 1 - DEFAULT_SINGLE_ERROR
+            ),
+            readout0=column("parallelReadoutState0Fidelity", 1 - DEFAULT_READOUT_ERROR),
+            readout1=column("parallelReadoutState1Fidelity", 1 - DEFAULT_READOUT_ERROR),
+            cz_fidelity=[
+                couplers_data.get(str(i), {}).get(
+                    "czGateFidelity", 1 - DEFAULT_CZ_ERROR
+                )
+                for i in coupler_ids
+            ],
+            couplers=couplers,
+            coupler_ids=coupler_ids,
+        )
+
+    def connectivity(self) -> dict:
+        """Return the couplers as a ``couplerToQubitMap``.
+
+        Returns:
+            dict[str, list[int]]: Coupler ID to qubit pair.
+        """
+        return {
+            str(i): pair
+            for i, pair in zip(self.coupler_ids.tolist(), self.couplers.tolist())
+        }
+
+    @property
+    def num_qubits(self) -> int:
+        """Number of physical qubits."""
+        return len(self.t1)
+
+    @property
+    def num_couplers(self) -> int:
+        """Number of couplers."""
+        return len(self.couplers)
+
+    def edge_fidelity(self, a: int, b: int) -> float:
+        """Return the CZ fidelity between two qubits.
+
+        Args:
+            a (int): First qubit.
+            b (int): Second qubit.
+
+        Returns:
+            float: CZ fidelity, or ``NaN`` if the qubits are not coupled.
+        """
+        return float(self.cz_fidelity_matrix[a, b])
+
+    def routing_costs(self) -> np.ndarray:
+        """Return the all-pairs shortest-path routing costs.
+
+        Each coupler costs ``-log(cz_fidelity)``, so the cost of a path is
+        minus the log of the product of its CZ fidelities. Computed with
+        Floyd-Warshall on first call and cached with the table.
+
+        Returns:
+            np.ndarray: Read-only ``(num_qubits, num_qubits)`` matrix of
+                costs; ``inf`` between disconnected qubits and ``0`` on the
+                diagonal.
+        """
+        costs = self.__dict__.get("_routing_costs")
+        if costs is None:
+            graph = rx.PyGraph()
+            graph.add_nodes_from(range(self.num_qubits))
+            weights = -np.log(np.clip(self.cz_fidelity, _MIN_FIDELITY, 1.0))
+            graph.add_edges_from(
+                [
+                    (a, b, w)
+                    for (a, b), w in zip(self.couplers.tolist(), weights.tolist())
+                ]
+            )
+            costs = rx.floyd_warshall_numpy(graph, weight_fn=float)
+            costs.setflags(write=False)
+            super().__setattr__("_routing_costs", costs)
+        return costs
+
+    def path_fidelity(self, a: int, b: int) -> float:
+        """Return the CZ fidelity product of the best path between two qubits.
+
+        Args:
+            a (int): First qubit.
+            b (int): Second qubit.
+
+        Returns:
+            float: ``exp(-routing_costs()[a, b])``; ``1`` if ``a == b`` and
+                ``0`` if the qubits are disconnected.
+        """
+        return float(np.exp(-self.routing_costs()[a, b]))
+
+    def subgraph_index(self, max_size: int = DEFAULT_MAX_SIZE) -> SubgraphIndex:
+        """Return the ranked connected qubit subsets of the device.
+
+        Built on first call for each ``max_size`` and cached with the table,
+        i.e. once per calibration.
+
+        Args:
+            max_size (int): Largest subset size to index. Default: 8.
+
+        Returns:
+            SubgraphIndex: The index.
+        """
+        indexes = self.__dict__.get("_subgraph_indexes")
+        if indexes is None:
+            indexes = {}
+            super().__setattr__("_subgraph_indexes", indexes)
+        index = indexes.get(max_size)
+        if index is None:
+            index = indexes[max_size] = SubgraphIndex(self, max_size)
+        return index
+
+    def qubit_scores(self) -> np.ndarray:
+        """Return a per-qubit quality score.
+
+        The score is the probability of a single-qubit gate followed by a
+        measurement succeeding: ``single_fidelity * readout_fidelity``.
+
+        Returns:
+            np.ndarray: Score per qubit, in ``[0, 1]``.
+        """
+        return self.single_fidelity * self.readout_fidelity
+
+    def best_qubits(self, k: int) -> np.ndarray:
+        """Return the ``k`` qubits with the highest :meth:`qubit_scores`.
+
+        Qubits are not required to be connected.
+
+        Args:
+            k (int): Number of qubits.
+
+        Returns:
+            np.ndarray: Qubit indices, best first.
+
+        Raises:
+            ValueError: If ``k`` is not between 1 and ``num_qubits``.
+        """
+        if not 1 <= k <= self.num_qubits:
+            raise ValueError(f"k must be between 1 and {self.num_qubits}, got {k}.")
+        # Equal scores: lowest index first
+        return np.lexsort((np.arange(self.num_qubits), -self.qubit_scores()))[:k]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CalibrationTable):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+    def __repr__(self) -> str:
+        return (
+            f"CalibrationTable(num_qubits={self.num_qubits}, "
+            f"num_couplers={self.num_couplers}, fingerprint={self.fingerprint[:12]})"
+        )
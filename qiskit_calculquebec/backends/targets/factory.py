@@ -0,0 +1,254 @@
+"""
+Memoised construction of Anyon hardware targets.
+
+Building a ``MonarQ`` or ``Yukon`` target parses the whole benchmark into
+``InstructionProperties`` and ``QubitProperties``. ``get_target`` builds
+each (machine, benchmark) combination once per process and, optionally,
+once per cache directory: later backends reuse the same target object, and
+other processes load it from a pickle instead of rebuilding it. Only the
+most recently used targets of each machine are kept in memory, so a
+long-running process refreshing its calibration does not accumulate them.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+
+import qiskit
+from qiskit_calculquebec.API.adapter import ApiAdapter
+from qiskit_calculquebec.backends.targets.anyon_target import AnyonTarget
+from qiskit_calculquebec.backends.targets.monarq import MonarQ
+from qiskit_calculquebec.backends.targets.yukon import Yukon
+from qiskit_calculquebec.custom_gates.equivalences import register_equivalences
+
+# Machine name -> (target class, device name of its targets)
+_MACHINES = {
+    "yukon": (Yukon, "Yukon"),
+    "monarq": (MonarQ, "yamaska"),
+}
+
+#: Number of targets kept in memory per machine.
+MAX_TARGETS_PER_MACHINE = 4
+
+# Least recently used first
+_targets = {}
+_lock = threading.Lock()
+
+
+def benchmark_fingerprint(benchmark: dict | None) -> str:
+    """Return a digest identifying a benchmark response.
+
+    Args:
+        benchmark (dict | None): Benchmark response. ``None`` stands for the
+            default calibration used when no API is available.
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON encoding.
+    """
+    encoded = json.dumps(benchmark, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def device_name(machine_name: str) -> str:
+    """Return the device name of a machine's target without building it.
+
+    Args:
+        machine_name (str): ``"monarq"`` or ``"yukon"`` (case-insensitive).
+
+    Returns:
+        str: ``AnyonTarget.name`` of the machine (``"yamaska"`` for MonarQ,
+            ``"Yukon"`` for Yukon).
+
+    Raises:
+        ValueError: If ``machine_name`` is not supported.
+    """
+    return _MACHINES[_machine(machine_name)][1]
+
+
+def get_target(
+    machine_name: str,
+    cache_dir: str = None,
+    benchmark: dict = None,
+    connectivity: dict = None,
+) -> AnyonTarget:
+    """Return the target of a machine for its current benchmark.
+
+    The benchmark and the machine's ``couplerToQubitMap`` are fetched
+    through ``ApiAdapter`` (which caches them), and the target built from
+    them is memoised per (machine, benchmark fingerprint, connectivity
+    fingerprint). The returned target is shared: do not modify it.
+
+    Args:
+        machine_name (str): ``"monarq"`` or ``"yukon"`` (case-insensitive).
+        cache_dir (str | None): Directory where targets are pickled, so
+            that other processes can load them instead of rebuilding them.
+            Default: in-process memoisation only.
+        benchmark (dict | None): Benchmark to build the target from instead
+            of fetching it (e.g. from a calibration snapshot).
+        connectivity (dict | None): ``couplerToQubitMap`` going with
+            ``benchmark``. Only fetched when ``benchmark`` is.
+
+    Returns:
+        AnyonTarget: The machine's target.
+
+    Raises:
+        ValueError: If ``machine_name`` is not supported.
+    """
+    machine = _machine(machine_name)
+    target_class, name = _MACHINES[machine]
+
+    if benchmark is None and ApiAdapter.instance() is not None:
+        # Same name the target itself would fetch its benchmark with
+        benchmark = ApiAdapter.get_benchmark(name.lower())
+        if connectivity is None:
+            connectivity = ApiAdapter.get_connectivity_for_machine(name.lower())
+    key = (
+        machine,
+        benchmark_fingerprint(benchmark),
+        benchmark_fingerprint(connectivity),
+    )
+
+    with _lock:
+        target = _targets.get(key)
+        if target is not None:
+            _remember(key, target)
+            return target
+
+        path = None
+        if cache_dir is not None:
+            path = _pickle_path(cache_dir, *key)
+            target = _load(path)
+            if target is not None:
+                # Unpickled targets skip AnyonTarget.__init__
+                register_equivalences()
+
+        if target is None:
+            target = target_class(benchmark, connectivity)
+            if path is not None:
+                _dump(path, target)
+
+        _remember(key, target)
+        return target
+
+
+def refresh_target(
+    machine_name: str,
+    target: AnyonTarget,
+    benchmark: dict | None,
+    cache_dir: str = None,
+    connectivity: dict = None,
+) -> AnyonTarget:
+    """Return the target of a machine for a new benchmark, derived from ``target``.
+
+    ``target`` is shared by every backend built for its benchmark, including
+    snapshot-pinned ones, so it is left untouched: a copy is updated for
+    ``benchmark`` and memoised under its fingerprint. Only the callers that
+    switch to the returned target see the new calibration.
+
+    Args:
+        machine_name (str): ``"monarq"`` or ``"yukon"`` (case-insensitive).
+        target (AnyonTarget): Target returned by :func:`get_target`.
+        benchmark (dict | None): New benchmark response. ``None`` restores
+            the default calibration.
+        cache_dir (str | None): Directory where the new target is pickled.
+            Default: in-process memoisation only.
+        connectivity (dict | None): ``couplerToQubitMap`` going with
+            ``benchmark``. Default: keep the target's couplers.
+
+    Returns:
+        AnyonTarget: The memoised target for ``benchmark``. A new object
+            unless that benchmark was already memoised.
+
+    Raises:
+        ValueError: If ``machine_name`` is not supported.
+    """
+    # The copy keeps the couplers of ``target`` when none are given
+    key = (
+        _machine(machine_name),
+        benchmark_fingerprint(benchmark),
+        benchmark_fingerprint(
+            connectivity
+            if connectivity is not None
+            else target.calibration.connectivity()
+        ),
+    )
+
+    with _lock:
+        refreshed = _targets.get(key)
+        if refreshed is not None:
+            _remember(key, refreshed)
+            return refreshed
+
+        refreshed = copy.deepcopy(target)
+        refreshed.update_calibration(benchmark, connectivity)
+        if cache_dir is not None:
+            _dump(_pickle_path(cache_dir, *key), refreshed)
+
+        _remember(key, refreshed)
+        return refreshed
+
+
+def _remember(key: tuple, target: AnyonTarget):
+    """Memoise ``target`` as the most recently used one of its machine.
+
+    Evicts the least recently used targets of the machine beyond
+    :data:`MAX_TARGETS_PER_MACHINE`. Must be called with the lock held.
+    """
+    _targets.pop(key, None)
+    _targets[key] = target
+    machine_keys = [k for k in _targets if k[0] == key[0]]
+    for stale in machine_keys[:-MAX_TARGETS_PER_MACHINE]:
+        del _targets[stale]
+
+
+def _machine(machine_name: str) -> str:
+    machine = machine_name.lower()
+    if machine not in _MACHINES:
+        raise ValueError(
+            f"Unsupported machine name: {machine_name} please choose 'yukon' or 'monarq'."
+        )
+    return machine
+
+
+def clear_target_cache():
+    """Forget every memoised target of this process."""
+    with _lock:
+        _targets.clear()
+
+
+def _pickle_path(cache_dir: str, machine: str, *fingerprints: str) -> str:
+    # Pickled targets are only valid for the Qiskit version that wrote them
+    digest = hashlib.sha256(
+        ":".join([*fingerprints, qiskit.__version__]).encode()
+    ).hexdigest()
+    return os.path.join(os.path.expanduser(cache_dir), f"{machine}-{digest}.pickle")
+
+
+def _load(path: str) -> AnyonTarget | None:
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Corrupt or incompatible pickle: rebuild and overwrite it
+        return None
+
+
+def _dump(path: str, target: AnyonTarget):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(target, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
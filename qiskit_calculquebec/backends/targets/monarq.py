@@ -135,7 +135,7 @@ class MonarQ(AnyonTarget):
         """
         return "yamaska"
 
-    def __init__(self):
+    def __init__(self, benchmark: dict = None, connectivity: dict = None):
         """Initialize the MonarQ target.
 
         This constructor delegates initialization to ``AnyonTarget``,
@@ -144,5 +144,11 @@ class MonarQ(AnyonTarget):
         * Builds the supported gate set
         * Registers instruction properties
         * Loads calibration data when available
+
+        Args:
+            benchmark (dict | None): Benchmark response to take calibration
+                data from. See ``AnyonTarget.__init__``.
+            connectivity (dict | None): ``couplerToQubitMap`` of the
+                benchmark's couplers. See ``AnyonTarget.__init__``.
         """
-        super().__init__()
+        super().__init__(benchmark, connectivity)
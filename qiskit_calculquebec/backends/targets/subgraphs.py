@@ -0,0 +1,231 @@
+"""
+Index of the best connected qubit subsets of a device.
+
+Picking physical qubits for an ``n``-qubit circuit means finding a
+connected set of ``n`` qubits with good gates and readout. ``SubgraphIndex``
+enumerates every connected induced subgraph up to a maximum size once per
+calibration, scores them all with NumPy, and keeps them ranked, so that the
+best subset of any indexed size is a lookup.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+#: Largest subgraph size indexed by default (about 11 000 subgraphs and a
+#: few tens of milliseconds on MonarQ).
+DEFAULT_MAX_SIZE = 8
+
+# Lowest fidelity used in scores, so that logs stay finite
+_MIN_FIDELITY = 1e-12
+
+
+class SubgraphIndex:
+    """Ranked connected qubit subsets of a calibrated device.
+
+    The log-fidelity of a subset sums, over its qubits, the log of
+    ``single_fidelity * readout_fidelity``, plus ``n - 1`` times the mean
+    log CZ fidelity of the couplers inside the subset (the CZ cost of a
+    spanning tree, so denser subsets are not penalised for having more
+    couplers).
+
+    Args:
+        calibration (CalibrationTable): Device calibration.
+        max_size (int): Largest subset size to enumerate. Default: 8.
+
+    Example:
+        .. code-block:: python
+
+            index = backend.target.calibration.subgraph_index()
+            qubits = index.best(5)            # best connected 5 qubits
+            regions = index.disjoint(3, 4)    # 4 disjoint 3-qubit regions
+    """
+
+    def __init__(self, calibration, max_size: int = DEFAULT_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}.")
+        self.num_qubits = calibration.num_qubits
+        self.max_size = min(max_size, self.num_qubits)
+
+        self._qubit_log = np.log(
+            np.clip(calibration.qubit_scores(), _MIN_FIDELITY, 1.0)
+        )
+        # Uncoupled pairs (NaN fidelity) contribute log(1) = 0
+        self._cz_log = np.log(
+            np.clip(
+                np.nan_to_num(calibration.cz_fidelity_matrix, nan=1.0),
+                _MIN_FIDELITY,
+                1.0,
+            )
+        )
+        coupled = calibration.coupler_index >= 0
+        self._coupled = coupled
+        self._neighbors = [
+            set(np.flatnonzero(coupled[q]).tolist()) for q in range(self.num_qubits)
+        ]
+
+        # size -> (subsets sorted best first, their log-fidelities)
+        self._ranked = {}
+        for size, subsets in self._enumerate().items():
+            subsets = np.array(subsets, dtype=np.int64).reshape(-1, size)
+            scores = self._scores(subsets)
+            order = np.argsort(-scores, kind="stable")
+            subsets = subsets[order]
+            scores = scores[order]
+            subsets.setflags(write=False)
+            scores.setflags(write=False)
+            self._ranked[size] = (subsets, scores)
+
+        self._grown = {}
+
+    def _enumerate(self) -> dict:
+        """Return every connected induced subgraph, grouped by size.
+
+        Uses the ESU algorithm: each subgraph is grown from its smallest
+        qubit and reached exactly once.
+        """
+        found = {size: [] for size in range(1, self.max_size + 1)}
+        neighbors = self._neighbors
+        max_size = self.max_size
+
+        def extend(subset, extension, root, neighborhood):
+            found[len(subset)].append(subset)
+            if len(subset) == max_size:
+                return
+            extension = set(extension)
+            while extension:
+                w = extension.pop()
+                extend(
+                    subset + (w,),
+                    extension
+                    | {u for u in neighbors[w] if u > root and u not in neighborhood},
+                    root,
+                    neighborhood | neighbors[w],
+                )
+
+        for root in range(self.num_qubits):
+            extend(
+                (root,),
+                {u for u in neighbors[root] if u > root},
+                root,
+                neighbors[root] | {root},
+            )
+        return {size: subsets for size, subsets in found.items() if subsets}
+
+    def _scores(self, subsets: np.ndarray) -> np.ndarray:
+        """Return the log-fidelity of each row of ``subsets``."""
+        size = subsets.shape[1]
+        scores = self._qubit_log[subsets].sum(axis=1)
+        if size > 1:
+            rows = subsets[:, :, None]
+            cols = subsets[:, None, :]
+            # Each coupler appears twice in the symmetric submatrix
+            cz = self._cz_log[rows, cols].sum(axis=(1, 2)) / 2
+            edges = self._coupled[rows, cols].sum(axis=(1, 2)) / 2
+            scores = scores + (size - 1) * cz / edges
+        return scores
+
+    def fidelity(self, qubits) -> float:
+        """Return the score of any qubit subset, as a fidelity.
+
+        Args:
+            qubits (list[int]): Connected physical qubits.
+
+        Returns:
+            float: ``exp`` of the subset's log-fidelity.
+        """
+        return float(np.exp(self._scores(np.array([list(qubits)], dtype=np.int64))[0]))
+
+    def top(self, n: int, count: int = None) -> list:
+        """Return the best connected ``n``-qubit subsets with their fidelity.
+
+        Args:
+            n (int): Subset size, at most :attr:`max_size`.
+            count (int | None): Number of subsets. Default: all of them.
+
+        Returns:
+            list[tuple[list[int], float]]: Subsets (qubits in ascending
+                order) and fidelities, best first.
+
+        Raises:
+            ValueError: If ``n`` is not between 1 and :attr:`max_size`, or
+                no connected subset of ``n`` qubits exists.
+        """
+        subsets, scores = self._sized(n)
+        subsets, scores = subsets[:count], scores[:count]
+        return [
+            (sorted(qubits), fidelity)
+            for qubits, fidelity in zip(subsets.tolist(), np.exp(scores).tolist())
+        ]
+
+    def best(self, n: int) -> list:
+        """Return the best connected subset of ``n`` qubits.
+
+        Sizes up to :attr:`max_size` are looked up. Larger subsets are grown
+        from the best indexed one by repeatedly adding the neighbouring
+        qubit that keeps the highest score, and memoised.
+
+        Args:
+            n (int): Number of qubits.
+
+        Returns:
+            list[int]: Qubits, in ascending order.
+
+        Raises:
+            ValueError: If ``n`` is not between 1 and the number of qubits,
+                or no connected subset of ``n`` qubits exists.
+        """
+        if n <= self.max_size:
+            return sorted(self._sized(n)[0][0].tolist())
+        if n > self.num_qubits:
+            raise ValueError(f"n must be between 1 and {self.num_qubits}, got {n}.")
+
+        grown = self._grown.get(n)
+        if grown is None:
+            subset = set(self.best(n - 1))
+            frontier = set().union(*(self._neighbors[q] for q in subset)) - subset
+            if not frontier:
+                raise ValueError(f"No connected subset of {n} qubits exists.")
+            candidates = sorted(frontier)
+            scores = self._scores(
+                np.array([sorted(subset | {q}) for q in candidates], dtype=np.int64)
+            )
+            subset.add(candidates[int(np.argmax(scores))])
+            grown = self._grown[n] = sorted(subset)
+        return list(grown)
+
+    def disjoint(self, n: int, count: int) -> list:
+        """Return up to ``count`` disjoint ``n``-qubit subsets, best first.
+
+        Subsets are picked greedily from the ranking, skipping any that
+        shares a qubit with an already picked one. Useful to run several
+        small circuits side by side.
+
+        Args:
+            n (int): Subset size, at most :attr:`max_size`.
+            count (int): Maximum number of subsets.
+
+        Returns:
+            list[list[int]]: Disjoint subsets (qubits in ascending order).
+
+        Raises:
+            ValueError: If ``n`` is not between 1 and :attr:`max_size`, or
+                no connected subset of ``n`` qubits exists.
+        """
+        subsets, _ = self._sized(n)
+        used = np.zeros(self.num_qubits, dtype=bool)
+        picked = []
+        for qubits in subsets:
+            if len(picked) == count:
+                break
+            if not used[qubits].any():
+                used[qubits] = True
+                picked.append(sorted(qubits.tolist()))
+        return picked
+
+    def _sized(self, n: int) -> tuple:
+        if not 1 <= n <= self.max_size:
+            raise ValueError(f"n must be between 1 and {self.max_size}, got {n}.")
+        if n not in self._ranked:
+            raise ValueError(f"No connected subset of {n} qubits exists.")
+        return self._ranked[n]
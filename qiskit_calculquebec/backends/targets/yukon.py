@@ -76,7 +76,7 @@ class Yukon(AnyonTarget):
         """
         return "Yukon"
 
-    def __init__(self):
+    def __init__(self, benchmark: dict = None, connectivity: dict = None):
         """Initialize the Yukon target.
 
         This constructor delegates initialization to ``AnyonTarget``,
@@ -85,5 +85,11 @@ class Yukon(AnyonTarget):
         * Builds the instruction set
         * Registers gate properties
         * Retrieves calibration data when available
+
+        Args:
+            benchmark (dict | None): Benchmark response to take calibration
+                data from. See ``AnyonTarget.__init__``.
+            connectivity (dict | None): ``couplerToQubitMap`` of the
+                benchmark's couplers. See ``AnyonTarget.__init__``.
         """
-        super().__init__()
+        super().__init__(benchmark, connectivity)
@@ -6,13 +6,29 @@ multiple single-circuit jobs and aggregates their results into one
 Qiskit ``Result`` object.
 """
 
+import functools
+import threading
 import time
+import uuid
+import warnings
 from qiskit.providers import JobV1 as Job
 from qiskit.providers import JobError, JobTimeoutError
 from qiskit.providers.jobstatus import JobStatus
 from qiskit.result import Result
-from qiskit_calculquebec.API.job import Job as CQJob
-from qiskit_calculquebec.API.adapter import ApiAdapter
+from qiskit_calculquebec.API.job import Job as CQJob, JobException
+from qiskit_calculquebec.API.adapter import ApiAdapter, ApiException
+from qiskit_calculquebec.API.api_utility import ApiUtility
+from qiskit_calculquebec.backends.utils.journal import (
+    JobJournal,
+    NOT_SUBMITTED,
+    SUBMITTING,
+    TERMINAL_STATUSES,
+)
+from qiskit_calculquebec.backends.utils.scheduler import (
+    Priority,
+    ScheduledBatch,
+    SubmissionScheduler,
+)
 
 
 class MonarQJob(Job):
@@ -25,16 +41,48 @@ class MonarQJob(Job):
         backend (MonarQBackend): The backend this job was submitted to.
         job_id (str | None): Existing job ID to track. If ``None``, the
             circuit is submitted immediately and the returned ID is stored.
-        circuits (list[QuantumCircuit] | None): List containing exactly one
-            circuit. Required when ``job_id`` is ``None``.
+        circuits (list[QuantumCircuit | dict] | None): List containing exactly
+            one circuit, or its Thunderhead circuit dict. Required when
+            ``job_id`` is ``None``.
         shots (int): Number of shots. Default: 1000.
+        journal (JobJournal | None): If provided, the submission and every
+            terminal status are recorded in this journal.
+        batch_id (str | None): ID of the ``MultiMonarQJob`` this job belongs
+            to, recorded in the journal.
+        index (int | None): Position of the circuit within its batch,
+            recorded in the journal. When set, a ``SUBMITTING`` intent entry
+            is journaled before the circuit is posted.
+        result_store (ResultStore | None): If provided, terminal responses
+            are recorded in this store, and :meth:`result` is served from it
+            without polling the API when the job is already stored.
     """
 
-    def __init__(self, backend, job_id=None, circuits=None, shots=1000):
+    def __init__(
+        self,
+        backend,
+        job_id=None,
+        circuits=None,
+        shots=1000,
+        journal=None,
+        batch_id=None,
+        index=None,
+        result_store=None,
+    ):
         super().__init__(backend, job_id)
         self._backend = backend
         self.circuits = circuits or []
         self.shots = shots
+        self._journal = journal
+        self._batch_id = batch_id
+        self._index = index
+        self._journaled_status = None
+        self._result_store = result_store
+        self._fingerprint = None
+        self._cancel_event = threading.Event()
+        # When the benchmark was fetched: the API gives no measurement time
+        self._calibration_fetched_at = (
+            ApiAdapter._last_update.isoformat() if ApiAdapter._last_update else None
+        )
 
         if job_id is None:
             self._job_id = self._submit_circuit()
@@ -53,11 +101,112 @@ class MonarQJob(Job):
         if not self.circuits or len(self.circuits) != 1:
             raise ValueError("MonarQJob can only submit one circuit at a time.")
 
-        return CQJob(self.circuits[0], self.shots).run_getID()
+        job = CQJob(self.circuits[0], self.shots)
+        if self._journal is not None or self._result_store is not None:
+            self._fingerprint = job.fingerprint()
+        # Only indexed entries can be matched with the job ID recorded later
+        intent = self._journal is not None and self._index is not None
+        if intent:
+            self._record_submission(SUBMITTING)
+        try:
+            job_id = job.run_getID()
+        except (ApiException, JobException, ValueError):
+            # The scheduler answered: no job was created
+            if intent:
+                self._record_submission(NOT_SUBMITTED)
+            raise
+        if self._journal is not None:
+            self._journal.record(
+                job_id,
+                fingerprint=self._fingerprint,
+                shots=self.shots,
+                batch=self._batch_id,
+                index=self._index,
+            )
+            self._journaled_status = "SUBMITTED"
+        return job_id
+
+    def _record_submission(self, status: str):
+        """Record a journal entry for this circuit before it has a job ID.
+
+        Args:
+            status (str): ``SUBMITTING`` or ``NOT_SUBMITTED``.
+        """
+        self._journal.record(
+            None,
+            fingerprint=self._fingerprint,
+            shots=self.shots,
+            status=status,
+            batch=self._batch_id,
+            index=self._index,
+        )
+
+    def _record_status(self, status: str):
+        """Record a terminal status in the journal, once per status change.
+
+        Args:
+            status (str): Status type returned by the API.
+        """
+        if (
+            self._journal is None
+            or status not in TERMINAL_STATUSES
+            or status == self._journaled_status
+        ):
+            return
+        self._journal.record(
+            self._job_id,
+            shots=self.shots,
+            status=status,
+            batch=self._batch_id,
+            index=self._index,
+        )
+        self._journaled_status = status
+
+    def _store_response(self, response: dict):
+        """Record a terminal API response in the result store, if any.
+
+        Args:
+            response (dict): Full ``GET /jobs/{id}`` response JSON.
+        """
+        if self._result_store is None:
+            return
+        adapter = ApiAdapter.instance()
+        client = adapter.client if adapter is not None else None
+        self._result_store.record(
+            self._job_id,
+            response,
+            circuit_hash=self._fingerprint,
+            machine=str(client.machine_name) if client is not None else None,
+            project=str(client.project_id) if client is not None else None,
+            calibration_fetched_at=self._calibration_fetched_at,
+            batch=self._batch_id,
+            batch_index=self._index,
+        )
+
+    def _fetch(self) -> dict:
+        """Return the job's API response, from the result store when possible.
+
+        Returns:
+            dict: Full ``GET /jobs/{id}`` response JSON.
+        """
+        if self._result_store is not None:
+            stored = self._result_store.get(self._job_id)
+            if stored is not None:
+                return stored
+
+        result = ApiAdapter.job_by_id(self._job_id).json()
+        status = result["job"]["status"]["type"]
+        self._record_status(status)
+        if status in TERMINAL_STATUSES:
+            self._store_response(result)
+        return result
 
     def _wait_for_result(self, timeout=None, wait=5) -> dict:
         """Poll the API until the job completes or fails.
 
+        The API is always polled at least once, so a job that has already
+        finished is returned even when ``timeout`` is zero.
+
         Args:
             timeout (float | None): Maximum number of seconds to wait. ``None``
                 means no timeout.
@@ -68,25 +217,31 @@ class MonarQJob(Job):
 
         Raises:
             JobTimeoutError: If ``timeout`` is exceeded before the job completes.
-            JobError: If the job status is ``"FAILED"``.
+            JobError: If the job status is ``"FAILED"`` or the job was
+                cancelled.
         """
         start_time = time.time()
 
         while True:
-            elapsed = time.time() - start_time
-            if timeout and elapsed >= timeout:
-                raise JobTimeoutError("Timed out waiting for result.")
-
-            response = ApiAdapter.job_by_id(self._job_id)
-            result = response.json()
+            result = self._fetch()
             status = result["job"]["status"]["type"]
 
             if status == "SUCCEEDED":
                 break
             elif status == "FAILED":
                 raise JobError("Job execution failed.")
+            elif status == "CANCELLED" or self._cancel_event.is_set():
+                raise JobError("Job was cancelled.")
 
-            time.sleep(wait)
+            sleep = wait
+            if timeout is not None:
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
+                    raise JobTimeoutError("Timed out waiting for result.")
+                sleep = min(wait, remaining)
+
+            # Returns early when cancel() is called
+            self._cancel_event.wait(sleep)
 
         return result
 
@@ -99,7 +254,7 @@ class MonarQJob(Job):
 
         Args:
             timeout (float | None): Maximum seconds to wait. ``None`` means
-                no timeout.
+                no timeout; ``0`` polls the job once.
             wait (float): Seconds between polling attempts. Default: 5.
 
         Returns:
@@ -139,8 +294,7 @@ class MonarQJob(Job):
             JobStatus: One of ``RUNNING``, ``DONE``, ``QUEUED``,
                 ``CANCELLED``, or ``ERROR``.
         """
-        response = ApiAdapter.job_by_id(self._job_id)
-        status_str = response.json()["job"]["status"]["type"]
+        status_str = self._fetch()["job"]["status"]["type"]
 
         mapping = {
             "RUNNING": JobStatus.RUNNING,
@@ -150,6 +304,24 @@ class MonarQJob(Job):
         }
         return mapping.get(status_str, JobStatus.ERROR)
 
+    def cancel(self) -> bool:
+        """Stop polling this job and ask the scheduler to cancel it.
+
+        Any thread blocked in :meth:`result` returns immediately with a
+        ``JobError``.
+
+        Returns:
+            bool: ``True`` if the scheduler accepted the cancellation,
+                ``False`` if it refused it (e.g. the job already finished or
+                the server does not support cancellation).
+        """
+        self._cancel_event.set()
+        try:
+            ApiAdapter.cancel_job(self._job_id)
+        except ApiException:
+            return False
+        return True
+
     def submit(self) -> Result:
         """Alias for :meth:`result`. Triggers result retrieval."""
         return self.result()
@@ -162,54 +334,343 @@ class MultiMonarQJob(Job):
     each circuit as a separate ``MonarQJob`` and aggregates the results into
     a single Qiskit ``Result`` object.
 
+    Circuits are handed to a
+    :class:`~qiskit_calculquebec.backends.utils.scheduler.SubmissionScheduler`
+    and submitted in the background, so the constructor returns
+    immediately; :meth:`cancel` drops the circuits not submitted yet and
+    cancels every child job.
+
     Args:
         backend (MonarQBackend): The backend this job was submitted to.
-        circuits (list[QuantumCircuit]): Circuits to execute sequentially.
-        job_id (str | None): Optional composite job ID. Default: ``"multi_job"``.
+        circuits (list[QuantumCircuit | dict]): Circuits (or Thunderhead
+            circuit dicts) to execute sequentially.
+        job_id (str | None): Composite job ID, also the batch ID in
+            ``journal`` and ``result_store``. Default: a new unique
+            ``"multi_job-<uuid>"``, so runs sharing a journal or store never
+            collide; pass the same ``job_id`` again to reattach to a run.
         shots (int | None): Shots per circuit. Falls back to
             ``backend.options.shots`` if ``None``.
+        journal (JobJournal | str | None): Journal (or path to one) recording
+            every submission. Circuits already recorded in it for an
+            explicit ``job_id`` are reattached instead of being submitted
+            again.
+        result_store (ResultStore | None): Store in which every child job
+            records its terminal response, and from which results are served
+            when already present.
+        scheduler (SubmissionScheduler | None): Scheduler submitting the
+            circuits. Default: the scheduler shared by the whole process.
+        priority (int | None): Priority class of the circuits (see
+            :class:`~qiskit_calculquebec.backends.utils.scheduler.Priority`).
+            ``None`` means ``INTERACTIVE`` for a single circuit and
+            ``NORMAL`` otherwise.
+
+    Raises:
+        ValueError: If a journal entry does not match the circuit at the
+            same position in ``circuits``.
     """
 
-    def __init__(self, backend, circuits, job_id=None, shots=None):
-        super().__init__(backend, job_id or "multi_job")
+    def __init__(
+        self,
+        backend,
+        circuits,
+        job_id=None,
+        shots=None,
+        journal=None,
+        result_store=None,
+        scheduler=None,
+        priority=None,
+    ):
+        super().__init__(backend, job_id or f"multi_job-{uuid.uuid4().hex}")
         self._backend = backend
         self.circuits = circuits
         self.shots = shots or getattr(backend.options, "shots", 1000)
+        self._journal = self._open_journal(journal)
+        self._result_store = result_store
+        self._cancelled = threading.Event()
+        self._scheduler = scheduler or SubmissionScheduler.instance()
+        self._unconfirmed = {}
+        if priority is None:
+            priority = Priority.INTERACTIVE if len(circuits) == 1 else Priority.NORMAL
+
+        recorded = {}
+        if self._journal is not None:
+            recorded = {
+                e["index"]: e
+                for e in self._journal.jobs(batch=self._job_id)
+                if e.get("index") is not None
+            }
 
-        self._individual_jobs = [
-            MonarQJob(backend, circuits=[c], shots=self.shots) for c in circuits
-        ]
+        # Slots are filled in circuit order; None means not submitted yet
+        self._individual_jobs = [None] * len(circuits)
+        pending = []
+        for index, circuit in enumerate(circuits):
+            entry = recorded.get(index)
+            if entry is None:
+                pending.append((index, circuit))
+                continue
+            payload = (
+                circuit
+                if isinstance(circuit, dict)
+                else ApiUtility.convert_circuit(circuit)
+            )
+            fingerprint = JobJournal.fingerprint(payload)
+            if fingerprint != entry["fingerprint"]:
+                raise ValueError(
+                    f"Journal entry {index} of batch {self._job_id!r} does not "
+                    "match the given circuit. Use a new journal or job_id."
+                )
+            if entry["job_id"] is None:
+                if entry["status"] == SUBMITTING:
+                    warnings.warn(
+                        f"Circuit {index} of batch {self._job_id!r} was being "
+                        "submitted when the previous run stopped and may "
+                        "already run on the server; submitting it again."
+                    )
+                pending.append((index, circuit))
+                continue
+            self._individual_jobs[index] = self._reattach(entry)
+
+        self._submission = self._scheduler.schedule(
+            [functools.partial(self._submit_one, i, qc) for i, qc in pending],
+            priority=priority,
+            project=self._project(),
+        )
+
+    @staticmethod
+    def _project():
+        """Return the project of the current API client, if any."""
+        adapter = ApiAdapter.instance()
+        client = adapter.client if adapter is not None else None
+        return str(client.project_id) if client is not None else None
+
+    def _submit_one(self, index: int, circuit) -> MonarQJob:
+        """Submit one circuit of the batch and store its job in its slot.
+
+        Runs on the scheduler's worker thread.
+
+        Args:
+            index (int): Position of the circuit within the batch.
+            circuit (QuantumCircuit): Circuit to submit.
+
+        Returns:
+            MonarQJob: The submitted job.
+        """
+        job = MonarQJob(
+            self._backend,
+            circuits=[circuit],
+            shots=self.shots,
+            journal=self._journal,
+            batch_id=self._job_id,
+            index=index,
+            result_store=self._result_store,
+        )
+        self._individual_jobs[index] = job
+        return job
+
+    def wait_for_submission(self, timeout=None) -> bool:
+        """Block until every circuit has been submitted (or submission stopped).
+
+        Args:
+            timeout (float | None): Maximum seconds to wait. ``None`` means
+                no timeout.
+
+        Returns:
+            bool: ``True`` if submission is over, ``False`` on timeout.
+
+        Raises:
+            Exception: The error that stopped the submission, if any.
+        """
+        done = self._submission.wait(timeout)
+        if self._submission.error is not None:
+            raise self._submission.error
+        return done
+
+    @staticmethod
+    def _open_journal(journal):
+        """Return ``journal`` as a ``JobJournal``, opening it if given a path."""
+        if journal is None or isinstance(journal, JobJournal):
+            return journal
+        return JobJournal(journal)
+
+    def _reattach(self, entry: dict) -> MonarQJob:
+        """Build a ``MonarQJob`` tracking a journaled job without resubmitting it.
+
+        Args:
+            entry (dict): Merged journal entry (see ``JobJournal.jobs``).
+
+        Returns:
+            MonarQJob: Job bound to the recorded job ID.
+        """
+        job = MonarQJob(
+            self._backend,
+            job_id=entry["job_id"],
+            shots=entry.get("shots") or self.shots,
+            journal=self._journal,
+            batch_id=entry.get("batch"),
+            index=entry.get("index"),
+            result_store=self._result_store,
+        )
+        job._journaled_status = entry.get("status")
+        job._fingerprint = entry.get("fingerprint")
+        return job
+
+    @classmethod
+    def resume(
+        cls, journal, backend, job_id=None, result_store=None
+    ) -> "MultiMonarQJob":
+        """Reattach to every job recorded in a journal, without resubmitting.
+
+        Completed jobs are fetched from the API as usual when calling
+        :meth:`result`; in-flight jobs are polled until they finish.
+
+        Circuits journaled without a job ID cannot be reattached: the
+        scheduler rejected them, or the driver stopped while posting them
+        and the server may or may not have created the job. They are
+        reported as failed entries by :meth:`result` (with ``partial``) and
+        make :meth:`status` return ``ERROR``. Run the batch again with its
+        circuits and ``job_id`` to submit them.
+
+        Args:
+            journal (JobJournal | str): Journal (or path to one) written by a
+                previous ``MultiMonarQJob``.
+            backend (MonarQBackend): Backend used to poll the jobs.
+            job_id (str | None): Batch to resume. ``None`` resumes every job in
+                the journal, batch after batch in the order they were first
+                journaled.
+            result_store (ResultStore | None): Store to serve already-fetched
+                results from and to record new ones in.
+
+        Returns:
+            MultiMonarQJob: Job aggregating the reattached jobs, in their
+                original circuit order.
+
+        Raises:
+            ValueError: If the journal contains no job for ``job_id``.
+        """
+        journal = cls._open_journal(journal)
+        entries = journal.jobs(batch=job_id)
+        if not entries:
+            raise ValueError(f"No job recorded in journal {journal.path!r}.")
+
+        job = cls.__new__(cls)
+        Job.__init__(job, backend, job_id or entries[0].get("batch") or "multi_job")
+        job._backend = backend
+        job.circuits = []
+        job.shots = entries[0].get("shots") or getattr(backend.options, "shots", 1000)
+        job._journal = journal
+        job._result_store = result_store
+        job._cancelled = threading.Event()
+        job._scheduler = SubmissionScheduler.instance()
+        job._submission = ScheduledBatch([])
+        job._individual_jobs = []
+        job._unconfirmed = {}
+        for entry in entries:
+            if entry["job_id"] is None:
+                job._unconfirmed[len(job._individual_jobs)] = entry
+                job._individual_jobs.append(None)
+            else:
+                job._individual_jobs.append(job._reattach(entry))
+        return job
+
+    @staticmethod
+    def _remaining(deadline):
+        """Return the seconds left before ``deadline`` (``None`` if unbounded)."""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
 
     def _wait_for_result(self, timeout=None, wait=5) -> bool:
         """Wait for all individual jobs to complete.
 
         Args:
-            timeout (float | None): Maximum seconds to wait per job. ``None``
-                means no timeout.
+            timeout (float | None): Maximum seconds to wait for the whole
+                batch. ``None`` means no timeout.
             wait (float): Seconds between polling attempts. Default: 5.
 
         Returns:
             bool: Always ``True`` when all jobs have completed successfully.
+
+        Raises:
+            JobTimeoutError: If the batch does not complete within ``timeout``.
         """
-        for job in self._individual_jobs:
-            job._wait_for_result(timeout=timeout, wait=wait)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.wait_for_submission(self._remaining(deadline)):
+            raise JobTimeoutError("Timed out waiting for submission.")
+        for index, job in enumerate(self._individual_jobs):
+            if job is None:
+                raise JobError(self._not_submitted(index))
+            job._wait_for_result(timeout=self._remaining(deadline), wait=wait)
         return True
 
-    def result(self, timeout=None, wait=5) -> Result:
+    def _not_submitted(self, index: int) -> str:
+        """Return why the circuit at ``index`` has no job."""
+        entry = self._unconfirmed.get(index)
+        if entry is None:
+            return "Job was cancelled before all circuits were submitted."
+        if entry["status"] == SUBMITTING:
+            return (
+                f"Submission of circuit {index} was not confirmed: the driver "
+                "stopped while posting it."
+            )
+        return f"Circuit {index} was rejected by the scheduler."
+
+    def _unfinished(self, reason: str) -> dict:
+        """Return a failed experiment entry for a circuit without a result."""
+        return {
+            "success": False,
+            "shots": self.shots,
+            "status": reason,
+            "data": {},
+        }
+
+    def result(self, timeout=None, wait=5, partial=False) -> Result:
         """Collect results from all individual jobs and combine them.
 
+        ``timeout`` is a wall-clock deadline for the whole batch, not for
+        each circuit. When ``partial`` is set or the job has been
+        cancelled, circuits that did not finish in time (or failed) are
+        reported as unsuccessful entries instead of raising, and the
+        circuits that finished keep their counts.
+
         Args:
-            timeout (float | None): Maximum seconds to wait per job. ``None``
-                means no timeout.
+            timeout (float | None): Maximum seconds to wait for the whole
+                batch. ``None`` means no timeout.
             wait (float): Seconds between polling attempts. Default: 5.
+            partial (bool): Return partial results instead of raising on
+                timeout or job failure. Default: ``False``.
 
         Returns:
             Result: Combined Qiskit ``Result`` containing one entry per circuit.
+
+        Raises:
+            JobTimeoutError: If the deadline passes and ``partial`` is not set.
+            JobError: If a job fails, or a resumed circuit has no job, and
+                ``partial`` is not set.
         """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        partial = partial or self._cancelled.is_set()
+
+        if not self.wait_for_submission(self._remaining(deadline)) and not partial:
+            raise JobTimeoutError("Timed out waiting for submission.")
+
         all_results = []
 
-        for job in self._individual_jobs:
-            res = job.result(timeout=timeout, wait=wait)
+        for index, job in enumerate(list(self._individual_jobs)):
+            if job is None:
+                reason = "Not submitted"
+                if index in self._unconfirmed:
+                    reason = self._not_submitted(index)
+                    if not partial:
+                        raise JobError(reason)
+                all_results.append(self._unfinished(reason))
+                continue
+            try:
+                res = job.result(timeout=self._remaining(deadline), wait=wait)
+            except (JobTimeoutError, JobError) as e:
+                if not (partial or self._cancelled.is_set()):
+                    raise
+                all_results.append(self._unfinished(str(e)))
+                continue
 
             for exp in res.results:
                 data = exp.data
@@ -217,28 +678,68 @@ class MultiMonarQJob(Job):
                 if not hasattr(data, "evs") and not hasattr(data, "counts"):
                     ev = getattr(data, "expectation_value", None)
                     setattr(data, "evs", ev if ev is not None else [])
-                all_results.append(exp)
+                all_results.append(exp.to_dict())
 
         return Result.from_dict(
             {
-                "results": [exp.to_dict() for exp in all_results],
+                "results": all_results,
                 "backend_name": getattr(self._backend, "name", "unknown"),
                 "backend_version": getattr(self._backend, "backend_version", "0.0.0"),
                 "job_id": self._job_id,
-                "success": all(exp.success for exp in all_results),
+                "success": all(exp["success"] for exp in all_results),
             }
         )
 
+    def cancel(self) -> bool:
+        """Stop submitting and polling, and cancel every submitted job.
+
+        Waits for a submission already in progress to return, so that its
+        job is cancelled too. Results of circuits that already finished
+        remain available through :meth:`result`.
+
+        Returns:
+            bool: ``True`` if the scheduler accepted the cancellation of every
+                submitted job.
+        """
+        self._cancelled.set()
+        self._scheduler.cancel(self._submission)
+        accepted = [job.cancel() for job in self._individual_jobs if job is not None]
+        return all(accepted)
+
     def status(self) -> JobStatus:
         """Return the aggregate ``JobStatus`` across all individual jobs.
 
-        Returns ``DONE`` only when all jobs have succeeded; returns ``RUNNING``
-        if any job is still running; returns ``ERROR`` if any job has failed.
+        Returns ``CANCELLED`` once :meth:`cancel` has been called; ``DONE``
+        only when all jobs have succeeded; ``RUNNING`` if any job is still
+        running; ``ERROR`` if any job has failed. Circuits not submitted
+        yet count as ``INITIALIZING``, and resumed circuits that were never
+        confirmed by the scheduler as ``ERROR``.
 
         Returns:
             JobStatus: Aggregated status.
+
+        Raises:
+            Exception: The error that stopped the background submission
+                (e.g. an ``ApiException`` from ``POST /jobs``), if any.
         """
-        statuses = [job.status() for job in self._individual_jobs]
+        if self._cancelled.is_set():
+            return JobStatus.CANCELLED
+        if self._submission.error is not None:
+            # Circuits after the failed one will never be submitted
+            raise self._submission.error
+
+        statuses = [
+            (
+                job.status()
+                if job is not None
+                else (
+                    JobStatus.ERROR
+                    if index in self._unconfirmed
+                    else JobStatus.INITIALIZING
+                )
+            )
+            for index, job in enumerate(list(self._individual_jobs))
+        ]
 
         if all(s == JobStatus.DONE for s in statuses):
             return JobStatus.DONE
@@ -0,0 +1,168 @@
+"""
+Append-only local journal of MonarQ job submissions.
+
+Every submitted circuit is written as one JSON line (fingerprint, job ID,
+shots, status) and flushed to disk before the submission call returns, so a
+crashed driver process can reattach to its in-flight jobs with
+``MultiMonarQJob.resume`` instead of resubmitting them. An intent line is
+written before each ``POST /jobs`` as well, so a crash between the server
+accepting a job and its ID being journaled is detected instead of losing
+track of the job.
+"""
+
+import json
+import os
+import threading
+import time
+from qiskit_calculquebec.API.circuit_hash import hash_payload
+
+#: Job statuses after which a job will not change anymore.
+TERMINAL_STATUSES = ("SUCCEEDED", "FAILED", "CANCELLED")
+
+#: Status of an intent entry, written before the circuit is posted.
+SUBMITTING = "SUBMITTING"
+
+#: Status recorded when the scheduler rejected the circuit.
+NOT_SUBMITTED = "NOT_SUBMITTED"
+
+
+class JobJournal:
+    """Append-only JSON-lines journal recording job submissions and their status.
+
+    Each call to :meth:`record` appends one line and ``fsync``s the file.
+    Status changes are recorded as new lines; :meth:`jobs` merges them so
+    that the latest status of each job wins. Lines of a batch are merged by
+    circuit index, so the job ID recorded after a ``SUBMITTING`` intent
+    completes it. A partially written last line (e.g. after a crash
+    mid-write) is ignored on read.
+
+    Args:
+        path (str): Path of the journal file. Created on first write.
+
+    Example:
+        .. code-block:: python
+
+            job = backend.run(circuits, journal="sweep.jsonl")
+            # ... driver crashes, then in a new process:
+            job = MultiMonarQJob.resume("sweep.jsonl", backend)
+            counts = job.result().get_counts()
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(circuit_dict: dict) -> str:
+        """Return a stable fingerprint of a Thunderhead circuit dictionary.
+
+        Args:
+            circuit_dict (dict): Circuit as produced by
+                ``ApiUtility.convert_circuit``.
+
+        Returns:
+            str: Structural digest (see
+                :func:`~qiskit_calculquebec.API.circuit_hash.hash_payload`).
+        """
+        return hash_payload(circuit_dict)
+
+    def record(
+        self,
+        job_id: str,
+        fingerprint: str = None,
+        shots: int = None,
+        status: str = "SUBMITTED",
+        batch: str = None,
+        index: int = None,
+    ) -> dict:
+        """Append an entry to the journal and flush it to disk.
+
+        Args:
+            job_id (str | None): Job ID assigned by the scheduler. ``None``
+                for an intent entry, written before the job is posted.
+            fingerprint (str | None): Circuit fingerprint (see
+                :meth:`fingerprint`).
+            shots (int | None): Number of shots requested.
+            status (str): Job status. Default: ``"SUBMITTED"``.
+            batch (str | None): ID of the ``MultiMonarQJob`` the job belongs to.
+            index (int | None): Position of the circuit within its batch.
+
+        Returns:
+            dict: The entry that was written.
+        """
+        entry = {
+            "job_id": job_id,
+            "fingerprint": fingerprint,
+            "shots": shots,
+            "status": status,
+            "batch": batch,
+            "index": index,
+            "time": time.time(),
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+        return entry
+
+    def entries(self) -> list[dict]:
+        """Return every entry of the journal in the order it was written.
+
+        Returns:
+            list[dict]: Raw journal entries. Empty if the file does not exist.
+        """
+        if not os.path.exists(self.path):
+            return []
+
+        entries = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn write from a crash: everything before it is intact
+                    continue
+        return entries
+
+    def jobs(self, batch: str = None) -> list[dict]:
+        """Return one merged entry per job, carrying its latest known status.
+
+        Args:
+            batch (str | None): Only return jobs of this batch. ``None``
+                returns every job in the journal.
+
+        Returns:
+            list[dict]: Merged entries, grouped by batch in the order the
+                batches first appear, then ordered by ``index`` when present
+                and by submission order otherwise. An entry whose ``job_id`` is
+                ``None`` was never confirmed by the scheduler: its status is
+                ``SUBMITTING`` if the driver stopped while posting it, and
+                ``NOT_SUBMITTED`` if the scheduler rejected it.
+        """
+        merged = {}
+        batches = {}
+        for entry in self.entries():
+            if batch is not None and entry.get("batch") != batch:
+                continue
+            batches.setdefault(entry.get("batch"), len(batches))
+            if entry.get("index") is not None:
+                key = (entry.get("batch"), entry["index"])
+            else:
+                key = entry["job_id"]
+            if key not in merged:
+                merged[key] = dict(entry)
+            else:
+                # Later lines carry the job ID of an intent, or a status update
+                merged[key].update({k: v for k, v in entry.items() if v is not None})
+
+        jobs = list(merged.values())
+        # Journals are shared by batches: keep each batch's circuits together
+        jobs.sort(
+            key=lambda e: (
+                batches[e.get("batch")],
+                e["index"] if e.get("index") is not None else -1,
+            )
+        )
+        return jobs
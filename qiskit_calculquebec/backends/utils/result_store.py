@@ -0,0 +1,228 @@
+"""
+Local SQLite store of terminal MonarQ job responses.
+
+``MonarQJob`` records every terminal API response it fetches and serves
+later ``result()`` calls for the same job ID from the store, without
+touching the network. Rows are indexed by job ID, circuit hash, machine,
+project, calibration fetch time and batch, so a whole sweep can be pulled
+back in one query.
+
+Benchmark responses carry no measurement time, so the calibration a job
+ran against is identified by when ``ApiAdapter`` fetched its benchmark:
+jobs submitted against the same fetched benchmark share the same value.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+
+_COLUMNS = (
+    "job_id",
+    "circuit_hash",
+    "machine",
+    "project",
+    "calibration_fetched_at",
+    "batch",
+    "batch_index",
+    "status",
+    "stored_at",
+    "response",
+)
+
+_INDEXED = (
+    "circuit_hash",
+    "machine",
+    "project",
+    "calibration_fetched_at",
+    "batch",
+)
+
+
+class ResultStore:
+    """SQLite-backed store of terminal job responses.
+
+    Args:
+        path (str): Path of the SQLite database file. ``":memory:"`` keeps
+            the store in memory for the lifetime of the object.
+
+    Example:
+        .. code-block:: python
+
+            store = ResultStore("results.sqlite")
+            job = backend.run(circuits, job_id="sweep-1", result_store=store)
+            job.result()
+
+            # Later, in another notebook:
+            histograms = ResultStore("results.sqlite").histograms(batch="sweep-1")
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "job_id TEXT PRIMARY KEY, circuit_hash TEXT, machine TEXT, "
+                "project TEXT, calibration_fetched_at TEXT, batch TEXT, "
+                "batch_index INTEGER, status TEXT, stored_at REAL, response TEXT)"
+            )
+            for column in _INDEXED:
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_results_{column} "
+                    f"ON results ({column})"
+                )
+
+    def record(
+        self,
+        job_id: str,
+        response: dict,
+        circuit_hash: str = None,
+        machine: str = None,
+        project: str = None,
+        calibration_fetched_at: str = None,
+        batch: str = None,
+        batch_index: int = None,
+    ):
+        """Insert or replace the terminal response of a job.
+
+        Args:
+            job_id (str): Job ID.
+            response (dict): Full ``GET /jobs/{id}`` response JSON.
+            circuit_hash (str | None): Fingerprint of the submitted circuit.
+            machine (str | None): Machine the job ran on.
+            project (str | None): Project ID the job was billed to.
+            calibration_fetched_at (str | None): ISO time at which the
+                benchmark in use when the job was submitted was fetched (not
+                when the calibration was measured).
+            batch (str | None): ID of the ``MultiMonarQJob`` the job belongs to.
+            batch_index (int | None): Position of the circuit within its batch.
+        """
+        status = response["job"]["status"]["type"]
+        row = (
+            job_id,
+            circuit_hash,
+            machine,
+            project,
+            calibration_fetched_at,
+            batch,
+            batch_index,
+            status,
+            time.time(),
+            json.dumps(response),
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO results ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                row,
+            )
+
+    def get(self, job_id: str) -> dict | None:
+        """Return the stored response of a job.
+
+        Args:
+            job_id (str): Job ID.
+
+        Returns:
+            dict | None: The stored ``GET /jobs/{id}`` response, or ``None``
+                if the job is not in the store.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response FROM results WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def query(
+        self,
+        circuit_hash: str = None,
+        machine: str = None,
+        project: str = None,
+        calibration_fetched_at: str = None,
+        batch: str = None,
+        status: str = None,
+    ) -> list[dict]:
+        """Return every stored job matching all the given criteria.
+
+        Args:
+            circuit_hash (str | None): Filter on circuit fingerprint.
+            machine (str | None): Filter on machine name.
+            project (str | None): Filter on project ID.
+            calibration_fetched_at (str | None): Filter on the fetch time of
+                the benchmark.
+            batch (str | None): Filter on batch ID.
+            status (str | None): Filter on terminal status (e.g.
+                ``"SUCCEEDED"``).
+
+        Returns:
+            list[dict]: One dict per job with every indexed column and the
+                decoded ``response``, ordered by batch index then storage time.
+        """
+        filters = {
+            "circuit_hash": circuit_hash,
+            "machine": machine,
+            "project": project,
+            "calibration_fetched_at": calibration_fetched_at,
+            "batch": batch,
+            "status": status,
+        }
+        clauses = [f"{k} = ?" for k, v in filters.items() if v is not None]
+        params = [v for v in filters.values() if v is not None]
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM results"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY batch_index, stored_at"
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        records = []
+        for row in rows:
+            record = dict(zip(_COLUMNS, row))
+            record["response"] = json.loads(record["response"])
+            records.append(record)
+        return records
+
+    def histograms(self, batch: str = None, job_ids: list[str] = None) -> list[dict]:
+        """Return the histograms of a whole sweep in one call.
+
+        Args:
+            batch (str | None): Batch ID of the sweep. Results are returned in
+                circuit order.
+            job_ids (list[str] | None): Explicit job IDs. Results are returned
+                in the given order; jobs missing from the store yield ``None``.
+
+        Returns:
+            list[dict | None]: Histogram (bitstring → count) per succeeded job.
+
+        Raises:
+            ValueError: If neither or both of ``batch`` and ``job_ids`` are given.
+        """
+        if (batch is None) == (job_ids is None):
+            raise ValueError("Provide exactly one of batch or job_ids.")
+
+        if batch is not None:
+            return [
+                r["response"]["result"]["histogram"]
+                for r in self.query(batch=batch, status="SUCCEEDED")
+            ]
+
+        placeholders = ", ".join("?" * len(job_ids))
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT job_id, response FROM results "
+                f"WHERE status = 'SUCCEEDED' AND job_id IN ({placeholders})",
+                list(job_ids),
+            ).fetchall()
+        by_id = {job_id: json.loads(response) for job_id, response in rows}
+        return [
+            by_id[j]["result"]["histogram"] if j in by_id else None for j in job_ids
+        ]
+
+    def close(self):
+        """Close the underlying SQLite connection."""
+        self._connection.close()
@@ -0,0 +1,248 @@
+"""
+Client-side submission scheduler for MonarQ jobs.
+
+Every ``MultiMonarQJob`` hands its circuits to a shared
+``SubmissionScheduler`` instead of POSTing them itself. A single worker
+thread submits one circuit at a time, always from the highest priority
+class that has work, round-robin between the batches of that class, and
+never exceeding the in-flight cap of the batch's project. A single
+interactive circuit therefore goes out right after the POST in progress,
+even while a 1000-circuit sweep is still being submitted.
+
+The worker is not a daemon thread: a script that exits right after
+``backend.run`` still submits every queued circuit before the interpreter
+stops. Cancel the job to exit without submitting the rest.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from qiskit.providers.jobstatus import JOB_FINAL_STATES
+
+
+class Priority:
+    """Priority classes of the submission scheduler. Lower is served first."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+class ScheduledBatch:
+    """Circuits of one caller queued in a :class:`SubmissionScheduler`.
+
+    Args:
+        tasks (list[Callable[[], Job]]): Submission callables, run in order.
+            Each one submits a circuit and returns the resulting job.
+        priority (int): Priority class (see :class:`Priority`).
+        project (str | None): Project the in-flight cap is accounted against.
+    """
+
+    def __init__(self, tasks: list, priority: int = Priority.NORMAL, project=None):
+        self.tasks = deque(tasks)
+        self.priority = priority
+        self.project = project
+        self.cancelled = False
+        self.error = None
+        self.done = threading.Event()
+        if not self.tasks:
+            self.done.set()
+
+    def wait(self, timeout=None) -> bool:
+        """Block until every task has run, or the batch stopped.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait. ``None`` means
+                no timeout.
+
+        Returns:
+            bool: ``True`` if the batch is over, ``False`` on timeout.
+        """
+        return self.done.wait(timeout)
+
+
+class SubmissionScheduler:
+    """Priority-aware, fair submission queue with a per-project in-flight cap.
+
+    A job counts as in flight from its submission until the scheduler sees
+    it in a final state. When a project reaches ``max_in_flight``, its
+    in-flight jobs are polled every ``poll_interval`` seconds and the queue
+    resumes as soon as one of them finishes; batches of other projects keep
+    being served meanwhile.
+
+    Args:
+        max_in_flight (int | None): Maximum number of unfinished jobs per
+            project. ``None`` means no cap.
+        poll_interval (float): Seconds between status polls of in-flight
+            jobs while a project is at its cap. Default: 1.
+
+    Example:
+        .. code-block:: python
+
+            SubmissionScheduler.instance().max_in_flight = 20
+            sweep = backend.run(circuits, priority=Priority.BULK)
+            probe = backend.run(circuit)  # submitted before the rest of the sweep
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_in_flight: int = None, poll_interval: float = 1.0):
+        self.max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self._cond = threading.Condition()
+        self._queues = {}
+        self._in_flight = {}
+        self._worker = None
+
+    @classmethod
+    def instance(cls) -> "SubmissionScheduler":
+        """Return the scheduler shared by every backend of this process."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def schedule(
+        self, tasks: list, priority: int = Priority.NORMAL, project=None
+    ) -> ScheduledBatch:
+        """Queue submission tasks and return immediately.
+
+        Args:
+            tasks (list[Callable[[], Job]]): Submission callables, run in
+                order. A task raising stops its batch and the error is kept
+                in :attr:`ScheduledBatch.error`.
+            priority (int): Priority class (see :class:`Priority`).
+                Default: ``Priority.NORMAL``.
+            project (str | None): Project the in-flight cap is accounted
+                against.
+
+        Returns:
+            ScheduledBatch: Handle to wait on or cancel the batch.
+        """
+        batch = ScheduledBatch(tasks, priority, project)
+        if batch.done.is_set():
+            return batch
+
+        with self._cond:
+            self._queues.setdefault(priority, deque()).append(batch)
+            if self._worker is None:
+                # Not a daemon: queued circuits are submitted before exit
+                self._worker = threading.Thread(
+                    target=self._work, name="SubmissionScheduler"
+                )
+                self._worker.start()
+            self._cond.notify_all()
+        return batch
+
+    def cancel(self, batch: ScheduledBatch):
+        """Drop the remaining tasks of a batch.
+
+        Waits for a task already running, so that the job it submits can be
+        cancelled by the caller.
+
+        Args:
+            batch (ScheduledBatch): Batch returned by :meth:`schedule`.
+        """
+        with self._cond:
+            batch.cancelled = True
+            queue = self._queues.get(batch.priority, ())
+            if batch in queue:
+                queue.remove(batch)
+                batch.done.set()
+        batch.done.wait()
+
+    def in_flight(self, project=None) -> int:
+        """Return the number of submitted jobs not yet seen finished.
+
+        Args:
+            project (str | None): Project to count for.
+
+        Returns:
+            int: Number of in-flight jobs of ``project``.
+        """
+        with self._cond:
+            return len(self._in_flight.get(project, ()))
+
+    def pending(self) -> int:
+        """Return the number of circuits still waiting to be submitted."""
+        with self._cond:
+            return sum(len(b.tasks) for q in self._queues.values() for b in q)
+
+    def _has_capacity(self, project) -> bool:
+        return (
+            self.max_in_flight is None
+            or len(self._in_flight.get(project, ())) < self.max_in_flight
+        )
+
+    def _next(self) -> ScheduledBatch | None:
+        """Pop the first batch that may submit now, by priority then arrival.
+
+        Must be called with the lock held.
+        """
+        for priority in sorted(self._queues):
+            for batch in self._queues[priority]:
+                if self._has_capacity(batch.project):
+                    self._queues[priority].remove(batch)
+                    return batch
+        return None
+
+    def _reap(self):
+        """Forget in-flight jobs that reached a final state."""
+        with self._cond:
+            jobs = [job for jobs in self._in_flight.values() for job in jobs]
+
+        finished = []
+        for job in jobs:
+            try:
+                if job.status() in JOB_FINAL_STATES:
+                    finished.append(job)
+            except Exception:
+                # Transient API error: keep counting the job as in flight
+                continue
+
+        with self._cond:
+            for jobs in self._in_flight.values():
+                for job in finished:
+                    if job in jobs:
+                        jobs.remove(job)
+
+    def _work(self):
+        """Worker loop: submit one task at a time until the queues are empty."""
+        while True:
+            with self._cond:
+                if not any(self._queues.values()):
+                    self._worker = None
+                    return
+                batch = self._next()
+
+            if batch is None:
+                # Every queued batch belongs to a project at its cap
+                self._reap()
+                with self._cond:
+                    if not any(
+                        self._has_capacity(b.project)
+                        for q in self._queues.values()
+                        for b in q
+                    ):
+                        self._cond.wait(self.poll_interval)
+                continue
+
+            job = None
+            try:
+                job = batch.tasks.popleft()()
+            except Exception as e:
+                batch.error = e
+                batch.tasks.clear()
+
+            with self._cond:
+                # Without a cap there is nothing to account for
+                if job is not None and self.max_in_flight is not None:
+                    self._in_flight.setdefault(batch.project, []).append(job)
+                if batch.tasks and not batch.cancelled:
+                    # Back of its class: batches of equal priority interleave
+                    self._queues[batch.priority].append(batch)
+                else:
+                    batch.done.set()
+                self._cond.notify_all()
@@ -0,0 +1,93 @@
+"""
+Calibration snapshots of MonarQ/Yukon machines.
+
+A snapshot is a JSON file holding everything a backend downloads to build
+its target: the machine metadata, the benchmark and the coupler-to-qubit
+connectivity. ``MonarQBackend.save_snapshot`` writes one and
+``MonarQBackend.from_snapshot`` builds a backend pinned to it, so that
+transpilation is reproducible and needs no network access.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+
+#: Version of the snapshot file format.
+SNAPSHOT_FORMAT = 1
+
+_REQUIRED_KEYS = ("machine_name", "machine", "benchmark", "connectivity")
+
+
+def make_snapshot(
+    machine_name: str, machine: dict, benchmark: dict, connectivity: dict
+) -> dict:
+    """Return a snapshot dictionary.
+
+    Args:
+        machine_name (str): ``"monarq"`` or ``"yukon"``.
+        machine (dict): Machine metadata as returned by
+            ``ApiAdapter.get_machine_by_name``.
+        benchmark (dict): Benchmark response.
+        connectivity (dict): Coupler-to-qubit map as returned by
+            ``ApiAdapter.get_connectivity_for_machine``.
+
+    Returns:
+        dict: Snapshot, ready for :func:`dump_snapshot`.
+    """
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "machine_name": machine_name.lower(),
+        "machine": machine,
+        "benchmark": benchmark,
+        "connectivity": connectivity,
+    }
+
+
+def dump_snapshot(path: str, snapshot: dict):
+    """Write a snapshot atomically.
+
+    Args:
+        path (str): Destination file.
+        snapshot (dict): Snapshot returned by :func:`make_snapshot`.
+    """
+    path = os.path.expanduser(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_snapshot(path: str) -> dict:
+    """Read and check a snapshot file.
+
+    Args:
+        path (str): Snapshot file.
+
+    Returns:
+        dict: The snapshot.
+
+    Raises:
+        ValueError: If the file is not a snapshot or was written in an
+            unsupported format.
+    """
+    with open(os.path.expanduser(path), encoding="utf-8") as f:
+        snapshot = json.load(f)
+
+    if not isinstance(snapshot, dict) or any(k not in snapshot for k in _REQUIRED_KEYS):
+        raise ValueError(f"{path} is not a calibration snapshot.")
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(
+            f"Unsupported snapshot format {snapshot.get('format')!r} in {path}; "
+            f"expected {SNAPSHOT_FORMAT}."
+        )
+    return snapshot
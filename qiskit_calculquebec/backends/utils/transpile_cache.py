@@ -0,0 +1,229 @@
+"""
+Opt-in on-disk cache of transpiled circuits.
+
+Transpiling the same benchmark or ansatz circuit at level 3 against an
+unchanged calibration always gives the same result. ``TranspileCache``
+stores each transpiled circuit as a QPY file named after a key covering
+the structural hash of the input circuit, the optimisation level, the
+package and Qiskit versions and the target's calibration fingerprint, so a
+later transpilation with nothing relevant changed is a single file read.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+
+import qiskit
+from qiskit import QuantumCircuit
+from qiskit_calculquebec.API.circuit_hash import hash_circuit
+
+
+def _package_version() -> str:
+    try:
+        return version("qiskit-calculquebec")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class TranspileCache:
+    """Directory of QPY-serialised transpiled circuits.
+
+    Entries are written atomically, so several processes may share a
+    directory. An unreadable entry (e.g. written by an incompatible QPY
+    version) is treated as a miss.
+
+    Args:
+        directory (str): Cache directory. Created if it does not exist.
+
+    Example:
+        .. code-block:: python
+
+            backend = MonarQBackend(client=client, transpile_cache="~/.cache/monarq")
+            transpiled = backend.transpile(circuits)  # instant on the second run
+    """
+
+    def __init__(self, directory: str):
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(
+        circuit: QuantumCircuit, optimization_level: int, calibration_fingerprint: str
+    ) -> str:
+        """Return the cache key of a transpilation.
+
+        Args:
+            circuit (QuantumCircuit): Input circuit.
+            optimization_level (int): Preset optimisation level.
+            calibration_fingerprint (str): Fingerprint of the target's
+                calibration (see ``AnyonTarget.calibration_fingerprint``).
+
+        Returns:
+            str: Hex SHA-256 digest.
+        """
+        encoded = json.dumps(
+            [
+                hash_circuit(circuit),
+                # The structural hash ignores register names, but the
+                # transpiled circuit keeps them and results are keyed by them
+                [r.name for r in circuit.cregs],
+                optimization_level,
+                _package_version(),
+                qiskit.__version__,
+                calibration_fingerprint,
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".qpy")
+
+    def get(self, key: str, circuit: QuantumCircuit = None) -> QuantumCircuit | None:
+        """Return the cached circuit for a key.
+
+        Args:
+            key (str): Key returned by :meth:`key`.
+            circuit (QuantumCircuit | None): Input circuit the key was
+                computed from. The key ignores circuit names and metadata,
+                so the entry may come from another circuit: ``circuit``'s
+                name and metadata are copied onto the returned circuit, as
+                transpiling it would have kept them.
+
+        Returns:
+            QuantumCircuit | None: The transpiled circuit, or ``None`` on a
+                miss.
+        """
+        from qiskit import qpy
+
+        try:
+            with open(self._path(key), "rb") as f:
+                cached = qpy.load(f)[0]
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry: transpile again and overwrite it
+            return None
+        if circuit is not None:
+            cached.name = circuit.name
+            cached.metadata = dict(circuit.metadata or {})
+        return cached
+
+    def put(self, key: str, circuit: QuantumCircuit):
+        """Store a transpiled circuit.
+
+        Args:
+            key (str): Key returned by :meth:`key`.
+            circuit (QuantumCircuit): Transpiled circuit.
+        """
+        from qiskit import qpy
+
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                qpy.dump(circuit, f)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def clear(self):
+        """Delete every cached circuit."""
+        for name in os.listdir(self.directory):
+            if name.endswith(".qpy"):
+                os.unlink(os.path.join(self.directory, name))
+
+
+class CachedPassManager:
+    """Pass manager wrapper serving transpilations from a :class:`TranspileCache`.
+
+    ``run`` only hands the circuits missing from the cache to the wrapped
+    pass manager and stores their results. Every other attribute is
+    delegated to the wrapped pass manager, assignments included. Cache keys
+    do not cover the stages, so once a stage is assigned (e.g.
+    ``pm.scheduling = ...``) ``run`` bypasses the cache.
+
+    Args:
+        pass_manager (StagedPassManager): Pass manager to wrap.
+        cache (TranspileCache): Cache to read and fill.
+        optimization_level (int): Optimisation level of ``pass_manager``.
+        calibration_fingerprint (str): Fingerprint of the calibration
+            ``pass_manager`` was built for.
+    """
+
+    def __init__(
+        self,
+        pass_manager,
+        cache: TranspileCache,
+        optimization_level: int,
+        calibration_fingerprint: str,
+    ):
+        self._pass_manager = pass_manager
+        self._cache = cache
+        self._optimization_level = optimization_level
+        self._calibration_fingerprint = calibration_fingerprint
+        self._customized = False
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            # Not set yet (e.g. during unpickling): do not recurse
+            raise AttributeError(name)
+        return getattr(self._pass_manager, name)
+
+    def __setattr__(self, name, value):
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._pass_manager, name, value)
+            self._customized = True
+
+    def __copy__(self):
+        clone = CachedPassManager(
+            copy.copy(self._pass_manager),
+            self._cache,
+            self._optimization_level,
+            self._calibration_fingerprint,
+        )
+        clone._customized = self._customized
+        return clone
+
+    def run(self, circuits, **kwargs):
+        """Transpile circuits, reusing cached results.
+
+        Args:
+            circuits (QuantumCircuit | list[QuantumCircuit]): Circuits to
+                transpile.
+            **kwargs: Forwarded to the wrapped pass manager's ``run`` for
+                the circuits missing from the cache.
+
+        Returns:
+            QuantumCircuit | list[QuantumCircuit]: Transpiled circuit(s), in
+                the same shape as ``circuits``.
+        """
+        if self._customized:
+            return self._pass_manager.run(circuits, **kwargs)
+
+        single = isinstance(circuits, QuantumCircuit)
+        circuits = [circuits] if single else list(circuits)
+
+        keys = [
+            self._cache.key(c, self._optimization_level, self._calibration_fingerprint)
+            for c in circuits
+        ]
+        results = [self._cache.get(k, c) for k, c in zip(keys, circuits)]
+        missing = [i for i, r in enumerate(results) if r is None]
+
+        if missing:
+            transpiled = self._pass_manager.run(
+                [circuits[i] for i in missing], **kwargs
+            )
+            for i, circuit in zip(missing, transpiled):
+                self._cache.put(keys[i], circuit)
+                results[i] = circuit
+
+        return results[0] if single else results
@@ -0,0 +1,52 @@
+"""
+Equivalences of the custom gates in Qiskit's session equivalence library.
+
+Registering ``RY90Gate`` and ``RYm90Gate`` as ``RY(±π/2)`` lets the
+transpiler translate them. Registration is deferred until a gate, target or
+pass manager is first built instead of happening when the gate modules are
+imported, and is done at most once per session.
+"""
+
+import math
+import threading
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+
+_registered = False
+# Set while registering: the gates built below call this function again
+_registering = False
+_lock = threading.RLock()
+
+
+def register_equivalences():
+    """Add the custom gate equivalences to ``SessionEquivalenceLibrary``.
+
+    Called by the custom gates' constructors, so that building an
+    ``RY90Gate`` or ``RYm90Gate`` is enough for ``qiskit.transpile`` to
+    translate it. Idempotent: later calls return immediately, and a gate
+    that already has an entry in the library is not added twice.
+    """
+    global _registered, _registering
+    if _registered:
+        return
+    with _lock:
+        if _registered or _registering:
+            return
+        _registering = True
+        try:
+            from qiskit_calculquebec.custom_gates.ry_90_gate import RY90Gate
+            from qiskit_calculquebec.custom_gates.ry_m90_gate import RYm90Gate
+
+            for gate, angle in (
+                (RY90Gate(), math.pi / 2),
+                (RYm90Gate(), -math.pi / 2),
+            ):
+                if SessionEquivalenceLibrary.has_entry(gate):
+                    continue
+                circuit = QuantumCircuit(1)
+                circuit.ry(angle, 0)
+                SessionEquivalenceLibrary.add_equivalence(gate, circuit)
+            _registered = True
+        finally:
+            _registering = False
@@ -1,6 +1,6 @@
 import math
 from qiskit.circuit import QuantumCircuit, Gate
-from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+from qiskit_calculquebec.custom_gates.equivalences import register_equivalences
 
 
 class RY90Gate(Gate):
@@ -12,6 +12,8 @@ class RY90Gate(Gate):
     def __init__(self):
         # Initialize gate with name 'ry90', acting on 1 qubit, no parameters
         super().__init__("ry90", 1, [])
+        # Lets qiskit.transpile translate this gate
+        register_equivalences()
 
     def _define(self):
         """Decompose this gate in terms of standard Qiskit gates.
@@ -21,10 +23,3 @@ class RY90Gate(Gate):
         qc = QuantumCircuit(1, name=self.name)
         qc.ry(math.pi / 2, 0)  # Apply RY(π/2) on qubit 0
         self.definition = qc
-
-
-# Register equivalence in Qiskit's session equivalence library
-# so the transpiler recognizes RY90Gate as equivalent to RY(π/2)
-qc_standard = QuantumCircuit(1)
-qc_standard.ry(math.pi / 2, 0)
-SessionEquivalenceLibrary.add_equivalence(RY90Gate(), qc_standard)
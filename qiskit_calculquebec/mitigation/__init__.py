@@ -26,21 +26,29 @@ Installing optional dependencies
     pip install qiskit-calculquebec[mitigation]
 """
 
+import importlib as _importlib
 import warnings as _warnings
+from importlib.util import find_spec as _find_spec
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qiskit_calculquebec.mitigation.readout import ReadoutMitigation
+    from qiskit_calculquebec.mitigation.zne import ZNEMitigation
+    from qiskit_calculquebec.mitigation.ddd import DDDMitigation
+    from qiskit_calculquebec.mitigation.pauli_twirling import PauliTwirlingMitigation
+
 
 def _check_optional_deps():
+    # find_spec locates the packages without importing them: mitiq alone
+    # takes seconds to import, and is only needed once a technique runs
     missing = []
-    try:
-        import mitiq  # noqa: F401
-    except ImportError:
-        missing.append("mitiq  (required for ZNEMitigation, DDDMitigation, PauliTwirlingMitigation, ReadoutMitigation(method='matrix'))")
-    try:
-        import mthree  # noqa: F401
-    except ImportError:
+    if _find_spec("mitiq") is None:
+        missing.append(
+            "mitiq  (required for ZNEMitigation, DDDMitigation, PauliTwirlingMitigation, ReadoutMitigation(method='matrix'))"
+        )
+    if _find_spec("mthree") is None:
         missing.append("mthree (required for ReadoutMitigation(method='m3'))")
-    try:
-        import psutil  # noqa: F401
-    except ImportError:
+    if _find_spec("psutil") is None:
         missing.append("psutil (required for ReadoutMitigation(method='m3'))")
 
     if missing:
@@ -52,12 +60,16 @@ def _check_optional_deps():
             stacklevel=2,
         )
 
+
 _check_optional_deps()
 
-from qiskit_calculquebec.mitigation.readout import ReadoutMitigation
-from qiskit_calculquebec.mitigation.zne import ZNEMitigation
-from qiskit_calculquebec.mitigation.ddd import DDDMitigation
-from qiskit_calculquebec.mitigation.pauli_twirling import PauliTwirlingMitigation
+# Public class -> submodule defining it, imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "ReadoutMitigation": "qiskit_calculquebec.mitigation.readout",
+    "ZNEMitigation": "qiskit_calculquebec.mitigation.zne",
+    "DDDMitigation": "qiskit_calculquebec.mitigation.ddd",
+    "PauliTwirlingMitigation": "qiskit_calculquebec.mitigation.pauli_twirling",
+}
 
 __all__ = [
     "ReadoutMitigation",
@@ -65,3 +77,16 @@ __all__ = [
     "DDDMitigation",
     "PauliTwirlingMitigation",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,22 @@
+"""
+Access to qiskit_ibm_runtime for the mitigation executors.
+
+qiskit_ibm_runtime is only imported when an executor first runs a circuit,
+so that importing the mitigation techniques stays fast.
+"""
+
+
+def get_sampler(backend):
+    """Return a ``SamplerV2`` running on ``backend``.
+
+    Raises:
+        ImportError: If qiskit-ibm-runtime is not installed.
+    """
+    try:
+        from qiskit_ibm_runtime import SamplerV2
+    except ImportError:
+        raise ImportError(
+            "qiskit-ibm-runtime is required to run mitigation executors.\n"
+            "Install it with: pip install qiskit-ibm-runtime"
+        )
+    return SamplerV2(mode=backend)
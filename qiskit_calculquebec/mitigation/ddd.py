@@ -11,14 +11,7 @@ Available rules (mitiq.ddd.rules):
   - ``'xyxy'`` : X-Y-X-Y sequence (recommended in general)
 """
 
-
-try:
-    from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
-    from qiskit_ibm_runtime import SamplerV2
-except ImportError:
-    generate_preset_pass_manager = None  # type: ignore[assignment]
-    SamplerV2 = None  # type: ignore[assignment,misc]
-
+from qiskit_calculquebec.mitigation._runtime import get_sampler
 
 _VALID_RULES = ("xx", "yy", "xyxy")
 
@@ -27,6 +20,7 @@ def _require_mitiq_ddd():
     try:
         from mitiq.ddd import execute_with_ddd
         from mitiq.ddd.rules import xx, yy, xyxy
+
         return execute_with_ddd, {"xx": xx, "yy": yy, "xyxy": xyxy}
     except ImportError:
         raise ImportError(
@@ -67,7 +61,7 @@ class DDDMitigation:
 
         >>> rem = ReadoutMitigation(backend, method='m3')
         >>> rem.cals_from_system()
-        >>> pm = generate_preset_pass_manager(optimization_level=0, backend=backend)
+        >>> pm = backend.get_pass_manager(optimization_level=0)
         >>> t = pm.run(circuit)
         >>> physical_qubits = (
         ...     [t.layout.final_layout[q] for q in t.qubits]
@@ -123,12 +117,17 @@ class DDDMitigation:
                 if circ.num_clbits == 0:
                     circ.measure_all()
 
-                pm = generate_preset_pass_manager(backend=backend, optimization_level=0)
+                pm = backend.get_pass_manager(optimization_level=0, use_cache=False)
                 transpiled = pm.run(circ)
                 if not isinstance(transpiled, list):
                     transpiled = [transpiled]
-                sampler = SamplerV2(mode=backend)
-                counts = sampler.run(transpiled, shots=shots).result()[0].join_data().get_counts()
+                sampler = get_sampler(backend)
+                counts = (
+                    sampler.run(transpiled, shots=shots)
+                    .result()[0]
+                    .join_data()
+                    .get_counts()
+                )
                 # Normalize multi-register keys (e.g. "0 0" → "00")
                 counts = {"".join(k.split()): v for k, v in counts.items()}
 
@@ -152,18 +151,24 @@ class DDDMitigation:
                 return MeasurementResult(np.array(bitstrings, dtype=int))
 
         else:
+
             def executor(circuit):
                 # mitiq may pass a circuit without measurements after DDD insertion — re-add them
                 circ = circuit.copy()
                 if circ.num_clbits == 0:
                     circ.measure_all()
 
-                pm = generate_preset_pass_manager(backend=backend, optimization_level=0)
+                pm = backend.get_pass_manager(optimization_level=0, use_cache=False)
                 transpiled = pm.run(circ)
                 if not isinstance(transpiled, list):
                     transpiled = [transpiled]
-                sampler = SamplerV2(mode=backend)
-                counts = sampler.run(transpiled, shots=shots).result()[0].join_data().get_counts()
+                sampler = get_sampler(backend)
+                counts = (
+                    sampler.run(transpiled, shots=shots)
+                    .result()[0]
+                    .join_data()
+                    .get_counts()
+                )
                 # Normalize multi-register keys (e.g. "0 0" → "00")
                 counts = {"".join(k.split()): v for k, v in counts.items()}
                 n = circuit.num_qubits
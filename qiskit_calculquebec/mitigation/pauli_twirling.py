@@ -11,17 +11,13 @@ Can be combined with ZNE (PT + ZNE) for stronger noise reduction.
 
 import numpy as np
 
-try:
-    from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
-    from qiskit_ibm_runtime import SamplerV2
-except ImportError:
-    generate_preset_pass_manager = None  # type: ignore[assignment]
-    SamplerV2 = None  # type: ignore[assignment,misc]
+from qiskit_calculquebec.mitigation._runtime import get_sampler
 
 
 def _require_mitiq_pt():
     try:
         from mitiq.pt import generate_pauli_twirl_variants
+
         return generate_pauli_twirl_variants
     except ImportError:
         raise ImportError(
@@ -34,6 +30,7 @@ def _require_mitiq_pt():
 def _require_mitiq_zne():
     try:
         from mitiq import zne
+
         return zne
     except ImportError:
         raise ImportError(
@@ -105,12 +102,17 @@ class PauliTwirlingMitigation:
             if circ.num_clbits == 0:
                 circ.measure_all()
 
-            pm = generate_preset_pass_manager(backend=backend, optimization_level=0)
+            pm = backend.get_pass_manager(optimization_level=0, use_cache=False)
             transpiled = pm.run(circ)
             if not isinstance(transpiled, list):
                 transpiled = [transpiled]
-            sampler = SamplerV2(mode=backend)
-            counts = sampler.run(transpiled, shots=shots).result()[0].join_data().get_counts()
+            sampler = get_sampler(backend)
+            counts = (
+                sampler.run(transpiled, shots=shots)
+                .result()[0]
+                .join_data()
+                .get_counts()
+            )
             # Normalize multi-register keys (e.g. "0 0" → "00")
             counts = {"".join(k.split()): v for k, v in counts.items()}
             n = circuit.num_qubits
@@ -258,5 +260,7 @@ class PauliTwirlingMitigation:
         """
         generate_pauli_twirl_variants = _require_mitiq_pt()
         base_executor = self._make_base_executor(rem=rem, qubits=qubits)
-        variants = generate_pauli_twirl_variants(circuit, num_circuits=self.num_variants)
+        variants = generate_pauli_twirl_variants(
+            circuit, num_circuits=self.num_variants
+        )
         return [base_executor(v) for v in variants]
@@ -30,20 +30,18 @@ from functools import reduce
 
 import numpy as np
 
-from qiskit_calculquebec.API.adapter import ApiAdapter
-
 logger = logging.getLogger(__name__)
 
-_DEFAULT_FIDELITY = 1.0 - 2e-2  # default fidelity used when benchmark data is missing
-
 
 # ── optional imports ───────────────────────────────────────────────────────
 
+
 def _require_mitiq():
     try:
         import mitiq  # noqa: F401
         from mitiq import MeasurementResult
         from mitiq.rem.inverse_confusion_matrix import mitigate_measurements
+
         return MeasurementResult, mitigate_measurements
     except ImportError:
         raise ImportError(
@@ -61,7 +59,15 @@ def _require_mthree():
         from mthree.classes import QuasiCollection
         from mthree.exceptions import M3Error
         import psutil
-        return _direct_solve, _cal_matrix, _iterative_solver, QuasiCollection, M3Error, psutil
+
+        return (
+            _direct_solve,
+            _cal_matrix,
+            _iterative_solver,
+            QuasiCollection,
+            M3Error,
+            psutil,
+        )
     except ImportError:
         raise ImportError(
             "mthree and psutil are required for method='m3'.\n"
@@ -113,10 +119,18 @@ class ReadoutMitigation:
 
         # Per-physical-qubit calibration matrices (None = not calibrated)
         self.single_qubit_cals: list | None = None
-        self.num_qubits: int = backend.target.num_qubits
         self.faulty_qubits: list = []
         self.cal_timestamp: str | None = None
 
+    @property
+    def num_qubits(self) -> int:
+        """Number of qubits of the backend.
+
+        Read from the backend target on demand, so that creating the
+        mitigator does not build the target.
+        """
+        return self.backend.target.num_qubits
+
     # ─────────────────────────────────────────────────────────────────────
     # Calibration — shared by both methods
     # ─────────────────────────────────────────────────────────────────────
@@ -124,7 +138,10 @@ class ReadoutMitigation:
     def cals_from_system(self, qubits: list[int] | None = None):
         """Load P(0|0) and P(1|1) from the Anyon benchmark (Calcul Québec API).
 
-        No calibration circuits are submitted to the hardware.
+        Values are read from the backend target's ``CalibrationTable``, so
+        they match the calibration the circuits were transpiled against
+        (including a backend pinned to a snapshot). No calibration circuits
+        are submitted to the hardware.
 
         Args:
             qubits (list[int] | None): Physical qubits to calibrate. ``None``
@@ -133,22 +150,20 @@ class ReadoutMitigation:
         if qubits is None:
             qubits = list(range(self.num_qubits))
 
-        machine_name = self.backend._client.machine_name
-        benchmark = ApiAdapter.get_benchmark(machine_name)
-        qubits_data = benchmark["resultsPerDevice"]["qubits"]
+        calibration = self.backend.target.calibration
+        readout0 = calibration.readout0.tolist()
+        readout1 = calibration.readout1.tolist()
 
         self.single_qubit_cals = [None] * self.num_qubits
 
         for q in qubits:
-            qb = qubits_data.get(str(q), {})
-            p0 = qb.get("parallelReadoutState0Fidelity", _DEFAULT_FIDELITY)
-            p1 = qb.get("parallelReadoutState1Fidelity", _DEFAULT_FIDELITY)
+            p0 = readout0[q]
+            p1 = readout1[q]
             # 2×2 calibration matrix:
             #   col 0 → prepared |0⟩: [P(0|0), P(1|0)]
             #   col 1 → prepared |1⟩: [P(0|1), P(1|1)]
             self.single_qubit_cals[q] = np.array(
-                [[p0,       1.0 - p1],
-                 [1.0 - p0, p1      ]],
+                [[p0, 1.0 - p1], [1.0 - p0, p1]],
                 dtype=np.float64,
             )
 
@@ -163,7 +178,8 @@ class ReadoutMitigation:
 
         logger.info(
             "Calibration loaded for %d qubits from the Anyon benchmark (%s).",
-            len(qubits), machine_name,
+            len(qubits),
+            self.backend.name,
         )
 
     def cals_from_matrices(self, matrices: list):
@@ -179,8 +195,7 @@ class ReadoutMitigation:
                 f"List length ({len(matrices)}) != num_qubits ({self.num_qubits})."
             )
         self.single_qubit_cals = [
-            np.asarray(m, dtype=np.float64) if m is not None else None
-            for m in matrices
+            np.asarray(m, dtype=np.float64) if m is not None else None for m in matrices
         ]
         self.faulty_qubits = _faulty_qubit_checker(self.single_qubit_cals)
 
@@ -199,7 +214,9 @@ class ReadoutMitigation:
             RuntimeError: If calibration has not been loaded yet.
         """
         if self.single_qubit_cals is None:
-            raise RuntimeError("Mitigator not calibrated. Call cals_from_system() first.")
+            raise RuntimeError(
+                "Mitigator not calibrated. Call cals_from_system() first."
+            )
         if qubits is None:
             qubits = range(self.num_qubits)
         result = []
@@ -247,7 +264,9 @@ class ReadoutMitigation:
                 requested qubit is not calibrated.
         """
         if self.single_qubit_cals is None:
-            raise RuntimeError("Mitigator not calibrated. Call cals_from_system() first.")
+            raise RuntimeError(
+                "Mitigator not calibrated. Call cals_from_system() first."
+            )
 
         missing = [q for q in qubits if self.single_qubit_cals[q] is None]
         if missing:
@@ -392,9 +411,14 @@ class ReadoutMitigation:
         """
         from time import perf_counter
 
-        _direct_solve, _cal_matrix, _iterative_solver, QuasiCollection, M3Error, psutil = (
-            _require_mthree()
-        )
+        (
+            _direct_solve,
+            _cal_matrix,
+            _iterative_solver,
+            QuasiCollection,
+            M3Error,
+            psutil,
+        ) = _require_mthree()
 
         counts = dict(counts)
         shots = sum(counts.values())
@@ -434,8 +458,10 @@ class ReadoutMitigation:
                 mit_counts.mitigation_overhead = gamma * gamma
             if details:
                 return mit_counts, {
-                    "method": "direct", "time": dur,
-                    "dimension": num_elems, "col_norms": col_norms,
+                    "method": "direct",
+                    "time": dur,
+                    "dimension": num_elems,
+                    "col_norms": col_norms,
                 }
             return mit_counts
 
@@ -448,7 +474,14 @@ class ReadoutMitigation:
             if details:
                 st = perf_counter()
                 mit_counts, col_norms, gamma = _iterative_solver(
-                    self, counts, qubits, distance, tol, max_iter, 1, _cb,
+                    self,
+                    counts,
+                    qubits,
+                    distance,
+                    tol,
+                    max_iter,
+                    1,
+                    _cb,
                     return_mitigation_overhead,
                 )
                 dur = perf_counter() - st
@@ -456,12 +489,21 @@ class ReadoutMitigation:
                 if gamma is not None:
                     mit_counts.mitigation_overhead = gamma * gamma
                 return mit_counts, {
-                    "method": "iterative", "time": dur,
-                    "dimension": num_elems, "iterations": iter_count[0],
+                    "method": "iterative",
+                    "time": dur,
+                    "dimension": num_elems,
+                    "iterations": iter_count[0],
                     "col_norms": col_norms,
                 }
             mit_counts, gamma = _iterative_solver(
-                self, counts, qubits, distance, tol, max_iter, 0, _cb,
+                self,
+                counts,
+                qubits,
+                distance,
+                tol,
+                max_iter,
+                0,
+                _cb,
                 return_mitigation_overhead,
             )
             mit_counts.shots = shots
@@ -470,7 +512,9 @@ class ReadoutMitigation:
             return mit_counts
 
         else:
-            raise ValueError(f"Invalid solver: {solver!r}. Choose 'auto', 'direct', or 'iterative'.")
+            raise ValueError(
+                f"Invalid solver: {solver!r}. Choose 'auto', 'direct', or 'iterative'."
+            )
 
     # ─────────────────────────────────────────────────────────────────────
     # Internal interface used by mthree solvers
@@ -485,7 +529,9 @@ class ReadoutMitigation:
         qubits = np.asarray(qubits, dtype=int)
         cals = np.zeros(4 * len(qubits), dtype=np.float32)
         for kk, qubit in enumerate(qubits[::-1]):
-            cals[4 * kk: 4 * kk + 4] = self.single_qubit_cals[qubit].astype(np.float32).ravel()
+            cals[4 * kk : 4 * kk + 4] = (
+                self.single_qubit_cals[qubit].astype(np.float32).ravel()
+            )
         return cals
 
     def reduced_cal_matrix(self, counts, qubits, distance=None):
@@ -509,6 +555,7 @@ class ReadoutMitigation:
 # Internal utility
 # ─────────────────────────────────────────────────────────────────────────
 
+
 def _faulty_qubit_checker(cals: list) -> list:
     """Return indices of qubits with inverted calibration (P(0|1) >= P(0|0)).
 
@@ -517,6 +564,7 @@ def _faulty_qubit_checker(cals: list) -> list:
     it was prepared in |0⟩ — indicating the readout is unreliable.
     """
     return [
-        idx for idx, cal in enumerate(cals)
+        idx
+        for idx, cal in enumerate(cals)
         if cal is not None and cal[0, 1] >= cal[0, 0]
     ]
@@ -7,18 +7,13 @@ Wraps the MonarQ executor and delegates extrapolation to mitiq.zne.
 modify the circuit after noise folding applied by mitiq.
 """
 
-
-try:
-    from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
-    from qiskit_ibm_runtime import SamplerV2
-except ImportError:
-    generate_preset_pass_manager = None  # type: ignore[assignment]
-    SamplerV2 = None  # type: ignore[assignment,misc]
+from qiskit_calculquebec.mitigation._runtime import get_sampler
 
 
 def _require_mitiq_zne():
     try:
         from mitiq import zne
+
         return zne
     except ImportError:
         raise ImportError(
@@ -77,7 +72,7 @@ class ZNEMitigation:
 
         >>> rem = ReadoutMitigation(backend, method='m3')
         >>> rem.cals_from_system()
-        >>> pm = generate_preset_pass_manager(optimization_level=0, backend=backend)
+        >>> pm = backend.get_pass_manager(optimization_level=0)
         >>> t = pm.run(circuit)
         >>> physical_qubits = (
         ...     [t.layout.final_layout[q] for q in t.qubits]
@@ -135,12 +130,17 @@ class ZNEMitigation:
                 if circ.num_clbits == 0:
                     circ.measure_all()
 
-                pm = generate_preset_pass_manager(backend=backend, optimization_level=0)
+                pm = backend.get_pass_manager(optimization_level=0, use_cache=False)
                 transpiled = pm.run(circ)
                 if not isinstance(transpiled, list):
                     transpiled = [transpiled]
-                sampler = SamplerV2(mode=backend)
-                counts = sampler.run(transpiled, shots=shots).result()[0].join_data().get_counts()
+                sampler = get_sampler(backend)
+                counts = (
+                    sampler.run(transpiled, shots=shots)
+                    .result()[0]
+                    .join_data()
+                    .get_counts()
+                )
                 # Normalize multi-register keys (e.g. "0 0" → "00")
                 counts = {"".join(k.split()): v for k, v in counts.items()}
 
@@ -164,18 +164,24 @@ class ZNEMitigation:
                 return MeasurementResult(np.array(bitstrings, dtype=int))
 
         else:
+
             def executor(circuit):
                 # mitiq strips measurements before folding — re-add them if needed
                 circ = circuit.copy()
                 if circ.num_clbits == 0:
                     circ.measure_all()
 
-                pm = generate_preset_pass_manager(backend=backend, optimization_level=0)
+                pm = backend.get_pass_manager(optimization_level=0, use_cache=False)
                 transpiled = pm.run(circ)
                 if not isinstance(transpiled, list):
                     transpiled = [transpiled]
-                sampler = SamplerV2(mode=backend)
-                counts = sampler.run(transpiled, shots=shots).result()[0].join_data().get_counts()
+                sampler = get_sampler(backend)
+                counts = (
+                    sampler.run(transpiled, shots=shots)
+                    .result()[0]
+                    .join_data()
+                    .get_counts()
+                )
                 # Normalize multi-register keys (e.g. "0 0" → "00")
                 counts = {"".join(k.split()): v for k, v in counts.items()}
                 n = circuit.num_qubits
@@ -285,9 +291,11 @@ class ZNEMitigation:
         executor = self._make_executor(observable=observable)
 
         folded = [
-            zne.scaling.fold_gates_at_random(circuit, s)
-            if self.scale_noise is None
-            else self.scale_noise(circuit, s)
+            (
+                zne.scaling.fold_gates_at_random(circuit, s)
+                if self.scale_noise is None
+                else self.scale_noise(circuit, s)
+            )
             for s in self.scale_factors
         ]
 
@@ -6,6 +6,7 @@ from qiskit_calculquebec.API.adapter import (
 )
 from qiskit_calculquebec.API.client import MonarqClient
 import pytest
+import json
 from unittest.mock import patch
 from qiskit_calculquebec.API.api_utility import ApiUtility, keys
 from datetime import datetime, timedelta
@@ -157,7 +158,21 @@ def test_get_benchmark(
     benchmark = ApiAdapter.get_benchmark("yamaska")
     assert all(test_benchmark[k] == benchmark[k] for k in benchmark)
 
+    # test force_refresh bypasses a valid cache
+    mock_requests_get.side_effect = lambda route, headers: (
+        Res(200, test_machine_str)
+        if "benchmark" not in route
+        else Res(200, test_benchmark_str2)
+    )
+    benchmark = ApiAdapter.get_benchmark("yamaska", force_refresh=True)
+    assert benchmark == {"test": "im a benchmark2"}
+
     # test 400 and last_update > 24 h
+    mock_requests_get.side_effect = lambda route, headers: (
+        Res(400, test_machine_str)
+        if "benchmark" not in route
+        else Res(400, test_benchmark_str2)
+    )
     mock_is_last_update_expired.return_value = True
     with pytest.raises(Exception):
         benchmark = ApiAdapter.get_benchmark("yamaska")
@@ -176,6 +191,37 @@ def test_post_job(mock_job_body, mock_get_project_id_by_name, mock_requests_post
         ApiAdapter.post_job(circuit={})
 
 
+def test_post_job_stream(mock_requests_post):
+    ApiAdapter.initialize(client)
+    from qiskit import QuantumCircuit
+
+    qc = QuantumCircuit(1, 1)
+    qc.x(0)
+    qc.measure(0, 0)
+
+    mock_requests_post.return_value = Res(200, "{'jobID': 'a_job_uuid'}")
+    assert ApiAdapter.post_job_stream(qc, 10).text == "{'jobID': 'a_job_uuid'}"
+    body = b"".join(mock_requests_post.call_args.kwargs["data"])
+    assert json.loads(body)[keys.CIRCUIT] == ApiUtility.convert_circuit(qc)
+
+    mock_requests_post.return_value = Res(400, '{"error" : 42}')
+    with pytest.raises(Exception):
+        ApiAdapter.post_job_stream(qc)
+
+
+def test_post_job_stream_checks_circuit_first(mock_requests_post):
+    ApiAdapter.initialize(client)
+    from qiskit import QuantumCircuit
+
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+
+    with pytest.raises(ValueError, match="Unsupported instruction"):
+        ApiAdapter.post_job_stream(qc)
+    mock_requests_post.assert_not_called()
+
+
 def test_list_jobs(mock_requests_get):
     ApiAdapter.clean_cache()
     ApiAdapter.initialize(client)
@@ -245,6 +291,28 @@ def test_get_connectivity_for_machine(mock_list_machines):
         ApiAdapter.get_connectivity_for_machine("c")
 
 
+def test_get_connectivity_for_machine_cached(mock_list_machines):
+    ApiAdapter.clean_cache()
+    ApiAdapter.initialize(client)
+
+    mock_list_machines.return_value = [
+        {"name": "a", "couplerToQubitMap": {"0": [0, 1]}},
+        {"name": "b", "couplerToQubitMap": {"0": [1, 2]}},
+    ]
+
+    assert ApiAdapter.get_connectivity_for_machine("a") == {"0": [0, 1]}
+    assert ApiAdapter.get_connectivity_for_machine("b") == {"0": [1, 2]}
+    assert mock_list_machines.call_count == 1
+
+    ApiAdapter.get_connectivity_for_machine("a", force_refresh=True)
+    assert mock_list_machines.call_count == 2
+
+    # Unknown machines are looked up again before failing
+    with pytest.raises(ApiException):
+        ApiAdapter.get_connectivity_for_machine("c")
+    assert mock_list_machines.call_count == 3
+
+
 def test_get_machine_by_name(mock_requests_get):
     ApiAdapter.clean_cache()
     ApiAdapter.initialize(client)
@@ -129,3 +129,14 @@ def test_eventual_success(mock_sleep, reset_function_state):
     assert result == "Success after failures"
     # Should have slept exactly the number of failures times
     assert mock_sleep.call_count == failures
+
+
+def test_retry_on_only_listed_exceptions(mock_sleep):
+    """Exceptions outside retry_on are raised on the first attempt"""
+    func = Mock(side_effect=ValueError("not retried"))
+    decorated_func = retry(retries=3, retry_on=(OSError,))(func)
+
+    with pytest.raises(ValueError):
+        decorated_func()
+    assert func.call_count == 1
+    mock_sleep.assert_not_called()
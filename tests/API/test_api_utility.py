@@ -1,9 +1,11 @@
 import pytest
 from unittest.mock import patch
+import json
 import numpy as np
 from base64 import b64encode
 from qiskit.circuit import Gate, QuantumCircuit
 from qiskit_calculquebec.API.api_utility import (
+    PAYLOAD_BIT_COUNT,
     ApiUtility,
     keys,
 )
@@ -64,8 +66,10 @@ def test_convert_instruction_unsupported():
 
 
 def test_convert_circuit(monkeypatch):
-    # Patch convert_instruction to track calls
-    monkeypatch.setattr(ApiUtility, "convert_instruction", lambda x: {"dummy": x.name})
+    # Patch iter_runs to track calls
+    monkeypatch.setattr(
+        ApiUtility, "iter_runs", lambda c: (({"dummy": x.name}, 1) for x in c.data)
+    )
 
     circuit = QuantumCircuit(2)
     circuit.x(0)
@@ -98,3 +102,117 @@ def test_job_body():
     assert body[keys.PROJECT_ID] == "proj"
     assert body[keys.MACHINE_NAME] == "machine"
     assert body[keys.SHOT_COUNT] == 100
+
+
+def make_deep_circuit():
+    qc = QuantumCircuit(2, 2)
+    for i in range(50):
+        qc.rz(0.1 * i, 0)
+        qc.cz(0, 1)
+        qc.id(1)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+def test_iter_circuit_json_matches_convert_circuit():
+    qc = make_deep_circuit()
+    streamed = "".join(ApiUtility.iter_circuit_json(qc))
+    assert streamed == ApiUtility.encode_circuit(ApiUtility.convert_circuit(qc))
+
+
+def test_payloads_share_bit_count():
+    qc = make_deep_circuit()
+    streamed = json.loads("".join(ApiUtility.iter_circuit_json(qc)))
+    assert streamed[keys.BIT_COUNT] == PAYLOAD_BIT_COUNT
+    assert ApiUtility.convert_circuit(qc)[keys.BIT_COUNT] == PAYLOAD_BIT_COUNT
+
+
+def test_iter_job_body_matches_job_body():
+    qc = make_deep_circuit()
+    chunks = list(
+        ApiUtility.iter_job_body(qc, "name", "proj", "yukon", 10, chunk_size=256)
+    )
+    assert len(chunks) > 1
+    assert all(isinstance(c, bytes) for c in chunks)
+
+    body = json.loads(b"".join(chunks))
+    expected = ApiUtility.job_body(
+        ApiUtility.convert_circuit(qc), "name", "proj", "yukon", 10
+    )
+    assert body == json.loads(json.dumps(expected))
+
+
+def test_iter_job_body_rejects_unsupported_gate():
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    with pytest.raises(ValueError):
+        b"".join(ApiUtility.iter_job_body(qc, "name", "proj", "yukon", 10))
+
+
+def test_iter_operations_matches_convert_instruction():
+    from qiskit import QuantumRegister, ClassicalRegister
+
+    a, b = QuantumRegister(2, "a"), QuantumRegister(2, "b")
+    c = ClassicalRegister(2, "c")
+    qc = QuantumCircuit(a, b, c)
+    qc.rz(0.3, a[1])
+    qc.cz(a[0], b[1])
+    qc.sx(b[0])
+    qc.measure(b[1], c[1])
+
+    expected = [ApiUtility.convert_instruction(op) for op in qc.data]
+    assert list(ApiUtility.iter_operations(qc)) == expected
+    # Register-local indices, as Bit._index
+    assert expected[1][keys.QUBITS] == [0, 1]
+
+
+def test_iter_operations_rejects_unsupported_gate():
+    qc = QuantumCircuit(1)
+    qc.x(0)
+    qc.h(0)
+    with pytest.raises(ValueError, match="'h'"):
+        ApiUtility.convert_circuit(qc)
+
+
+def test_delay_is_expanded_at_serialization():
+    qc = QuantumCircuit(2, 1)
+    qc.delay(5000, 1, unit="dt")
+    qc.x(0)
+    qc.delay(0, 0, unit="dt")
+    qc.measure(1, 0)
+
+    expanded = QuantumCircuit(2, 1)
+    for _ in range(5000):
+        expanded.id(1)
+    expanded.x(0)
+    expanded.measure(1, 0)
+
+    assert [n for _, n in ApiUtility.iter_runs(qc)] == [5000, 1, 1]
+    assert ApiUtility.convert_circuit(qc) == ApiUtility.convert_circuit(expanded)
+    assert "".join(ApiUtility.iter_circuit_json(qc)) == "".join(
+        ApiUtility.iter_circuit_json(expanded)
+    )
+
+
+def test_delay_must_be_in_dt():
+    qc = QuantumCircuit(1)
+    qc.delay(1.0, 0, unit="us")
+    with pytest.raises(ValueError):
+        ApiUtility.convert_circuit(qc)
+
+
+def test_check_circuit():
+    qc = QuantumCircuit(1, 1)
+    qc.x(0)
+    qc.delay(10, 0, unit="dt")
+    qc.measure(0, 0)
+    ApiUtility.check_circuit(qc)  # should not raise
+
+    qc.delay(1.0, 0, unit="us")
+    with pytest.raises(ValueError, match="dt"):
+        ApiUtility.check_circuit(qc)
+
+    qc = QuantumCircuit(1)
+    qc.h(0)
+    with pytest.raises(ValueError, match="'h'"):
+        ApiUtility.check_circuit(qc)
@@ -0,0 +1,143 @@
+import numpy as np
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import UnitaryGate
+from qiskit_calculquebec.API.api_utility import ApiUtility
+from qiskit_calculquebec.API.circuit_hash import (
+    CircuitHasher,
+    hash_circuit,
+    hash_payload,
+)
+from qiskit_calculquebec.API.job import Job
+
+
+def make_circuit(theta=0.3, qreg="q", creg="c"):
+    qc = QuantumCircuit(QuantumRegister(2, qreg), ClassicalRegister(2, creg))
+    qc.rz(theta, 0)
+    qc.cz(0, 1)
+    qc.sx(1)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+def test_hash_ignores_register_names():
+    assert hash_circuit(make_circuit()) == hash_circuit(
+        make_circuit(qreg="a", creg="b")
+    )
+
+
+def test_hash_depends_on_structure():
+    base = hash_circuit(make_circuit())
+    assert base != hash_circuit(make_circuit(theta=0.4))
+
+    swapped = QuantumCircuit(2, 2)
+    swapped.rz(0.3, 1)
+    swapped.cz(0, 1)
+    swapped.sx(1)
+    swapped.measure([0, 1], [0, 1])
+    assert base != hash_circuit(swapped)
+
+    split = QuantumCircuit(
+        QuantumRegister(2), ClassicalRegister(1), ClassicalRegister(1)
+    )
+    split.rz(0.3, 0)
+    split.cz(0, 1)
+    split.sx(1)
+    split.measure([0, 1], [0, 1])
+    assert base != hash_circuit(split)
+
+
+def test_angle_tolerance():
+    noisy = make_circuit(theta=0.3 + 1e-12)
+    assert hash_circuit(make_circuit()) == hash_circuit(noisy)
+    assert hash_circuit(make_circuit(), tolerance=0) != hash_circuit(noisy, tolerance=0)
+    assert hash_circuit(make_circuit(theta=0.3001), tolerance=1e-3) == hash_circuit(
+        make_circuit(), tolerance=1e-3
+    )
+
+
+def test_parameterized_circuit():
+    theta = Parameter("theta")
+    assert hash_circuit(make_circuit(theta)) == hash_circuit(make_circuit(theta))
+    assert hash_circuit(make_circuit(theta)) != hash_circuit(make_circuit(2 * theta))
+
+
+def test_control_flow_blocks_are_hashed():
+    def make(gate):
+        qc = QuantumCircuit(1, 1)
+        qc.measure(0, 0)
+        with qc.if_test((qc.clbits[0], 1)):
+            getattr(qc, gate)(0)
+        return qc
+
+    assert hash_circuit(make("x")) == hash_circuit(make("x"))
+    assert hash_circuit(make("x")) != hash_circuit(make("sx"))
+
+
+def _custom(name, gate):
+    block = QuantumCircuit(1, name=name)
+    getattr(block, gate)(0)
+    qc = QuantumCircuit(1, 1)
+    qc.append(block.to_gate(), [0])
+    qc.measure(0, 0)
+    return qc
+
+
+def test_custom_gate_definitions_are_hashed():
+    assert hash_circuit(_custom("blk", "x")) == hash_circuit(_custom("blk", "x"))
+    assert hash_circuit(_custom("blk", "x")) != hash_circuit(_custom("blk", "h"))
+
+
+def test_custom_gate_does_not_match_standard_gate():
+    standard = QuantumCircuit(1, 1)
+    standard.h(0)
+    standard.measure(0, 0)
+    assert hash_circuit(_custom("h", "h")) != hash_circuit(standard)
+
+
+def test_control_state_is_hashed():
+    def make(ctrl_state):
+        qc = QuantumCircuit(3)
+        qc.append(UnitaryGate(np.eye(2)).control(2, ctrl_state=ctrl_state), [0, 1, 2])
+        return qc
+
+    assert hash_circuit(make(1)) != hash_circuit(make(2))
+
+
+def test_array_parameters_are_hashed_whole():
+    def make(matrix):
+        qc = QuantumCircuit(6)
+        qc.append(UnitaryGate(matrix, check_input=False), range(6))
+        return qc
+
+    # str() elides the middle of a 64x64 matrix
+    changed = np.eye(64)
+    changed[32, 32] = -1
+    assert hash_circuit(make(np.eye(64))) != hash_circuit(make(changed))
+    noisy = np.eye(64) + 1e-13
+    assert hash_circuit(make(np.eye(64))) == hash_circuit(make(noisy))
+
+
+def test_hash_payload():
+    payload = ApiUtility.convert_circuit(make_circuit())
+    assert hash_payload(payload) == hash_payload(
+        ApiUtility.convert_circuit(make_circuit(qreg="a", creg="b"))
+    )
+    assert hash_payload(payload) != hash_payload(
+        ApiUtility.convert_circuit(make_circuit(theta=np.pi))
+    )
+
+
+def test_incremental_matches_whole_payload():
+    qc = make_circuit()
+    qc.delay(5000, 1, unit="dt")
+    qc.measure(1, 1)
+
+    hasher = CircuitHasher()
+    hasher.update_payload_header(len(qc.qubits), 24)
+    for operation, count in ApiUtility.iter_runs(qc):
+        hasher.update_operation(operation, count)
+
+    expected = hash_payload(ApiUtility.convert_circuit(qc))
+    assert hasher.hexdigest() == expected
+    assert Job(qc, stream=True).fingerprint() == expected
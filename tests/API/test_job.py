@@ -113,3 +113,21 @@ class TestJob:
         response = ResponseError()
         with pytest.raises(JobException):
             job.raise_api_error(response)
+
+    def test_stream_mode(self, mock_post_job):
+        qc = QuantumCircuit(1, 1)
+        qc.x(0)
+        qc.measure(0, 0)
+
+        with patch(
+            "qiskit_calculquebec.API.adapter.ApiAdapter.post_job_stream"
+        ) as mock_stream:
+            mock_stream.return_value.status_code = 200
+            mock_stream.return_value.text = '{"job":{"id":"123"}}'
+            job = Job(qc, shots=10, stream=True)
+            assert job.circuit_dict is None
+            assert job.run_getID() == "123"
+            mock_stream.assert_called_once_with(qc, 10)
+            mock_post_job.assert_not_called()
+
+        assert job.fingerprint() == Job(qc, stream=False).fingerprint()
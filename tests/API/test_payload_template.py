@@ -0,0 +1,75 @@
+import pytest
+from unittest.mock import patch
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+
+from qiskit_calculquebec.API.api_utility import ApiUtility, keys
+from qiskit_calculquebec.API.job import Job
+from qiskit_calculquebec.API.payload_template import PayloadTemplate
+
+theta = Parameter("theta")
+phi = Parameter("phi")
+
+
+def make_circuit():
+    qc = QuantumCircuit(2, 2)
+    qc.rz(theta, 0)
+    qc.cz(0, 1)
+    qc.p(2 * phi + 1, 1)
+    qc.rz(0.5, 1)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+def test_bind_matches_convert_circuit():
+    qc = make_circuit()
+    template = PayloadTemplate(qc)
+    assert template.num_parameters == 2
+
+    bound = qc.assign_parameters({theta: 0.1, phi: 0.2})
+    expected = ApiUtility.convert_circuit(bound)
+
+    assert template.bind({theta: 0.1, phi: 0.2}) == expected
+    # Sequence follows circuit.parameters order (phi, theta)
+    assert template.bind([0.2, 0.1]) == expected
+
+
+def test_bind_only_rebuilds_parameterized_slots():
+    template = PayloadTemplate(make_circuit())
+    first = template.bind([0.0, 0.0])
+    second = template.bind([1.0, 1.0])
+
+    ops1, ops2 = first[keys.OPERATIONS], second[keys.OPERATIONS]
+    assert ops1[1] is ops2[1]
+    assert ops1[0] is not ops2[0]
+    assert ops2[0][keys.PARAMETERS]["lambda"] == 1.0
+    assert ops2[2][keys.PARAMETERS]["lambda"] == 3.0
+
+
+def test_bind_validates_values():
+    template = PayloadTemplate(make_circuit())
+    with pytest.raises(ValueError):
+        template.bind({theta: 0.1})
+    with pytest.raises(ValueError):
+        template.bind([0.1])
+
+
+def test_template_checks_measurements():
+    qc = QuantumCircuit(1, 1)
+    qc.rz(theta, 0)
+    with pytest.raises(ValueError):
+        PayloadTemplate(qc)
+
+    qc.measure(0, 0)
+    qc.rz(theta, 0)
+    with pytest.raises(ValueError):
+        PayloadTemplate(qc)
+
+
+def test_job_accepts_payload():
+    payload = PayloadTemplate(make_circuit()).bind([0.1, 0.2])
+    with patch("qiskit_calculquebec.API.adapter.ApiAdapter.post_job") as post_job:
+        post_job.return_value.status_code = 200
+        post_job.return_value.text = '{"job":{"id":"123"}}'
+        assert Job(payload, shots=10).run_getID() == "123"
+        post_job.assert_called_once_with(payload, 10)
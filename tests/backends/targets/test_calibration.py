@@ -0,0 +1,161 @@
+import pickle
+import numpy as np
+import pytest
+
+from qiskit_calculquebec.backends.targets.calibration import (
+    DEFAULT_CZ_ERROR,
+    CalibrationTable,
+)
+from qiskit_calculquebec.backends.targets.yukon import Yukon
+
+benchmark = {
+    "resultsPerDevice": {
+        "qubits": {
+            "0": {
+                "t1": 1e-5,
+                "t2Echo": 2e-5,
+                "parallelSingleQubitGateFidelity": 0.99,
+                "parallelReadoutState0Fidelity": 0.9,
+                "parallelReadoutState1Fidelity": 0.8,
+            },
+            "1": {
+                "t1": 3e-5,
+                "parallelSingleQubitGateFidelity": 0.999,
+                "parallelReadoutState0Fidelity": 0.99,
+                "parallelReadoutState1Fidelity": 0.97,
+            },
+            "2": {
+                "parallelSingleQubitGateFidelity": 0.995,
+                "parallelReadoutState0Fidelity": 0.95,
+                "parallelReadoutState1Fidelity": 0.95,
+            },
+        },
+        "couplers": {"0": {"czGateFidelity": 0.97}},
+    }
+}
+
+
+def test_from_benchmark():
+    table = CalibrationTable.from_benchmark(benchmark, 3, [(0, 1), (1, 2)])
+
+    assert table.num_qubits == 3
+    assert table.t1[1] == 3e-5
+    assert np.isnan(table.t2[1]) and np.isnan(table.t1[2])
+    assert np.allclose(table.readout_fidelity, [0.85, 0.98, 0.95])
+    assert np.allclose(table.cz_fidelity, [0.97, 1 - DEFAULT_CZ_ERROR])
+    assert table.couplers.tolist() == [[0, 1], [1, 2]]
+
+
+def test_immutable():
+    table = CalibrationTable.from_benchmark(benchmark, 3)
+    with pytest.raises(ValueError):
+        table.t1[0] = 0.0
+    with pytest.raises(AttributeError):
+        table.t1 = None
+
+    restored = pickle.loads(pickle.dumps(table))
+    assert restored == table
+    with pytest.raises(ValueError):
+        restored.readout0[0] = 0.0
+
+
+def test_best_qubits():
+    table = CalibrationTable.from_benchmark(benchmark, 3)
+    assert table.best_qubits(1).tolist() == [1]
+    assert table.best_qubits(3).tolist() == [1, 2, 0]
+    with pytest.raises(ValueError):
+        table.best_qubits(4)
+
+    # Equal scores: lowest index first
+    assert CalibrationTable.from_benchmark(None, 5).best_qubits(2).tolist() == [0, 1]
+
+
+def test_fingerprint():
+    a = CalibrationTable.from_benchmark(benchmark, 3)
+    assert a.fingerprint == CalibrationTable.from_benchmark(benchmark, 3).fingerprint
+    assert a.fingerprint != CalibrationTable.from_benchmark(None, 3).fingerprint
+
+
+def test_target_shares_table():
+    target = Yukon(benchmark)
+    table = target.calibration
+    assert table.num_qubits == 6
+    assert table.couplers.tolist() == [[0, 1], [1, 2], [2, 3], [3, 4], [4, 5]]
+    assert target.qubit_properties[0].t1 == 1e-5
+    assert target.qubit_properties[2].t1 is None
+    assert np.isclose(target["measure"][(0,)].error, 1 - table.readout_fidelity[0])
+    assert np.isclose(target["cz"][(1, 0)].error, 0.03)
+
+
+def test_coupler_index_from_connectivity():
+    # Coupler IDs in an order unrelated to the coupling map
+    connectivity = {"0": [2, 3], "1": [0, 1], "3": [1, 2]}
+    bench = {
+        "resultsPerDevice": {
+            "qubits": {},
+            "couplers": {
+                "0": {"czGateFidelity": 0.91},
+                "1": {"czGateFidelity": 0.92},
+                "3": {"czGateFidelity": 0.93},
+            },
+        }
+    }
+    table = CalibrationTable.from_benchmark(bench, 4, connectivity)
+
+    assert table.coupler_ids.tolist() == [0, 1, 3]
+    assert table.coupler_index[1, 0] == table.coupler_index[0, 1] == 1
+    assert table.coupler_index[0, 2] == -1
+    assert table.edge_fidelity(3, 2) == 0.91
+    assert table.edge_fidelity(2, 1) == 0.93
+    assert np.isnan(table.edge_fidelity(0, 3))
+    assert table.connectivity() == connectivity
+
+    with pytest.raises(ValueError):
+        CalibrationTable.from_benchmark(bench, 3, connectivity)
+
+
+def test_target_matches_edges_to_couplers():
+    connectivity = {str(i): [5 - i, 4 - i] for i in range(5)}
+    bench = {
+        "resultsPerDevice": {
+            "qubits": {},
+            "couplers": {str(i): {"czGateFidelity": 0.9 + i / 100} for i in range(5)},
+        }
+    }
+    target = Yukon(bench, connectivity)
+
+    # Coupler 0 joins qubits 5 and 4, in both directions
+    assert np.isclose(target["cz"][(4, 5)].error, 0.1)
+    assert np.isclose(target["cz"][(5, 4)].error, 0.1)
+    assert np.isclose(target["cz"][(0, 1)].error, 1 - 0.94)
+
+    # A benchmark-only update keeps the couplers
+    target.update_calibration(bench)
+    assert target.calibration.connectivity() == connectivity
+    assert np.isclose(target["cz"][(0, 1)].error, 1 - 0.94)
+
+
+def test_routing_costs():
+    connectivity = {"0": [0, 1], "1": [1, 2], "2": [0, 2]}
+    bench = {
+        "resultsPerDevice": {
+            "qubits": {},
+            "couplers": {
+                "0": {"czGateFidelity": 0.99},
+                "1": {"czGateFidelity": 0.98},
+                "2": {"czGateFidelity": 0.9},
+            },
+        }
+    }
+    table = CalibrationTable.from_benchmark(bench, 4, connectivity)
+    costs = table.routing_costs()
+
+    assert costs is table.routing_costs()
+    assert np.allclose(costs, costs.T)
+    assert np.all(np.diag(costs) == 0)
+    # 0 -> 1 -> 2 beats the direct but noisier coupler
+    assert np.isclose(table.path_fidelity(0, 2), 0.99 * 0.98)
+    # Qubit 3 has no coupler
+    assert np.isinf(costs[0, 3]) and table.path_fidelity(0, 3) == 0.0
+    with pytest.raises(ValueError):
+        costs[0, 1] = 0.0
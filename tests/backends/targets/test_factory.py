@@ -0,0 +1,113 @@
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+
+from qiskit_calculquebec.backends.targets import factory
+from qiskit_calculquebec.backends.targets.factory import (
+    benchmark_fingerprint,
+    clear_target_cache,
+    get_target,
+)
+from qiskit_calculquebec.backends.targets.monarq import MonarQ
+from qiskit_calculquebec.backends.targets.yukon import Yukon
+
+
+def make_benchmark(t1=10.0):
+    return {
+        "resultsPerDevice": {
+            "qubits": {str(i): {"t1": t1 + i, "t2Echo": 20.0 + i} for i in range(24)}
+        }
+    }
+
+
+@pytest.fixture
+def api():
+    clear_target_cache()
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.instance",
+        return_value=MagicMock(),
+    ), patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_connectivity_for_machine",
+        return_value=None,
+    ), patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark",
+        return_value=make_benchmark(),
+    ) as get_benchmark:
+        yield get_benchmark
+    clear_target_cache()
+
+
+def test_targets_are_memoised_per_benchmark(api):
+    yukon = get_target("yukon")
+    assert isinstance(yukon, Yukon)
+    assert get_target("Yukon") is yukon
+    assert isinstance(get_target("monarq"), MonarQ)
+    api.assert_any_call("yamaska")
+
+    api.return_value = make_benchmark(t1=50.0)
+    recalibrated = get_target("yukon")
+    assert recalibrated is not yukon
+    assert recalibrated.qubit_properties[0].t1 == 50.0
+
+
+def test_targets_are_pickled_to_disk(api, tmp_path):
+    target = get_target("yukon", cache_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+
+    # Another process: empty memo, target loaded instead of built
+    clear_target_cache()
+    rebuild = MagicMock(side_effect=AssertionError("target rebuilt"))
+    with patch.dict(factory._MACHINES, {"yukon": (rebuild, "Yukon")}):
+        loaded = get_target("yukon", cache_dir=str(tmp_path))
+
+    assert loaded is not target
+    assert loaded.calibration_fingerprint() == target.calibration_fingerprint()
+
+
+def test_corrupt_pickle_is_rebuilt(api, tmp_path):
+    get_target("yukon", cache_dir=str(tmp_path))
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(b"garbage")
+
+    clear_target_cache()
+    assert isinstance(get_target("yukon", cache_dir=str(tmp_path)), Yukon)
+
+
+def test_unknown_machine():
+    with pytest.raises(ValueError):
+        get_target("unknown")
+
+
+def test_benchmark_fingerprint():
+    assert benchmark_fingerprint(make_benchmark()) == benchmark_fingerprint(
+        make_benchmark()
+    )
+    assert benchmark_fingerprint(make_benchmark()) != benchmark_fingerprint(
+        make_benchmark(t1=11.0)
+    )
+
+
+def test_refresh_keeps_each_targets_couplers(api):
+    from qiskit_calculquebec.backends.targets.factory import refresh_target
+
+    ids_a = {str(i): [i, i + 1] for i in range(5)}
+    ids_b = {str(i + 10): [i, i + 1] for i in range(5)}
+    a = get_target("yukon", benchmark=make_benchmark(), connectivity=ids_a)
+    b = get_target("yukon", benchmark=make_benchmark(), connectivity=ids_b)
+
+    new = make_benchmark(t1=50.0)
+    assert refresh_target("yukon", a, new).calibration.connectivity() == ids_a
+    assert refresh_target("yukon", b, new).calibration.connectivity() == ids_b
+
+
+def test_memo_keeps_recent_targets_per_machine(api):
+    monarq = get_target("monarq")
+    first = get_target("yukon", benchmark=make_benchmark(t1=0.0))
+    for t1 in range(1, factory.MAX_TARGETS_PER_MACHINE + 1):
+        get_target("yukon", benchmark=make_benchmark(t1=float(t1)))
+
+    assert get_target("yukon", benchmark=make_benchmark(t1=0.0)) is not first
+    assert get_target("monarq") is monarq
+    assert sum(k[0] == "yukon" for k in factory._targets) == (
+        factory.MAX_TARGETS_PER_MACHINE
+    )
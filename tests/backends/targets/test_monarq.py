@@ -15,7 +15,10 @@ def monarq_target():
         "qiskit_calculquebec.API.adapter.ApiAdapter.instance", autospec=True
     ) as mock_instance, patch(
         "qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark", autospec=True
-    ) as mock_get_benchmark:
+    ) as mock_get_benchmark, patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_connectivity_for_machine",
+        return_value=None,
+    ):
 
         # Make instance() return something truthy so Yukon goes into the API path
         mock_instance.return_value = MagicMock(name="ApiAdapterSingleton")
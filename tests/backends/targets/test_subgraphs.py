@@ -0,0 +1,81 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from qiskit_calculquebec.backends.targets.calibration import CalibrationTable
+from qiskit_calculquebec.backends.targets.monarq import MonarQ
+from qiskit_calculquebec.backends.targets.subgraphs import SubgraphIndex
+
+
+def chain(num_qubits, single=None, cz=None):
+    """Calibration of a chain 0 - 1 - ... - num_qubits - 1."""
+    qubits = {
+        str(q): {"parallelSingleQubitGateFidelity": f}
+        for q, f in (single or {}).items()
+    }
+    couplers = {str(i): {"czGateFidelity": f} for i, f in (cz or {}).items()}
+    return CalibrationTable.from_benchmark(
+        {"resultsPerDevice": {"qubits": qubits, "couplers": couplers}},
+        num_qubits,
+        [(i, i + 1) for i in range(num_qubits - 1)],
+    )
+
+
+def connected(subset, couplers):
+    subset = set(subset)
+    seen = {min(subset)}
+    stack = [min(subset)]
+    while stack:
+        q = stack.pop()
+        for a, b in couplers:
+            for u, v in ((a, b), (b, a)):
+                if u == q and v in subset and v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+    return seen == subset
+
+
+def test_enumerates_every_connected_subset_once():
+    # Explicit (empty) benchmark: never queries the API
+    calibration = MonarQ({}).calibration
+    index = SubgraphIndex(calibration, max_size=4)
+    couplers = calibration.couplers.tolist()
+
+    for n in range(1, 5):
+        found = [tuple(q) for q, _ in index.top(n)]
+        assert len(found) == len(set(found))
+        expected = {s for s in combinations(range(24), n) if connected(s, couplers)}
+        assert set(found) == expected
+
+
+def test_best_avoids_bad_qubits_and_couplers():
+    # Qubit 1 and coupler 3 (qubits 3 - 4) are bad
+    index = SubgraphIndex(chain(6, single={1: 0.5}, cz={3: 0.5}))
+    assert index.best(2) in ([2, 3], [4, 5])
+    assert index.best(4) == [2, 3, 4, 5]
+
+    fidelities = [f for _, f in index.top(2)]
+    assert fidelities == sorted(fidelities, reverse=True)
+    assert np.isclose(index.fidelity(index.best(2)), fidelities[0])
+
+
+def test_grown_and_disjoint_subsets():
+    index = SubgraphIndex(chain(6), max_size=2)
+    assert index.best(6) == list(range(6))
+    assert len(index.best(4)) == 4
+
+    picked = index.disjoint(2, 5)
+    assert len(picked) == 3
+    assert sorted(q for s in picked for q in s) == list(range(6))
+
+    with pytest.raises(ValueError):
+        index.top(3)
+    with pytest.raises(ValueError):
+        index.best(7)
+
+
+def test_index_cached_per_calibration():
+    calibration = chain(4)
+    assert calibration.subgraph_index() is calibration.subgraph_index()
+    assert calibration.subgraph_index(2) is not calibration.subgraph_index()
@@ -17,7 +17,10 @@ def yukon_target():
         "qiskit_calculquebec.API.adapter.ApiAdapter.instance", autospec=True
     ) as mock_instance, patch(
         "qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark", autospec=True
-    ) as mock_get_benchmark:
+    ) as mock_get_benchmark, patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_connectivity_for_machine",
+        return_value=None,
+    ):
 
         # Make instance() return something truthy so Yukon goes into the API path
         mock_instance.return_value = MagicMock(name="ApiAdapterSingleton")
@@ -111,3 +114,22 @@ def test_qubit_properties(yukon_target):
     qubit_props, gate_properties = yukon_target.__get_qubit_properties__()
     assert isinstance(qubit_props, list)
     assert isinstance(qubit_props[0], QubitProperties)
+
+
+def test_calibration_fingerprint_is_memoized(yukon_target):
+    from qiskit.transpiler import InstructionProperties
+
+    fingerprint = yukon_target.calibration_fingerprint()
+    with patch.object(Yukon, "_fingerprint") as compute:
+        assert yukon_target.calibration_fingerprint() == fingerprint
+        compute.assert_not_called()
+
+    qargs = next(iter(yukon_target["cz"]))
+    yukon_target.update_instruction_properties(
+        "cz", qargs, InstructionProperties(duration=1e-7, error=0.5)
+    )
+    assert yukon_target.calibration_fingerprint() != fingerprint
+    assert yukon_target.calibration_fingerprint() == yukon_target._fingerprint()
+
+    yukon_target.update_calibration()
+    assert yukon_target.calibration_fingerprint() == yukon_target._fingerprint()
@@ -0,0 +1,64 @@
+"""Cold-start tests of qiskit_calculquebec.backends.
+
+The import time budget is checked by tests/benchmarks/bench_import_time.py.
+"""
+
+import subprocess
+import sys
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary
+
+from qiskit_calculquebec.custom_gates.equivalences import register_equivalences
+from qiskit_calculquebec.custom_gates.ry_90_gate import RY90Gate
+from qiskit_calculquebec.custom_gates.ry_m90_gate import RYm90Gate
+
+# Only needed once a job is submitted or a transpiled circuit is cached
+DEFERRED_MODULES = ("requests", "urllib3", "qiskit.qpy")
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, *code], capture_output=True, text=True, check=True
+    )
+
+
+def test_import_defers_heavy_modules():
+    script = (
+        "import sys\n"
+        "import qiskit_calculquebec.backends\n"
+        "from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary\n"
+        f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])\n"
+        "print(any(k.name == 'ry90' for k in SessionEquivalenceLibrary.keys()))"
+    )
+    loaded, registered = _run(["-c", script]).stdout.split("\n")[:2]
+    assert loaded == "[]"
+    assert registered == "False"
+
+
+def test_building_a_gate_registers_equivalences():
+    # No target, backend or pass manager is built first
+    script = (
+        "from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary\n"
+        "from qiskit_calculquebec.custom_gates.ry_90_gate import RY90Gate\n"
+        "RY90Gate()\n"
+        "names = {k.name for k in SessionEquivalenceLibrary.keys()}\n"
+        "print({'ry90', 'rym90'} <= names)"
+    )
+    assert _run(["-c", script]).stdout.strip() == "True"
+
+
+def test_register_equivalences_idempotent():
+    register_equivalences()
+    register_equivalences()
+    for gate in (RY90Gate(), RYm90Gate()):
+        assert len(SessionEquivalenceLibrary.get_entry(gate)) == 1
+
+
+def test_equivalences_translate_custom_gates():
+    register_equivalences()
+    qc = QuantumCircuit(1)
+    qc.append(RY90Gate(), [0])
+    qc.append(RYm90Gate(), [0])
+    out = transpile(qc, basis_gates=["ry"], optimization_level=0)
+    assert [inst.operation.name for inst in out.data] == ["ry", "ry"]
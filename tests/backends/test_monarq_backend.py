@@ -1,8 +1,10 @@
 import json
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 from qiskit_calculquebec.API.client import CalculQuebecClient
 from qiskit_calculquebec.backends.monarq_backend import MonarQBackend
+from qiskit_calculquebec.backends.targets.factory import clear_target_cache
 from qiskit_calculquebec.backends.utils.job import MultiMonarQJob
 
 client = CalculQuebecClient("host", "user", "token", project_id="test_project_id")
@@ -10,6 +12,8 @@ client = CalculQuebecClient("host", "user", "token", project_id="test_project_id
 
 @pytest.fixture
 def mock_api_adapter():
+    # Tests mutate backend targets: never share them across tests
+    clear_target_cache()
     with patch("qiskit_calculquebec.API.adapter.ApiAdapter.instance") as mock_instance:
         mock_instance.return_value = MagicMock(client=client)
 
@@ -25,6 +29,9 @@ def mock_api_adapter():
         with patch(
             "qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark",
             return_value=benchmark_data,
+        ), patch(
+            "qiskit_calculquebec.API.adapter.ApiAdapter.get_connectivity_for_machine",
+            return_value=None,
         ), patch(
             "qiskit_calculquebec.API.adapter.ApiAdapter.get_machine_by_name"
         ) as mock_machine, patch(
@@ -52,14 +59,21 @@ def test_constructor(mock_api_adapter):
 
     # client given, no config given, should set default config
     dev = MonarQBackend(machine_name="yukon", client=client)
-    mock_instance.assert_called_once()
     assert dev.name.lower() in ["yukon", "monarq"]
 
+    # the target and its calibration are only fetched on first access
+    mock_instance.assert_not_called()
+    assert dev.target.name == dev.name
+    mock_instance.assert_called_once()
+    assert dev.target is dev.target
+    mock_instance.assert_called_once()
+
+    assert MonarQBackend(machine_name="monarq", client=client).name == "yamaska"
+
 
 def test_validate_circuit(mock_api_adapter):
     mock_instance, mock_bench, mock_machine, mock_post_job = mock_api_adapter
     dev = MonarQBackend(machine_name="yukon", client=client)
-    mock_instance.assert_called_once()
 
     # valid circuit
     from qiskit import QuantumCircuit
@@ -90,10 +104,49 @@ def test_validate_circuit(mock_api_adapter):
         dev._validate_circuit([qc2])
 
 
+def test_validate_circuit_after_mutation(mock_api_adapter):
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import CircuitInstruction
+    from qiskit.circuit.library import XGate
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    qc = QuantumCircuit(2, 2)
+    qc.x(0)
+    qc.measure(0, 0)
+    dev._validate_circuit([qc])
+
+    # Same circuit object and length, but no measurement any more
+    qc.data[1] = CircuitInstruction(XGate(), [qc.qubits[0]])
+    with pytest.raises(ValueError):
+        dev._validate_circuit([qc])
+
+
+def test_validate_dag_and_lowering_share_rules(mock_api_adapter):
+    from qiskit import QuantumCircuit
+    from qiskit.converters import circuit_to_dag
+    from qiskit_calculquebec.backends import monarq_backend
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    # DAGs are validated directly
+    dag_qc = QuantumCircuit(2, 2)
+    dag_qc.cz(0, 1)
+    dag_qc.measure(1, 1)
+    dev._validate_circuit([circuit_to_dag(dag_qc)])
+    dag_qc.x(1)
+    with pytest.raises(ValueError):
+        dev._validate_circuit([circuit_to_dag(dag_qc)])
+
+    with patch.object(
+        monarq_backend, "_check_measurements", wraps=monarq_backend._check_measurements
+    ) as check:
+        with pytest.raises(ValueError, match="after measurement"):
+            MonarQBackend.MonarQLoweringPass().run(circuit_to_dag(dag_qc))
+        check.assert_called_once()
+
+
 def test_default_options(mock_api_adapter):
     mock_instance, mock_bench, mock_machine, mock_post_job = mock_api_adapter
     dev = MonarQBackend(machine_name="yukon", client=client)
-    mock_instance.assert_called_once()
 
     options = dev._default_options()
     assert options.shots == 1024
@@ -114,10 +167,12 @@ def test_run_sets_shots_limit(mock_api_adapter):
     with pytest.warns(Warning):
         job = dev.run([qc], shots=2000)
         assert job.shots == 1024
+    job.wait_for_submission()
 
     # Run with shots less than or equal to 1024
     job = dev.run([qc], shots=500)
     assert job.shots == 500
+    job.wait_for_submission()
 
 
 def test_run_multiple_circuits(mock_api_adapter):
@@ -141,3 +196,381 @@ def test_run_multiple_circuits(mock_api_adapter):
     assert job.shots == 800
     assert len(job.circuits) == 2
     assert isinstance(job, MultiMonarQJob)
+    job.wait_for_submission()
+
+
+def test_run_payloads(mock_api_adapter):
+    mock_instance, mock_bench, mock_machine, mock_post_job = mock_api_adapter
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+    from qiskit_calculquebec.API.payload_template import PayloadTemplate
+
+    theta = Parameter("theta")
+    qc = QuantumCircuit(1, 1)
+    qc.rz(theta, 0)
+    qc.measure(0, 0)
+    template = PayloadTemplate(qc)
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    payloads = [template.bind([v]) for v in (0.1, 0.2)]
+    job = dev.run(payloads, shots=100)
+    job.wait_for_submission()
+
+    assert [c.args[0] for c in mock_post_job.call_args_list] == payloads
+
+
+def test_payload_template_from_transpiled_circuit(mock_api_adapter):
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+    from qiskit.converters import circuit_to_dag, dag_to_circuit
+    from qiskit_calculquebec.API.api_utility import ApiUtility
+    from qiskit_calculquebec.API.payload_template import PayloadTemplate
+
+    theta = Parameter("theta")
+    ansatz = QuantumCircuit(2)
+    ansatz.rx(theta, 0)
+    ansatz.cx(0, 1)
+    ansatz.measure_all()
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    transpiled = dev.transpile(ansatz)
+    assert "barrier" in transpiled.count_ops()
+
+    template = PayloadTemplate(transpiled)
+    assert template.parameters == [theta]
+    assert "barrier" in transpiled.count_ops()  # the input is not modified
+
+    bound = circuit_to_dag(transpiled.assign_parameters([0.3]))
+    lowered = dag_to_circuit(MonarQBackend.MonarQLoweringPass().run(bound))
+    assert template.bind([0.3]) == ApiUtility.convert_circuit(lowered)
+
+
+def test_run_mixed_payloads_and_circuits(mock_api_adapter):
+    mock_instance, mock_bench, mock_machine, mock_post_job = mock_api_adapter
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter
+    from qiskit_calculquebec.API.payload_template import PayloadTemplate
+
+    theta = Parameter("theta")
+    qc = QuantumCircuit(1, 1)
+    qc.rz(theta, 0)
+    qc.measure(0, 0)
+    payload = PayloadTemplate(qc).bind([0.1])
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    job = dev.run([payload, qc.assign_parameters([0.2])], shots=100)
+    job.wait_for_submission()
+
+    posted = [c.args[0] for c in mock_post_job.call_args_list]
+    assert len(posted) == 2
+    assert payload in posted
+
+
+def test_delay_normalization_pass():
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Delay
+    from qiskit.transpiler import PassManager
+
+    qc = QuantumCircuit(2, 2)
+    qc.delay(64e-9, 0, unit="s")
+    qc.delay(3, 0, unit="dt")
+    qc.x(0)
+    qc.delay(0, 1, unit="dt")
+    qc.delay(10, 1, unit="us")
+    qc.measure([0, 1], [0, 1])
+
+    pm = PassManager([MonarQBackend.DelayNormalizationPass()])
+    with pytest.warns(UserWarning):
+        out = pm.run(qc)
+
+    delays = [
+        (
+            instr.operation.duration,
+            instr.operation.unit,
+            out.find_bit(instr.qubits[0]).index,
+        )
+        for instr in out.data
+        if isinstance(instr.operation, Delay)
+    ]
+    # 64 ns + 3 dt merged; 10 us rounded to 312 dt
+    assert delays == [(5, "dt", 0), (312, "dt", 1)]
+
+
+def test_delay_to_identity_pass():
+    from qiskit import QuantumCircuit
+    from qiskit.converters import circuit_to_dag
+    from qiskit.transpiler import PassManager
+
+    qc = QuantumCircuit(2, 2)
+    qc.x(0)
+    qc.delay(3, 0, unit="dt")
+    qc.delay(96e-9, 1, unit="s")
+    qc.cz(0, 1)
+    qc.measure([0, 1], [0, 1])
+
+    out = PassManager([MonarQBackend.DelayToIdentityPass()]).run(qc)
+    assert out.count_ops() == {"id": 6, "x": 1, "cz": 1, "measure": 2}
+    assert [i.name for i in out.data if out.find_bit(i.qubits[0]).index == 0][:5] == [
+        "x",
+        "id",
+        "id",
+        "id",
+        "cz",
+    ]
+
+    # DAGs without delays are returned as-is
+    no_delay = circuit_to_dag(QuantumCircuit(1))
+    assert MonarQBackend.DelayToIdentityPass().run(no_delay) is no_delay
+
+
+def test_lowering_pass():
+    import numpy as np
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Delay
+
+    qc = QuantumCircuit(2, 2)
+    qc.ry(np.pi / 2, 0)
+    qc.delay(2, 0, unit="dt")
+    qc.barrier()
+    qc.delay(3, 0, unit="dt")
+    qc.ry(-np.pi / 2, 1)
+    qc.ry(0.3, 1)
+    qc.measure([0, 1], [0, 1])
+
+    lowering = MonarQBackend.MonarQLoweringPass()
+    out = lowering(qc)
+    assert [i.name for i in out.data] == [
+        "ry90",
+        "delay",
+        "rym90",
+        "ry",
+        "measure",
+        "measure",
+    ]
+    assert [
+        i.operation.duration for i in out.data if isinstance(i.operation, Delay)
+    ] == [5]
+
+    # Barriers kept: delays on each side are not merged
+    kept = MonarQBackend.MonarQLoweringPass(validate=False, remove_barriers=False)(qc)
+    assert kept.count_ops()["barrier"] == 1
+    assert kept.count_ops()["delay"] == 2
+
+
+def test_lowering_pass_validates():
+    from qiskit import QuantumCircuit
+
+    no_measure = QuantumCircuit(1)
+    no_measure.x(0)
+    with pytest.raises(ValueError):
+        MonarQBackend.MonarQLoweringPass()(no_measure)
+    MonarQBackend.MonarQLoweringPass(validate=False)(no_measure)
+
+    after = QuantumCircuit(1, 1)
+    after.measure(0, 0)
+    after.x(0)
+    with pytest.raises(ValueError):
+        MonarQBackend.MonarQLoweringPass()(after)
+
+
+def test_pass_manager_cached_per_calibration(mock_api_adapter):
+    from qiskit.transpiler import InstructionProperties
+
+    def stages(pm):
+        # Copies of one cached pass manager share its stages
+        return pm.translation
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    pm = dev.get_pass_manager(optimization_level=0)
+    assert stages(dev.get_pass_manager(optimization_level=0)) is stages(pm)
+    assert stages(dev.get_pass_manager(optimization_level=1)) is not stages(pm)
+
+    # New calibration: the cached pass managers are stale
+    qargs = next(iter(dev.target["cz"]))
+    dev.target.update_instruction_properties(
+        "cz", qargs, InstructionProperties(duration=1e-7, error=0.5)
+    )
+    fresh = dev.get_pass_manager(optimization_level=0)
+    assert stages(fresh) is not stages(pm)
+    assert stages(dev.get_pass_manager(optimization_level=0)) is stages(fresh)
+
+
+def test_pass_manager_stage_assignment_is_local(mock_api_adapter):
+    from qiskit.transpiler import PassManager
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    default = dev.get_pass_manager(optimization_level=0).scheduling
+
+    pm = dev.get_pass_manager(optimization_level=0)
+    pm.scheduling = PassManager()
+    assert dev.get_pass_manager(optimization_level=0).scheduling is default
+
+
+def test_transpile_batch_in_processes(mock_api_adapter):
+    from qiskit import QuantumCircuit
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    circuits = []
+    for n in range(4):
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.rz(0.1 * n, 1)
+        qc.measure([0, 1], [0, 1])
+        circuits.append(qc)
+
+    serial = dev.transpile(circuits)
+    timings = []
+    parallel = dev.transpile(
+        circuits,
+        num_processes=2,
+        callback=lambda i, qc, seconds: timings.append((i, seconds)),
+    )
+
+    assert parallel == serial
+    assert [i for i, _ in timings] == [0, 1, 2, 3]
+    assert all(seconds >= 0 for _, seconds in timings)
+    assert dev.transpile(circuits[0]) == serial[0]
+
+
+def test_target_pickle_roundtrip(mock_api_adapter):
+    import pickle
+
+    target = MonarQBackend(machine_name="yukon", client=client).target
+    restored = pickle.loads(pickle.dumps(target))
+
+    assert restored.name == target.name
+    assert restored.coupling_map == target.coupling_map
+    assert list(restored.qubits) == list(target.qubits)
+    assert restored.qubit_properties[2].t1 == target.qubit_properties[2].t1
+    assert {q: (p.duration, p.error) for q, p in restored["cz"].items()} == {
+        q: (p.duration, p.error) for q, p in target["cz"].items()
+    }
+
+
+def _benchmark(t1, cz_fidelity):
+    return {
+        "resultsPerDevice": {
+            "qubits": {str(i): {"t1": t1 + i, "t2Echo": 20.0} for i in range(6)},
+            "couplers": {str(i): {"czGateFidelity": cz_fidelity} for i in range(6)},
+        }
+    }
+
+
+def test_refresh_calibration(mock_api_adapter):
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    other = MonarQBackend(machine_name="yukon", client=client)
+    target = dev.target
+    assert other.target is target
+    before = target.calibration_fingerprint()
+    pm = dev.get_pass_manager(optimization_level=0)
+
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark",
+        return_value=_benchmark(100.0, 0.9),
+    ) as mock_bench:
+        assert dev.refresh_calibration()
+        mock_bench.assert_called_once_with("yukon", force_refresh=True)
+
+    assert dev.target is not target
+    assert dev.target.qubit_properties[2].t1 == 102.0
+    assert all(abs(p.error - 0.1) < 1e-12 for p in dev.target["cz"].values())
+    assert dev.get_pass_manager(optimization_level=0).translation is not pm.translation
+
+    # The shared target, and every other backend using it, are untouched
+    assert other.target is target
+    assert target.calibration_fingerprint() == before
+    assert target.qubit_properties[2].t1 == 12.0
+
+    # Same benchmark again: nothing changes, caches are kept
+    pm = dev.get_pass_manager(optimization_level=0)
+    assert not dev.refresh_calibration(_benchmark(100.0, 0.9))
+    assert dev.get_pass_manager(optimization_level=0).translation is pm.translation
+
+
+def test_auto_refresh_calibration(mock_api_adapter):
+    dev = MonarQBackend(machine_name="yukon", client=client, auto_refresh=True)
+    assert dev.target.qubit_properties[0].t1 == 10.0
+
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark",
+        return_value=_benchmark(50.0, 0.95),
+    ):
+        assert dev.target.qubit_properties[0].t1 == 50.0
+
+
+# Same couplers as the coupling-map order the fixture's targets fall back to
+YUKON_CONNECTIVITY = {str(i): [i, i + 1] for i in range(5)}
+
+
+def test_snapshot_roundtrip_offline(mock_api_adapter, tmp_path):
+    from qiskit import QuantumCircuit
+
+    mock_instance, _, mock_machine, _ = mock_api_adapter
+    mock_machine.return_value = {"items": [{"id": "m1", "name": "yukon"}]}
+    path = tmp_path / "yukon.json"
+
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_connectivity_for_machine",
+        return_value=YUKON_CONNECTIVITY,
+    ) as mock_connectivity:
+        dev.save_snapshot(str(path))
+        # Fetched once, with the benchmark the target is built from
+        mock_connectivity.assert_called_once_with("yukon")
+
+    snapshot = json.loads(path.read_text())
+    assert snapshot["machine_name"] == "yukon"
+    assert snapshot["connectivity"] == YUKON_CONNECTIVITY
+    assert snapshot["benchmark"]["resultsPerDevice"]["qubits"]["1"]["t1"] == 11.0
+
+    clear_target_cache()
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark"
+    ) as mock_bench:
+        offline = MonarQBackend.from_snapshot(str(path))
+        assert offline.name == dev.name
+        assert offline.target.qubit_properties[1].t1 == 11.0
+        # Pinned: never fetches calibration
+        assert not offline.refresh_calibration()
+        mock_bench.assert_not_called()
+
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+    assert offline.transpile(qc) == dev.transpile(qc)
+
+    with pytest.raises(ValueError):
+        offline.run(qc)
+
+    # A pinned backend saves its own snapshot without the API
+    copy = tmp_path / "copy.json"
+    offline.save_snapshot(str(copy))
+    assert json.loads(copy.read_text()) == snapshot
+
+
+def test_routing_costs_follow_calibration(mock_api_adapter):
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    costs = dev.routing_costs()
+    assert costs.shape == (6, 6)
+    assert dev.routing_costs() is costs
+
+    dev.refresh_calibration(_benchmark(100.0, 0.5))
+    fresh = dev.routing_costs()
+    assert fresh is not costs
+    assert np.isclose(fresh[0, 1], -np.log(0.5))
+
+
+def test_best_qubits(mock_api_adapter):
+    dev = MonarQBackend(machine_name="yukon", client=client)
+    bench = _benchmark(100.0, 0.99)
+    bench["resultsPerDevice"]["couplers"]["0"]["czGateFidelity"] = 0.5
+    dev.refresh_calibration(bench)
+
+    # Coupler 0 joins qubits 0 and 1
+    assert 0 not in dev.best_qubits(4)
+    assert dev.best_qubits(3) == dev.best_qubits(3)
+    assert dev.best_qubits(6) == list(range(6))
+    with pytest.raises(ValueError):
+        dev.best_qubits(7)
@@ -0,0 +1,280 @@
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from qiskit import QuantumCircuit
+from qiskit.providers import JobError
+
+from qiskit_calculquebec.API.api_utility import ApiUtility
+from qiskit_calculquebec.backends.utils.job import MultiMonarQJob
+from qiskit_calculquebec.API.adapter import ApiException
+from qiskit_calculquebec.backends.utils.journal import JobJournal
+
+
+def make_circuit(n):
+    qc = QuantumCircuit(2, 2)
+    for _ in range(n):
+        qc.x(0)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+class Response:
+    def __init__(self, payload):
+        self.status_code = 200
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@pytest.fixture
+def backend():
+    mock = MagicMock()
+    mock.options.shots = 100
+    mock.name = "yukon"
+    return mock
+
+
+@pytest.fixture
+def mock_post_job():
+    ids = iter(f"job-{i}" for i in range(100))
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.post_job",
+        side_effect=lambda *a, **k: Response({"job": {"id": next(ids)}}),
+    ) as m:
+        yield m
+
+
+@pytest.fixture
+def mock_job_by_id():
+    def side_effect(job_id):
+        return Response(
+            {
+                "job": {"id": job_id, "status": {"type": "SUCCEEDED"}},
+                "result": {"histogram": {"00": 100}},
+            }
+        )
+
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.job_by_id", side_effect=side_effect
+    ) as m:
+        yield m
+
+
+def test_fingerprint_is_stable():
+    d1 = ApiUtility.convert_circuit(make_circuit(1))
+    d2 = ApiUtility.convert_circuit(make_circuit(1))
+    d3 = ApiUtility.convert_circuit(make_circuit(2))
+    assert JobJournal.fingerprint(d1) == JobJournal.fingerprint(d2)
+    assert JobJournal.fingerprint(d1) != JobJournal.fingerprint(d3)
+
+
+def test_record_and_merge(tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.jsonl"))
+    journal.record("a", fingerprint="f", shots=10, batch="b", index=1)
+    journal.record("c", fingerprint="g", shots=10, batch="b", index=0)
+    journal.record("a", status="SUCCEEDED", batch="b", index=1)
+
+    jobs = journal.jobs(batch="b")
+    assert [j["job_id"] for j in jobs] == ["c", "a"]
+    assert jobs[1]["status"] == "SUCCEEDED"
+    assert jobs[1]["fingerprint"] == "f"
+    assert journal.jobs(batch="other") == []
+
+
+def test_job_id_completes_intent(tmp_path):
+    journal = JobJournal(str(tmp_path / "journal.jsonl"))
+    journal.record(
+        None, fingerprint="f", shots=10, status="SUBMITTING", batch="b", index=0
+    )
+    journal.record("a", fingerprint="f", shots=10, batch="b", index=0)
+
+    [job] = journal.jobs(batch="b")
+    assert job["job_id"] == "a"
+    assert job["status"] == "SUBMITTED"
+    assert job["fingerprint"] == "f"
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = JobJournal(str(path))
+    journal.record("a", fingerprint="f", shots=10, index=0)
+    with open(path, "a") as f:
+        f.write('{"job_id": "b", "fing')
+
+    assert [e["job_id"] for e in journal.entries()] == ["a"]
+
+
+def test_missing_journal_is_empty(tmp_path):
+    assert JobJournal(str(tmp_path / "none.jsonl")).jobs() == []
+
+
+def test_multi_job_records_submissions(tmp_path, backend, mock_post_job):
+    path = str(tmp_path / "journal.jsonl")
+    job = MultiMonarQJob(backend, [make_circuit(1), make_circuit(2)], journal=path)
+    job.wait_for_submission()
+
+    jobs = JobJournal(path).jobs(batch=job.job_id())
+    assert [j["job_id"] for j in jobs] == ["job-0", "job-1"]
+    assert [j["index"] for j in jobs] == [0, 1]
+    assert all(j["shots"] == 100 for j in jobs)
+
+
+def test_rerun_reattaches_without_resubmitting(tmp_path, backend, mock_post_job):
+    path = str(tmp_path / "journal.jsonl")
+    circuits = [make_circuit(1), make_circuit(2)]
+
+    # Simulate a crash after the first submission
+    MultiMonarQJob(
+        backend, circuits[:1], journal=path, job_id="sweep"
+    ).wait_for_submission()
+    assert mock_post_job.call_count == 1
+
+    job = MultiMonarQJob(backend, circuits, journal=path, job_id="sweep")
+    job.wait_for_submission()
+    assert mock_post_job.call_count == 2
+    assert [j.job_id() for j in job._individual_jobs] == ["job-0", "job-1"]
+
+
+def test_rerun_with_different_circuit_raises(tmp_path, backend, mock_post_job):
+    path = str(tmp_path / "journal.jsonl")
+    MultiMonarQJob(
+        backend, [make_circuit(1)], journal=path, job_id="sweep"
+    ).wait_for_submission()
+
+    with pytest.raises(ValueError):
+        MultiMonarQJob(backend, [make_circuit(3)], journal=path, job_id="sweep")
+
+
+def test_runs_without_job_id_do_not_collide(tmp_path, backend, mock_post_job):
+    path = str(tmp_path / "journal.jsonl")
+    first = MultiMonarQJob(backend, [make_circuit(1)], journal=path)
+    first.wait_for_submission()
+    second = MultiMonarQJob(backend, [make_circuit(3)], journal=path)
+    second.wait_for_submission()
+
+    assert first.job_id() != second.job_id()
+    assert mock_post_job.call_count == 2
+    assert [j["job_id"] for j in JobJournal(path).jobs(batch=second.job_id())] == [
+        "job-1"
+    ]
+
+
+def test_resume_fetches_results(tmp_path, backend, mock_post_job, mock_job_by_id):
+    path = str(tmp_path / "journal.jsonl")
+    MultiMonarQJob(
+        backend, [make_circuit(1), make_circuit(2)], journal=path
+    ).wait_for_submission()
+    submitted = mock_post_job.call_count
+
+    job = MultiMonarQJob.resume(path, backend)
+    result = job.result(wait=0)
+
+    assert mock_post_job.call_count == submitted
+    assert len(result.results) == 2
+    assert result.get_counts(0) == {"00": 100}
+    assert all(j["status"] == "SUCCEEDED" for j in JobJournal(path).jobs())
+
+
+def test_resume_keeps_batches_apart(tmp_path, backend, mock_post_job, mock_job_by_id):
+    path = str(tmp_path / "journal.jsonl")
+    first = MultiMonarQJob(backend, [make_circuit(1), make_circuit(2)], journal=path)
+    first.wait_for_submission()
+    second = MultiMonarQJob(backend, [make_circuit(3), make_circuit(4)], journal=path)
+    second.wait_for_submission()
+
+    def resumed_ids(job_id=None):
+        job = MultiMonarQJob.resume(path, backend, job_id=job_id)
+        return [j.job_id() for j in job._individual_jobs]
+
+    assert resumed_ids() == ["job-0", "job-1", "job-2", "job-3"]
+    assert resumed_ids(second.job_id()) == ["job-2", "job-3"]
+
+
+def test_resume_empty_journal_raises(tmp_path, backend):
+    with pytest.raises(ValueError):
+        MultiMonarQJob.resume(str(tmp_path / "journal.jsonl"), backend)
+
+
+def test_intent_is_journaled_before_post(tmp_path, backend):
+    path = str(tmp_path / "journal.jsonl")
+    seen = []
+
+    def post_job(*args, **kwargs):
+        seen.extend(JobJournal(path).entries())
+        return Response({"job": {"id": "job-0"}})
+
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.post_job", side_effect=post_job
+    ):
+        MultiMonarQJob(backend, [make_circuit(1)], journal=path).wait_for_submission()
+
+    assert [(e["job_id"], e["status"]) for e in seen] == [(None, "SUBMITTING")]
+    assert JobJournal(path).jobs()[0]["job_id"] == "job-0"
+
+
+def test_rejected_submission_is_journaled(tmp_path, backend):
+    path = str(tmp_path / "journal.jsonl")
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.post_job",
+        side_effect=ApiException(500, "boom"),
+    ):
+        job = MultiMonarQJob(backend, [make_circuit(1)], journal=path)
+        with pytest.raises(ApiException):
+            job.wait_for_submission()
+
+    [entry] = JobJournal(path).jobs()
+    assert entry["job_id"] is None
+    assert entry["status"] == "NOT_SUBMITTED"
+
+
+def crash_while_posting(path, circuit):
+    # The intent line of a driver that stopped before journaling the job ID
+    JobJournal(path).record(
+        None,
+        fingerprint=JobJournal.fingerprint(ApiUtility.convert_circuit(circuit)),
+        shots=100,
+        status="SUBMITTING",
+        batch="sweep",
+        index=1,
+    )
+
+
+def test_resume_reports_unconfirmed_submission(
+    tmp_path, backend, mock_post_job, mock_job_by_id
+):
+    path = str(tmp_path / "journal.jsonl")
+    circuits = [make_circuit(1), make_circuit(2)]
+    MultiMonarQJob(
+        backend, circuits[:1], journal=path, job_id="sweep"
+    ).wait_for_submission()
+    crash_while_posting(path, circuits[1])
+
+    job = MultiMonarQJob.resume(path, backend, job_id="sweep")
+    assert job.status().name == "ERROR"
+    with pytest.raises(JobError, match="not confirmed"):
+        job.result(wait=0)
+
+    result = job.result(wait=0, partial=True)
+    assert result.get_counts(0) == {"00": 100}
+    assert not result.results[1].success
+    assert mock_post_job.call_count == 1
+
+
+def test_rerun_resubmits_unconfirmed_submission(tmp_path, backend, mock_post_job):
+    path = str(tmp_path / "journal.jsonl")
+    circuits = [make_circuit(1), make_circuit(2)]
+    MultiMonarQJob(
+        backend, circuits[:1], journal=path, job_id="sweep"
+    ).wait_for_submission()
+    crash_while_posting(path, circuits[1])
+
+    with pytest.warns(UserWarning, match="may already run"):
+        job = MultiMonarQJob(backend, circuits, journal=path, job_id="sweep")
+    job.wait_for_submission()
+
+    assert mock_post_job.call_count == 2
+    assert [j["job_id"] for j in JobJournal(path).jobs(batch="sweep")] == [
+        "job-0",
+        "job-1",
+    ]
@@ -0,0 +1,147 @@
+import json
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from qiskit import QuantumCircuit
+from qiskit.providers import JobStatus
+from qiskit.providers.exceptions import JobTimeoutError
+
+from qiskit_calculquebec.API.adapter import ApiException
+from qiskit_calculquebec.backends.utils.job import MonarQJob, MultiMonarQJob
+
+
+def make_circuit():
+    qc = QuantumCircuit(1, 1)
+    qc.x(0)
+    qc.measure(0, 0)
+    return qc
+
+
+class Response:
+    def __init__(self, payload):
+        self.status_code = 200
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@pytest.fixture
+def backend():
+    mock = MagicMock()
+    mock.options.shots = 10
+    mock.name = "yukon"
+    return mock
+
+
+@pytest.fixture
+def mock_post_job():
+    ids = iter(f"job-{i}" for i in range(100))
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.post_job",
+        side_effect=lambda *a, **k: Response({"job": {"id": next(ids)}}),
+    ) as m:
+        yield m
+
+
+@pytest.fixture
+def mock_job_by_id():
+    # job-0 finishes, every other job stays running
+    def side_effect(job_id):
+        status = "SUCCEEDED" if job_id == "job-0" else "RUNNING"
+        return Response(
+            {
+                "job": {"id": job_id, "status": {"type": status}},
+                "result": {"histogram": {"1": 10}},
+            }
+        )
+
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.job_by_id", side_effect=side_effect
+    ) as m:
+        yield m
+
+
+@pytest.fixture
+def mock_cancel_job():
+    with patch("qiskit_calculquebec.API.adapter.ApiAdapter.cancel_job") as m:
+        yield m
+
+
+def test_timeout_is_a_batch_deadline(backend, mock_post_job, mock_job_by_id):
+    job = MultiMonarQJob(backend, [make_circuit() for _ in range(4)])
+
+    start = time.monotonic()
+    with pytest.raises(JobTimeoutError):
+        job.result(timeout=0.2, wait=0.05)
+
+    # A per-circuit timeout would wait 3 x 0.2s for the running jobs
+    assert time.monotonic() - start < 0.5
+
+
+def test_zero_timeout_polls_once(backend, mock_job_by_id):
+    done = MonarQJob(backend, job_id="job-0").result(timeout=0)
+    assert done.get_counts() == {"1": 10}
+
+    with pytest.raises(JobTimeoutError):
+        MonarQJob(backend, job_id="job-1").result(timeout=0)
+    assert mock_job_by_id.call_count == 2
+
+
+def test_partial_result(backend, mock_post_job, mock_job_by_id):
+    job = MultiMonarQJob(backend, [make_circuit(), make_circuit()])
+
+    result = job.result(timeout=0.05, wait=0.01, partial=True)
+
+    assert not result.success
+    assert result.results[0].success
+    assert result.get_counts(0) == {"1": 10}
+    assert not result.results[1].success
+
+
+def test_cancel_stops_submission(backend, mock_job_by_id, mock_cancel_job):
+    release = threading.Event()
+    ids = iter(f"job-{i}" for i in range(100))
+
+    def post_job(*args, **kwargs):
+        release.wait()
+        return Response({"job": {"id": next(ids)}})
+
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.post_job", side_effect=post_job
+    ) as mock_post:
+        job = MultiMonarQJob(backend, [make_circuit() for _ in range(5)])
+        threading.Timer(0.05, release.set).start()
+        assert job.cancel()
+
+    # The submission in flight completes and is cancelled; the rest never start
+    assert mock_post.call_count == 1
+    mock_cancel_job.assert_called_once_with("job-0")
+    assert job.status() == JobStatus.CANCELLED
+
+    result = job.result(wait=0)
+    assert result.get_counts(0) == {"1": 10}
+    assert [r.success for r in result.results] == [True] + [False] * 4
+
+
+def test_cancel_rejected(backend, mock_post_job, mock_job_by_id, mock_cancel_job):
+    mock_cancel_job.side_effect = ApiException(400, "already done")
+    job = MultiMonarQJob(backend, [make_circuit()])
+    job.wait_for_submission()
+    assert not job.cancel()
+
+
+def test_submission_error_surfaces_from_status(backend, mock_job_by_id):
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.post_job",
+        side_effect=ApiException(500, "boom"),
+    ):
+        job = MultiMonarQJob(backend, [make_circuit() for _ in range(3)])
+        with pytest.raises(ApiException):
+            job.wait_for_submission(5)
+
+    with pytest.raises(ApiException):
+        job.status()
+    with pytest.raises(ApiException):
+        job.result(wait=0)
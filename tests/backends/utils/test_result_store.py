@@ -0,0 +1,130 @@
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from qiskit import QuantumCircuit
+
+from qiskit_calculquebec.backends.utils.job import MonarQJob, MultiMonarQJob
+from qiskit_calculquebec.backends.utils.result_store import ResultStore
+
+
+def make_response(job_id, status="SUCCEEDED", histogram=None):
+    return {
+        "job": {"id": job_id, "status": {"type": status}},
+        "result": {"histogram": histogram or {"00": 10}},
+    }
+
+
+class Response:
+    def __init__(self, payload):
+        self.status_code = 200
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@pytest.fixture
+def backend():
+    mock = MagicMock()
+    mock.options.shots = 10
+    mock.name = "yukon"
+    return mock
+
+
+@pytest.fixture
+def mock_job_by_id():
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.job_by_id",
+        side_effect=lambda job_id: Response(make_response(job_id)),
+    ) as m:
+        yield m
+
+
+@pytest.fixture
+def mock_post_job():
+    ids = iter(f"job-{i}" for i in range(100))
+    with patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.post_job",
+        side_effect=lambda *a, **k: Response({"job": {"id": next(ids)}}),
+    ) as m:
+        yield m
+
+
+def test_record_and_get():
+    store = ResultStore()
+    assert store.get("a") is None
+    store.record("a", make_response("a"), circuit_hash="h", machine="yukon")
+    assert store.get("a") == make_response("a")
+
+
+def test_query_filters():
+    store = ResultStore()
+    store.record("a", make_response("a"), circuit_hash="h1", machine="yukon")
+    store.record("b", make_response("b"), circuit_hash="h2", machine="yukon")
+    store.record(
+        "c", make_response("c", "FAILED"), circuit_hash="h1", machine="yamaska"
+    )
+
+    assert [r["job_id"] for r in store.query(circuit_hash="h1")] == ["a", "c"]
+    assert [r["job_id"] for r in store.query(machine="yukon")] == ["a", "b"]
+    assert [r["job_id"] for r in store.query(status="FAILED")] == ["c"]
+    assert len(store.query()) == 3
+
+
+def test_histograms_by_batch_and_ids():
+    store = ResultStore()
+    store.record("b", make_response("b", histogram={"1": 1}), batch="s", batch_index=1)
+    store.record("a", make_response("a", histogram={"0": 1}), batch="s", batch_index=0)
+
+    assert store.histograms(batch="s") == [{"0": 1}, {"1": 1}]
+    assert store.histograms(job_ids=["b", "x", "a"]) == [{"1": 1}, None, {"0": 1}]
+    with pytest.raises(ValueError):
+        store.histograms()
+
+
+def test_persists_on_disk(tmp_path):
+    path = str(tmp_path / "results.sqlite")
+    store = ResultStore(path)
+    store.record("a", make_response("a"))
+    store.close()
+
+    assert ResultStore(path).get("a") == make_response("a")
+
+
+def test_result_is_served_from_store(backend, mock_job_by_id):
+    store = ResultStore()
+
+    first = MonarQJob(backend, job_id="a", result_store=store).result(wait=0)
+    assert mock_job_by_id.call_count == 1
+
+    second = MonarQJob(backend, job_id="a", result_store=store).result(wait=0)
+    assert mock_job_by_id.call_count == 1
+    assert first.get_counts() == second.get_counts()
+
+
+def test_multi_job_records_sweep(backend, mock_post_job, mock_job_by_id):
+    store = ResultStore()
+    circuits = []
+    for _ in range(3):
+        qc = QuantumCircuit(1, 1)
+        qc.measure(0, 0)
+        circuits.append(qc)
+
+    MultiMonarQJob(backend, circuits, job_id="sweep", result_store=store).result(wait=0)
+
+    records = store.query(batch="sweep")
+    assert [r["batch_index"] for r in records] == [0, 1, 2]
+    assert all(r["circuit_hash"] for r in records)
+    assert len(store.histograms(batch="sweep")) == 3
+
+
+def test_records_benchmark_fetch_time(backend, mock_job_by_id):
+    from datetime import datetime
+
+    store = ResultStore()
+    fetched = datetime(2026, 1, 2, 3, 4, 5)
+    with patch("qiskit_calculquebec.API.adapter.ApiAdapter._last_update", fetched):
+        MonarQJob(backend, job_id="a", result_store=store).result(wait=0)
+
+    [record] = store.query(calibration_fetched_at=fetched.isoformat())
+    assert record["job_id"] == "a"
@@ -0,0 +1,128 @@
+import subprocess
+import sys
+import threading
+import pytest
+from qiskit.providers import JobStatus
+
+from qiskit_calculquebec.backends.utils.scheduler import (
+    Priority,
+    ScheduledBatch,
+    SubmissionScheduler,
+)
+
+
+class FakeJob:
+    def __init__(self, name, finished):
+        self.name = name
+        self.finished = finished
+
+    def status(self):
+        return JobStatus.DONE if self.finished.is_set() else JobStatus.RUNNING
+
+
+@pytest.fixture
+def gate():
+    # Holds the worker inside the first task until released
+    return threading.Event()
+
+
+def make_tasks(name, n, order, finished=None, gate=None):
+    finished = finished or threading.Event()
+
+    def task(i):
+        if gate is not None:
+            gate.wait()
+        order.append(f"{name}{i}")
+        return FakeJob(f"{name}{i}", finished)
+
+    return [lambda i=i: task(i) for i in range(n)]
+
+
+def test_empty_batch_is_done():
+    assert ScheduledBatch([]).wait(0)
+
+
+def test_interactive_jumps_bulk_queue(gate):
+    scheduler = SubmissionScheduler()
+    order = []
+    blocker = scheduler.schedule(
+        make_tasks("x", 1, order, gate=gate), priority=Priority.INTERACTIVE
+    )
+    bulk = scheduler.schedule(make_tasks("b", 5, order), priority=Priority.BULK)
+    probe = scheduler.schedule(make_tasks("i", 1, order), priority=Priority.INTERACTIVE)
+    gate.set()
+
+    assert blocker.wait(5) and bulk.wait(5) and probe.wait(5)
+    assert order == ["x0", "i0", "b0", "b1", "b2", "b3", "b4"]
+
+
+def test_equal_priorities_interleave(gate):
+    scheduler = SubmissionScheduler()
+    order = []
+    scheduler.schedule(make_tasks("x", 1, order, gate=gate))
+    a = scheduler.schedule(make_tasks("a", 3, order))
+    b = scheduler.schedule(make_tasks("b", 3, order))
+    gate.set()
+
+    assert a.wait(5) and b.wait(5)
+    assert order[1:] == ["a0", "b0", "a1", "b1", "a2", "b2"]
+
+
+def test_in_flight_cap_per_project():
+    scheduler = SubmissionScheduler(max_in_flight=2, poll_interval=0.01)
+    order = []
+    finished = threading.Event()
+    capped = scheduler.schedule(make_tasks("a", 4, order, finished), project="p1")
+    other = scheduler.schedule(make_tasks("b", 2, order), project="p2")
+
+    # The other project is not held back by p1's cap
+    assert other.wait(5)
+    assert not capped.wait(0.1)
+    assert order.count("a0") + order.count("a1") == 2 and "a2" not in order
+    assert scheduler.in_flight("p1") == 2
+    assert scheduler.pending() == 2
+
+    finished.set()
+    assert capped.wait(5)
+    assert [o for o in order if o.startswith("a")] == ["a0", "a1", "a2", "a3"]
+
+
+def test_cancel_drops_pending_tasks(gate):
+    scheduler = SubmissionScheduler()
+    order = []
+    scheduler.schedule(make_tasks("x", 1, order, gate=gate))
+    batch = scheduler.schedule(make_tasks("a", 3, order))
+
+    scheduler.cancel(batch)
+    gate.set()
+
+    assert batch.wait(5)
+    assert "a0" not in order
+
+
+def test_error_stops_batch():
+    scheduler = SubmissionScheduler()
+
+    def boom():
+        raise RuntimeError("post failed")
+
+    order = []
+    batch = scheduler.schedule([boom] + make_tasks("a", 2, order))
+
+    assert batch.wait(5)
+    assert isinstance(batch.error, RuntimeError)
+    assert order == []
+
+
+def test_queued_tasks_are_submitted_before_exit(tmp_path):
+    out = tmp_path / "submitted.txt"
+    script = (
+        "import time\n"
+        "from qiskit_calculquebec.backends.utils.scheduler import SubmissionScheduler\n"
+        "def post(i):\n"
+        "    time.sleep(0.05)\n"
+        f"    open({str(out)!r}, 'a').write(f'{{i}}\\n')\n"
+        "SubmissionScheduler.instance().schedule([lambda i=i: post(i) for i in range(3)])\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=60)
+    assert out.read_text().split() == ["0", "1", "2"]
@@ -0,0 +1,34 @@
+import json
+import pytest
+from qiskit_calculquebec.backends.utils.snapshot import (
+    SNAPSHOT_FORMAT,
+    dump_snapshot,
+    load_snapshot,
+    make_snapshot,
+)
+
+
+def test_dump_and_load(tmp_path):
+    path = tmp_path / "sub" / "snap.json"
+    snapshot = make_snapshot("MonarQ", {"items": []}, {"b": 1}, {"0": [0, 1]})
+    dump_snapshot(str(path), snapshot)
+
+    loaded = load_snapshot(str(path))
+    assert loaded == snapshot
+    assert loaded["machine_name"] == "monarq"
+    assert loaded["format"] == SNAPSHOT_FORMAT
+    assert [p.name for p in path.parent.iterdir()] == ["snap.json"]
+
+
+def test_load_rejects_invalid(tmp_path):
+    path = tmp_path / "snap.json"
+
+    path.write_text(json.dumps({"benchmark": {}}))
+    with pytest.raises(ValueError):
+        load_snapshot(str(path))
+
+    snapshot = make_snapshot("yukon", {}, {}, {})
+    snapshot["format"] = SNAPSHOT_FORMAT + 1
+    path.write_text(json.dumps(snapshot))
+    with pytest.raises(ValueError):
+        load_snapshot(str(path))
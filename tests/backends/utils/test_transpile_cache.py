@@ -0,0 +1,172 @@
+import pytest
+from unittest.mock import patch
+from qiskit import QuantumCircuit
+from qiskit.transpiler import InstructionProperties, PassManager, StagedPassManager
+
+from qiskit_calculquebec.API.client import CalculQuebecClient
+from qiskit_calculquebec.backends.monarq_backend import MonarQBackend
+from qiskit_calculquebec.backends.targets.factory import clear_target_cache
+from qiskit_calculquebec.backends.utils.transpile_cache import (
+    CachedPassManager,
+    TranspileCache,
+)
+
+client = CalculQuebecClient("host", "user", "token", project_id="test_project_id")
+
+
+@pytest.fixture
+def backend(tmp_path):
+    # Tests mutate backend targets: never share them across tests
+    clear_target_cache()
+    benchmark_data = {
+        "resultsPerDevice": {
+            "qubits": {str(i): {"t1": 10.0 + i, "t2Echo": 20.0 + i} for i in range(6)}
+        }
+    }
+    with patch("qiskit_calculquebec.API.adapter.ApiAdapter.instance"), patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark",
+        return_value=benchmark_data,
+    ), patch(
+        "qiskit_calculquebec.API.adapter.ApiAdapter.get_connectivity_for_machine",
+        return_value=None,
+    ):
+        yield MonarQBackend(
+            machine_name="yukon", client=client, transpile_cache=str(tmp_path)
+        )
+
+
+def make_circuit(theta=0.3, name=None):
+    qc = QuantumCircuit(2, 2, name=name)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.rz(theta, 1)
+    qc.measure([0, 1], [0, 1])
+    return qc
+
+
+def test_key_is_structural():
+    key = TranspileCache.key(make_circuit(name="a"), 3, "cal")
+    assert key == TranspileCache.key(make_circuit(name="b"), 3, "cal")
+    assert key != TranspileCache.key(make_circuit(theta=0.4), 3, "cal")
+    assert key != TranspileCache.key(make_circuit(), 2, "cal")
+    assert key != TranspileCache.key(make_circuit(), 3, "other")
+
+
+def test_get_put_roundtrip(tmp_path):
+    cache = TranspileCache(str(tmp_path))
+    qc = make_circuit()
+    assert cache.get("missing") is None
+    cache.put("k", qc)
+    assert cache.get("k") == qc
+
+    (tmp_path / "bad.qpy").write_bytes(b"not qpy")
+    assert cache.get("bad") is None
+
+    cache.clear()
+    assert cache.get("k") is None
+
+
+def spy_transpilations():
+    # get_pass_manager returns copies: spy on every staged pass manager
+    return patch.object(
+        StagedPassManager, "run", autospec=True, side_effect=StagedPassManager.run
+    )
+
+
+def test_pass_manager_serves_cached_result(backend):
+    pm = backend.get_pass_manager(optimization_level=3)
+    first = pm.run(make_circuit())
+
+    with spy_transpilations() as inner_run:
+        again = backend.transpile(make_circuit())
+        inner_run.assert_not_called()
+    assert again == first
+    assert again.layout == first.layout
+
+
+def test_cache_misses_after_calibration_change(backend):
+    backend.transpile(make_circuit())
+
+    qargs = next(iter(backend.target["cz"]))
+    backend.target.update_instruction_properties(
+        "cz", qargs, InstructionProperties(duration=1e-7, error=0.5)
+    )
+    with spy_transpilations() as inner_run:
+        backend.transpile(make_circuit())
+        inner_run.assert_called_once()
+
+
+def test_use_cache_false_leaves_cache_untouched(backend, tmp_path):
+    pm = backend.get_pass_manager(optimization_level=0, use_cache=False)
+    assert not isinstance(pm, CachedPassManager)
+    pm.run(make_circuit())
+    assert not list(tmp_path.glob("*.qpy"))
+
+
+def test_stage_assignment_bypasses_cache(backend):
+    backend.transpile(make_circuit())
+
+    pm = backend.get_pass_manager(optimization_level=3)
+    pm.scheduling = PassManager()
+    assert pm._pass_manager.scheduling is pm.scheduling
+    with spy_transpilations() as inner_run:
+        pm.run(make_circuit())
+        inner_run.assert_called_once()
+
+    # Other pass managers of the backend keep their stages and the cache
+    assert (
+        backend.get_pass_manager(optimization_level=3).scheduling is not pm.scheduling
+    )
+    with spy_transpilations() as inner_run:
+        backend.transpile(make_circuit())
+        inner_run.assert_not_called()
+
+
+def test_parallel_transpile_uses_cache(backend):
+    circuits = [make_circuit(theta=0.1 * i) for i in range(3)]
+    expected = backend.transpile(circuits[:2])
+
+    with patch(
+        "qiskit_calculquebec.backends.monarq_backend.ProcessPoolExecutor"
+    ) as pool_cls:
+        pool_cls.return_value.map.side_effect = lambda fn, cs, chunksize: (
+            (backend.get_pass_manager(3).run(c), 0.0) for c in cs
+        )
+        results = backend.transpile(circuits, num_processes=2)
+        (_, mapped, *_), _ = pool_cls.return_value.map.call_args
+        assert mapped == circuits[2:]
+
+    assert results[:2] == expected
+    key = TranspileCache.key(circuits[2], 3, backend.target.calibration_fingerprint())
+    assert backend._transpile_cache.get(key) == results[2]
+
+
+def test_custom_gates_with_same_name_do_not_share_entries(backend):
+    def make(gate):
+        block = QuantumCircuit(1, name="blk")
+        getattr(block, gate)(0)
+        qc = QuantumCircuit(1, 1)
+        qc.append(block.to_gate(), [0])
+        qc.measure(0, 0)
+        return qc
+
+    backend.transpile(make("x"))
+    ops = backend.transpile(make("h")).count_ops()
+    assert ops == backend.get_pass_manager(3)._pass_manager.run(make("h")).count_ops()
+
+
+@pytest.mark.parametrize("num_processes", [None, 2])
+def test_hit_keeps_input_name_and_metadata(backend, num_processes):
+    first = make_circuit(name="first")
+    first.metadata = {"theta": 1}
+    backend.transpile(first)
+
+    second = make_circuit(name="second")
+    second.metadata = {"theta": 2}
+    with patch(
+        "qiskit_calculquebec.backends.monarq_backend.ProcessPoolExecutor"
+    ) as pool_cls:
+        hit = backend.transpile(second, num_processes=num_processes)
+        pool_cls.assert_not_called()
+    assert hit.name == "second"
+    assert hit.metadata == {"theta": 2}
@@ -0,0 +1,38 @@
+"""
+Throughput benchmark of the structural circuit hashes.
+
+Hashes a circuit of 10⁵ gates and its Thunderhead payload with
+``hash_circuit`` and ``hash_payload``, and compares them with the SHA-256
+of the canonical JSON encoding previously used as journal fingerprint.
+
+Run with ``python tests/benchmarks/bench_circuit_hash.py``.
+"""
+
+import hashlib
+from qiskit_calculquebec.API.api_utility import ApiUtility
+from qiskit_calculquebec.API.circuit_hash import hash_circuit, hash_payload
+
+from bench_convert_circuit import N_GATES, REPEATS, best_of, make_circuit
+
+
+def main():
+    qc = make_circuit(N_GATES)
+    payload = ApiUtility.convert_circuit(qc)
+    n = len(qc.data)
+
+    json_sha = best_of(
+        lambda: hashlib.sha256(
+            ApiUtility.encode_circuit(payload).encode("utf-8")
+        ).hexdigest()
+    )
+    circuit = best_of(lambda: hash_circuit(qc))
+    dict_ = best_of(lambda: hash_payload(payload))
+
+    print(f"{n} operations, best of {REPEATS}")
+    print(f"  sha256(canonical JSON): {n / json_sha:12,.0f} ops/s")
+    print(f"  hash_circuit:           {n / circuit:12,.0f} ops/s")
+    print(f"  hash_payload:           {n / dict_:12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Micro-benchmark of circuit conversion to the Thunderhead wire format.
+
+Compares the per-instruction ``ApiUtility.convert_instruction`` loop with
+the precompiled ``ApiUtility.convert_circuit`` fast path on circuits of
+10⁵ gates, and reports operations per second.
+
+Run with ``python tests/benchmarks/bench_convert_circuit.py``.
+"""
+
+import time
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit_calculquebec.API.api_utility import ApiUtility
+
+N_GATES = 100_000
+REPEATS = 5
+
+
+def make_circuit(n_gates: int, n_qubits: int = 24) -> QuantumCircuit:
+    """Build a circuit mixing 1q, 2q, parametric gates and readouts."""
+    rng = np.random.default_rng(0)
+    qc = QuantumCircuit(n_qubits, n_qubits)
+    for i in range(n_gates - n_qubits):
+        q = i % n_qubits
+        if i % 4 == 0:
+            qc.rz(float(rng.uniform(-np.pi, np.pi)), q)
+        elif i % 4 == 1:
+            qc.cz(q, (q + 1) % n_qubits)
+        elif i % 4 == 2:
+            qc.sx(q)
+        else:
+            qc.id(q)
+    qc.measure(range(n_qubits), range(n_qubits))
+    return qc
+
+
+def best_of(fn, repeats: int = REPEATS) -> float:
+    """Return the fastest wall-clock time of ``repeats`` calls to ``fn``."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    qc = make_circuit(N_GATES)
+    reference = [ApiUtility.convert_instruction(op) for op in qc.data]
+    assert ApiUtility.convert_circuit(qc)["operations"] == reference
+
+    baseline = best_of(lambda: [ApiUtility.convert_instruction(op) for op in qc.data])
+    fast = best_of(lambda: ApiUtility.convert_circuit(qc))
+
+    print(f"{len(qc.data)} operations, best of {REPEATS}")
+    print(f"  convert_instruction loop: {len(qc.data) / baseline:12,.0f} ops/s")
+    print(f"  convert_circuit:          {len(qc.data) / fast:12,.0f} ops/s")
+    print(f"  speed-up:                 {baseline / fast:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Startup benchmark of ``qiskit_calculquebec``.
+
+Times, in fresh interpreters, the import of the backends and of the
+mitigation package and techniques, and reports which deferred dependencies
+each one loaded. ``requests`` and ``qiskit.qpy`` are only imported by the
+first HTTP call and transpile cache access; mitiq, mthree and
+qiskit_ibm_runtime once a mitigation technique runs.
+
+Also checks the cold-start budget of ``qiskit_calculquebec.backends`` for
+short-lived CLI and serverless uses: its own import time on top of Qiskit,
+read from ``-X importtime``, must stay under :data:`IMPORT_BUDGET_MS`. Exits
+with status 1 otherwise.
+
+Run with ``python tests/benchmarks/bench_import_time.py``.
+"""
+
+import subprocess
+import sys
+
+REPEATS = 5
+
+# Import time of qiskit_calculquebec.backends on top of Qiskit itself
+# (about 25 ms when written)
+IMPORT_BUDGET_MS = 75
+
+STATEMENTS = {
+    "import qiskit_calculquebec": "import qiskit_calculquebec",
+    "import qiskit": "import qiskit",
+    "MonarQBackend": "from qiskit_calculquebec.backends import MonarQBackend",
+    "import qiskit_calculquebec.mitigation": "import qiskit_calculquebec.mitigation",
+    "ReadoutMitigation": "from qiskit_calculquebec.mitigation import ReadoutMitigation",
+    "ZNEMitigation": "from qiskit_calculquebec.mitigation import ZNEMitigation",
+}
+
+HEAVY_MODULES = (
+    "requests",
+    "qiskit.qpy",
+    "mitiq",
+    "mthree",
+    "psutil",
+    "qiskit_ibm_runtime",
+)
+
+
+def measure(statement):
+    """Return the import time in seconds and the heavy modules loaded."""
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(out[0]), out[1] if len(out) > 1 else "-"
+
+
+def backends_import_ms():
+    """Return the import time of the backends on top of Qiskit, in ms."""
+    stderr = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import qiskit; import qiskit_calculquebec.backends",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    # Lines are "import time: self [us] | cumulative | module", header first
+    for line in stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        if name.strip() == "qiskit_calculquebec.backends":
+            return int(cumulative) / 1000
+    raise RuntimeError("qiskit_calculquebec.backends was not imported.")
+
+
+def main():
+    print(f"Best of {REPEATS} fresh interpreters")
+    for label, statement in STATEMENTS.items():
+        runs = [measure(statement) for _ in range(REPEATS)]
+        best = min(t for t, _ in runs)
+        print(f"  {label:40s} {best * 1e3:8.1f} ms  loaded: {runs[0][1]}")
+
+    backends = min(backends_import_ms() for _ in range(REPEATS))
+    print(
+        f"qiskit_calculquebec.backends on top of Qiskit: {backends:.1f} ms "
+        f"(budget {IMPORT_BUDGET_MS} ms)"
+    )
+    if backends > IMPORT_BUDGET_MS:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
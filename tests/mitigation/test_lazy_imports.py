@@ -0,0 +1,56 @@
+"""Tests for the lazy loading of qiskit_calculquebec.mitigation."""
+
+import subprocess
+import sys
+
+import pytest
+
+import qiskit_calculquebec.mitigation as mitigation
+
+HEAVY_MODULES = ("mitiq", "mthree", "psutil", "qiskit_ibm_runtime")
+
+
+def _loaded_after(code):
+    """Run ``code`` in a fresh interpreter and return the heavy modules it loaded."""
+    script = (
+        "import sys\n"
+        f"{code}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def test_import_loads_no_optional_dependency():
+    assert _loaded_after("import qiskit_calculquebec.mitigation") == []
+
+
+def test_readout_loads_no_optional_dependency():
+    code = "from qiskit_calculquebec.mitigation import ReadoutMitigation"
+    assert _loaded_after(code) == []
+
+
+@pytest.mark.parametrize(
+    "name, module",
+    [
+        ("ReadoutMitigation", "readout"),
+        ("ZNEMitigation", "zne"),
+        ("DDDMitigation", "ddd"),
+        ("PauliTwirlingMitigation", "pauli_twirling"),
+    ],
+)
+def test_lazy_attributes(name, module):
+    cls = getattr(mitigation, name)
+    assert cls.__module__ == f"qiskit_calculquebec.mitigation.{module}"
+    assert name in dir(mitigation)
+    assert name in mitigation.__all__
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        mitigation.NotATechnique
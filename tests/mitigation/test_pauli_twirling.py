@@ -7,12 +7,14 @@ from qiskit import QuantumCircuit
 
 from qiskit_calculquebec.mitigation.pauli_twirling import PauliTwirlingMitigation
 
-
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
+
 @pytest.fixture
 def backend():
-    return MagicMock()
+    mock = MagicMock()
+    mock.get_pass_manager.return_value.run.side_effect = lambda c: c
+    return mock
 
 
 @pytest.fixture
@@ -34,14 +36,13 @@ def mock_sampler_counts():
     sampler_mock = MagicMock()
     sampler_mock.run.return_value = job_mock
 
-    with patch("qiskit_calculquebec.mitigation.pauli_twirling.SamplerV2", return_value=sampler_mock), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.generate_preset_pass_manager") as pm_mock:
-        pm_mock.return_value.run.side_effect = lambda c: c
+    with patch("qiskit_ibm_runtime.SamplerV2", return_value=sampler_mock):
         yield sampler_mock
 
 
 # ── Constructor ───────────────────────────────────────────────────────────────
 
+
 def test_defaults(backend):
     pt = PauliTwirlingMitigation(backend)
     assert pt.num_variants == 10
@@ -56,9 +57,11 @@ def test_custom_params(backend):
 
 # ── Executor type dispatch ────────────────────────────────────────────────────
 
+
 def test_base_executor_no_annotation(backend):
     """Base executor must have no return annotation (FloatLike for mitiq)."""
     import inspect
+
     pt = PauliTwirlingMitigation(backend)
     executor = pt._make_base_executor()
     ann = inspect.getfullargspec(executor).annotations
@@ -68,6 +71,7 @@ def test_base_executor_no_annotation(backend):
 def test_pt_executor_no_annotation(backend):
     """PT executor must have no return annotation."""
     import inspect
+
     pt = PauliTwirlingMitigation(backend)
     executor = pt._make_pt_executor()
     ann = inspect.getfullargspec(executor).annotations
@@ -76,15 +80,18 @@ def test_pt_executor_no_annotation(backend):
 
 # ── run_unmitigated ───────────────────────────────────────────────────────────
 
+
 def test_run_unmitigated_returns_float(backend, circuit, mock_sampler_counts):
     pt = PauliTwirlingMitigation(backend, shots=1000)
     result = pt.run_unmitigated(circuit)
     assert isinstance(result, float)
     assert 0.0 <= result <= 1.0
+    backend.get_pass_manager.assert_called_with(optimization_level=0, use_cache=False)
 
 
 # ── run ───────────────────────────────────────────────────────────────────────
 
+
 def test_run_averages_variants(backend, circuit):
     """run() should average over num_variants executions."""
     call_count = {"n": 0}
@@ -93,8 +100,9 @@ def test_run_averages_variants(backend, circuit):
         call_count["n"] += 1
         return 0.9
 
-    with patch.object(PauliTwirlingMitigation, "_make_base_executor", return_value=fake_base_executor), \
-         patch("mitiq.pt.generate_pauli_twirl_variants") as mock_variants:
+    with patch.object(
+        PauliTwirlingMitigation, "_make_base_executor", return_value=fake_base_executor
+    ), patch("mitiq.pt.generate_pauli_twirl_variants") as mock_variants:
         mock_variants.return_value = [circuit] * 3
         pt = PauliTwirlingMitigation(backend, num_variants=3)
         result = pt.run(circuit)
@@ -114,8 +122,9 @@ def test_run_returns_mean(backend, circuit):
         idx["i"] += 1
         return val
 
-    with patch.object(PauliTwirlingMitigation, "_make_base_executor", return_value=fake_base_executor), \
-         patch("mitiq.pt.generate_pauli_twirl_variants") as mock_variants:
+    with patch.object(
+        PauliTwirlingMitigation, "_make_base_executor", return_value=fake_base_executor
+    ), patch("mitiq.pt.generate_pauli_twirl_variants") as mock_variants:
         mock_variants.return_value = [circuit] * 3
         pt = PauliTwirlingMitigation(backend, num_variants=3)
         result = pt.run(circuit)
@@ -125,17 +134,19 @@ def test_run_returns_mean(backend, circuit):
 
 # ── run_with_zne ──────────────────────────────────────────────────────────────
 
+
 def test_run_with_zne_uses_linear_factory_by_default(backend, circuit):
     from mitiq.zne.inference import LinearFactory
+
     captured = {}
 
     def fake_execute_with_zne(c, executor, **kwargs):
         captured["factory"] = kwargs.get("factory")
         return 0.9
 
-    with patch("mitiq.zne.execute_with_zne", side_effect=fake_execute_with_zne), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.generate_preset_pass_manager"), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.SamplerV2"):
+    with patch("mitiq.zne.execute_with_zne", side_effect=fake_execute_with_zne), patch(
+        "qiskit_ibm_runtime.SamplerV2"
+    ):
         pt = PauliTwirlingMitigation(backend)
         pt.run_with_zne(circuit)
 
@@ -144,6 +155,7 @@ def test_run_with_zne_uses_linear_factory_by_default(backend, circuit):
 
 def test_run_with_zne_uses_custom_factory(backend, circuit):
     from mitiq.zne.inference import RichardsonFactory
+
     factory = RichardsonFactory([1.0, 2.0, 3.0])
     captured = {}
 
@@ -151,9 +163,9 @@ def test_run_with_zne_uses_custom_factory(backend, circuit):
         captured["factory"] = kwargs.get("factory")
         return 0.9
 
-    with patch("mitiq.zne.execute_with_zne", side_effect=fake_execute_with_zne), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.generate_preset_pass_manager"), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.SamplerV2"):
+    with patch("mitiq.zne.execute_with_zne", side_effect=fake_execute_with_zne), patch(
+        "qiskit_ibm_runtime.SamplerV2"
+    ):
         pt = PauliTwirlingMitigation(backend)
         pt.run_with_zne(circuit, factory=factory)
 
@@ -168,9 +180,9 @@ def test_run_with_zne_strips_measurements(backend, circuit):
         captured["circuit"] = c
         return 0.9
 
-    with patch("mitiq.zne.execute_with_zne", side_effect=fake_execute_with_zne), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.generate_preset_pass_manager"), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.SamplerV2"):
+    with patch("mitiq.zne.execute_with_zne", side_effect=fake_execute_with_zne), patch(
+        "qiskit_ibm_runtime.SamplerV2"
+    ):
         pt = PauliTwirlingMitigation(backend)
         pt.run_with_zne(circuit)
 
@@ -178,9 +190,9 @@ def test_run_with_zne_strips_measurements(backend, circuit):
 
 
 def test_run_with_zne_returns_real_float(backend, circuit):
-    with patch("mitiq.zne.execute_with_zne", return_value=complex(0.88, -1e-17)), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.generate_preset_pass_manager"), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.SamplerV2"):
+    with patch("mitiq.zne.execute_with_zne", return_value=complex(0.88, -1e-17)), patch(
+        "qiskit_ibm_runtime.SamplerV2"
+    ):
         pt = PauliTwirlingMitigation(backend)
         result = pt.run_with_zne(circuit)
 
@@ -190,6 +202,7 @@ def test_run_with_zne_returns_real_float(backend, circuit):
 
 # ── run_variants ──────────────────────────────────────────────────────────────
 
+
 def test_run_variants_length(backend, circuit, mock_sampler_counts):
     with patch("mitiq.pt.generate_pauli_twirl_variants") as mock_variants:
         mock_variants.return_value = [circuit] * 5
@@ -202,6 +215,7 @@ def test_run_variants_length(backend, circuit, mock_sampler_counts):
 
 # ── REM integration ───────────────────────────────────────────────────────────
 
+
 def test_run_raises_rem_without_qubits(backend, circuit, mock_sampler_counts):
     rem = MagicMock()
     rem.method = "m3"
@@ -214,6 +228,7 @@ def test_run_raises_rem_without_qubits(backend, circuit, mock_sampler_counts):
 
 # ── Count key normalization ───────────────────────────────────────────────────
 
+
 def test_count_key_normalization(backend):
     """Keys with spaces ('0 0') should be normalized to '00'."""
     counts = {"0 0": 900, "1 1": 100}
@@ -228,9 +243,7 @@ def test_count_key_normalization(backend):
     qc.h(0)
     qc.measure_all()
 
-    with patch("qiskit_calculquebec.mitigation.pauli_twirling.SamplerV2", return_value=sampler_mock), \
-         patch("qiskit_calculquebec.mitigation.pauli_twirling.generate_preset_pass_manager") as pm_mock:
-        pm_mock.return_value.run.side_effect = lambda c: c
+    with patch("qiskit_ibm_runtime.SamplerV2", return_value=sampler_mock):
         pt = PauliTwirlingMitigation(backend, shots=1000)
         executor = pt._make_base_executor()
         result = executor(qc)
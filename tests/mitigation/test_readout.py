@@ -2,13 +2,17 @@
 
 import numpy as np
 import pytest
-from unittest.mock import MagicMock, patch
-
-from qiskit_calculquebec.mitigation.readout import ReadoutMitigation, _faulty_qubit_checker
+from unittest.mock import MagicMock
 
+from qiskit_calculquebec.backends.targets.calibration import CalibrationTable
+from qiskit_calculquebec.mitigation.readout import (
+    ReadoutMitigation,
+    _faulty_qubit_checker,
+)
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
+
 @pytest.fixture
 def backend():
     mock = MagicMock()
@@ -20,27 +24,32 @@ def backend():
 @pytest.fixture
 def rem_matrix(backend):
     rem = ReadoutMitigation(backend, method="matrix")
-    rem.cals_from_matrices([
-        np.array([[0.97, 0.05], [0.03, 0.95]]),
-        np.array([[0.96, 0.06], [0.04, 0.94]]),
-        np.array([[0.98, 0.04], [0.02, 0.96]]),
-    ])
+    rem.cals_from_matrices(
+        [
+            np.array([[0.97, 0.05], [0.03, 0.95]]),
+            np.array([[0.96, 0.06], [0.04, 0.94]]),
+            np.array([[0.98, 0.04], [0.02, 0.96]]),
+        ]
+    )
     return rem
 
 
 @pytest.fixture
 def rem_m3(backend):
     rem = ReadoutMitigation(backend, method="m3")
-    rem.cals_from_matrices([
-        np.array([[0.97, 0.05], [0.03, 0.95]]),
-        np.array([[0.96, 0.06], [0.04, 0.94]]),
-        np.array([[0.98, 0.04], [0.02, 0.96]]),
-    ])
+    rem.cals_from_matrices(
+        [
+            np.array([[0.97, 0.05], [0.03, 0.95]]),
+            np.array([[0.96, 0.06], [0.04, 0.94]]),
+            np.array([[0.98, 0.04], [0.02, 0.96]]),
+        ]
+    )
     return rem
 
 
 # ── Constructor ───────────────────────────────────────────────────────────────
 
+
 def test_invalid_method(backend):
     with pytest.raises(ValueError, match="method must be"):
         ReadoutMitigation(backend, method="invalid")
@@ -53,6 +62,7 @@ def test_valid_methods(backend):
 
 # ── Calibration ───────────────────────────────────────────────────────────────
 
+
 def test_cals_from_matrices_wrong_length(backend):
     rem = ReadoutMitigation(backend, method="matrix")
     with pytest.raises(ValueError, match=r"List length"):
@@ -70,14 +80,23 @@ def test_cals_from_system(backend):
     benchmark_data = {
         "resultsPerDevice": {
             "qubits": {
-                "0": {"parallelReadoutState0Fidelity": 0.97, "parallelReadoutState1Fidelity": 0.95},
-                "1": {"parallelReadoutState0Fidelity": 0.96, "parallelReadoutState1Fidelity": 0.94},
-                "2": {"parallelReadoutState0Fidelity": 0.98, "parallelReadoutState1Fidelity": 0.96},
+                "0": {
+                    "parallelReadoutState0Fidelity": 0.97,
+                    "parallelReadoutState1Fidelity": 0.95,
+                },
+                "1": {
+                    "parallelReadoutState0Fidelity": 0.96,
+                    "parallelReadoutState1Fidelity": 0.94,
+                },
+                "2": {
+                    "parallelReadoutState0Fidelity": 0.98,
+                    "parallelReadoutState1Fidelity": 0.96,
+                },
             }
         }
     }
-    with patch("qiskit_calculquebec.API.adapter.ApiAdapter.get_benchmark", return_value=benchmark_data):
-        rem.cals_from_system()
+    backend.target.calibration = CalibrationTable.from_benchmark(benchmark_data, 3)
+    rem.cals_from_system()
     assert rem.single_qubit_cals is not None
     assert rem.cal_timestamp is not None
     assert np.isclose(rem.single_qubit_cals[0][0, 0], 0.97)
@@ -86,6 +105,7 @@ def test_cals_from_system(backend):
 
 # ── Readout fidelity ──────────────────────────────────────────────────────────
 
+
 def test_readout_fidelity_not_calibrated(backend):
     rem = ReadoutMitigation(backend, method="matrix")
     with pytest.raises(RuntimeError, match="not calibrated"):
@@ -103,6 +123,7 @@ def test_readout_fidelity_values(rem_matrix):
 
 # ── apply_correction (matrix) ─────────────────────────────────────────────────
 
+
 def test_apply_correction_not_calibrated(backend):
     rem = ReadoutMitigation(backend, method="matrix")
     with pytest.raises(RuntimeError, match="not calibrated"):
@@ -111,11 +132,13 @@ def test_apply_correction_not_calibrated(backend):
 
 def test_apply_correction_missing_qubit(backend):
     rem = ReadoutMitigation(backend, method="matrix")
-    rem.cals_from_matrices([
-        np.array([[0.97, 0.05], [0.03, 0.95]]),
-        None,  # qubit 1 not calibrated
-        np.array([[0.98, 0.04], [0.02, 0.96]]),
-    ])
+    rem.cals_from_matrices(
+        [
+            np.array([[0.97, 0.05], [0.03, 0.95]]),
+            None,  # qubit 1 not calibrated
+            np.array([[0.98, 0.04], [0.02, 0.96]]),
+        ]
+    )
     with pytest.raises(RuntimeError, match="Uncalibrated qubits"):
         rem.apply_correction({"000": 500}, qubits=[0, 1, 2])
 
@@ -130,7 +153,15 @@ def test_apply_correction_matrix_returns_dict(rem_matrix):
 
 def test_apply_correction_matrix_improves_ghz(rem_matrix):
     """Correction should push 000 and 111 closer to equal counts."""
-    counts = {"000": 420, "111": 420, "001": 40, "010": 30, "100": 40, "011": 30, "101": 20}
+    counts = {
+        "000": 420,
+        "111": 420,
+        "001": 40,
+        "010": 30,
+        "100": 40,
+        "011": 30,
+        "101": 20,
+    }
     corrected = rem_matrix.apply_correction(counts, qubits=[0, 1, 2])
     total = sum(corrected.values())
     assert total > 0
@@ -143,6 +174,7 @@ def test_apply_correction_matrix_improves_ghz(rem_matrix):
 
 # ── confusion matrix helpers ──────────────────────────────────────────────────
 
+
 def test_get_confusion_matrix_shape(rem_matrix):
     mat = rem_matrix.get_confusion_matrix([0, 1, 2])
     assert mat.shape == (8, 8)
@@ -161,6 +193,7 @@ def test_get_confusion_matrix_not_calibrated(backend):
 
 # ── faulty qubit detection ────────────────────────────────────────────────────
 
+
 def test_faulty_qubit_checker_normal():
     cals = [
         np.array([[0.97, 0.05], [0.03, 0.95]]),  # P(0|1)=0.05 < P(0|0)=0.97 → OK